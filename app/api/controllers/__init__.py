@@ -1,5 +1,11 @@
+from app.api.controllers.catalog import CatalogController
 from app.api.controllers.control import ControlController
 from app.api.controllers.frameworks import FrameworkController
 from app.api.controllers.organizations import OrganizationController
 
-__all__ = ["ControlController", "FrameworkController", "OrganizationController"]
+__all__ = [
+    "CatalogController",
+    "ControlController",
+    "FrameworkController",
+    "OrganizationController",
+]
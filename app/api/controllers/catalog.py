@@ -0,0 +1,35 @@
+"""Catalog Controller."""
+
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.base import BaseController
+from app.helpers.catalog import CatalogSnapshot, catalog_cache
+from app.schemas.catalog import CatalogVersionResponse
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogController(BaseController):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+
+    async def get_catalog_version(self) -> CatalogVersionResponse:
+        """Describe the catalog snapshot served by this worker."""
+        return self._describe(await catalog_cache.get(self.db))
+
+    async def reload_catalog(self) -> CatalogVersionResponse:
+        """Reload the catalog snapshot of this worker from the database."""
+        logger.info("Reloading catalog snapshot")
+        return self._describe(await catalog_cache.reload(self.db))
+
+    @staticmethod
+    def _describe(catalog: CatalogSnapshot) -> CatalogVersionResponse:
+        return CatalogVersionResponse(
+            version=catalog.version,
+            loaded_at=catalog.loaded_at,
+            frameworks=len(catalog.frameworks),
+            controls=len(catalog.controls),
+            framework_controls=len(catalog.framework_control_by_id),
+        )
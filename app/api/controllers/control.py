@@ -1,55 +1,113 @@
 """Control Controller."""
 
 import logging
+from uuid import UUID
 
-from fastapi import HTTPException
-from sqlalchemy import select
+from fastapi import HTTPException, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.base import BaseController
-from app.models import Control
-from app.schemas.control import ControlResponse
+from app.helpers.catalog import CatalogSnapshot, catalog_json_response, get_catalog
+from app.helpers.http import ConditionalRequest, RenderedJSON
+from app.helpers.pagination import Page, PageRequest, next_cursor_headers, page_at, page_start
+from app.helpers.search import search_controls
+from app.models import ControlCategory, ControlType
+from app.schemas.control import ControlResponse, ControlSearchResult
 
 logger = logging.getLogger(__name__)
 
+control_list_adapter = TypeAdapter(list[ControlResponse])
+
 
 class ControlController(BaseController):
     def __init__(self, db: AsyncSession):
         super().__init__(db)
 
     async def list_controls(
-        self, category: str | None, control_type: str | None
-    ) -> list[ControlResponse]:
+        self,
+        category: ControlCategory | None,
+        control_type: ControlType | None,
+        page: PageRequest,
+        conditional: ConditionalRequest,
+    ) -> Response:
         """
-        List all controls in the reusable control library.
+        List the controls of the reusable control library, one page at a time.
 
-        Controls can be filtered by category or type.
+        Controls can be filtered by category or type. Each page is rendered once
+        per catalog version, filter combination, start position and page size.
         """
         logger.info(f"Listing controls with filters: category={category}, type={control_type}")
 
-        query = select(Control)
-
-        if category:
-            query = query.where(Control.category == category)
-        if control_type:
-            query = query.where(Control.control_type == control_type)
-
-        query = query.order_by(Control.code)
-
-        result = await self.db.execute(query)
-        controls = result.scalars().all()
+        catalog = await get_catalog(self.db)
+        filters = (category, control_type)
+        controls = catalog.memoize(
+            ("filter_controls", *filters),
+            lambda: self._filter_controls(catalog, category, control_type),
+        )
+        start = page_start(controls, page, lambda c: c.id)
+
+        def render() -> tuple[RenderedJSON, dict[str, str]]:
+            result = page_at(controls, start, page.limit, lambda c: c.id)
+            return (
+                RenderedJSON.from_body(control_list_adapter.dump_json(result.items)),
+                next_cursor_headers(result),
+            )
+
+        rendered, headers = catalog.memoize(("list_controls", *filters, start, page.limit), render)
+        return catalog_json_response(catalog, rendered, conditional, headers)
+
+    @staticmethod
+    def _filter_controls(
+        catalog: CatalogSnapshot,
+        category: ControlCategory | None,
+        control_type: ControlType | None,
+    ) -> list[ControlResponse]:
+        controls = catalog.controls
+        if category is not None:
+            controls = [c for c in controls if c.category == category]
+        if control_type is not None:
+            controls = [c for c in controls if c.control_type == control_type]
 
         return [ControlResponse.model_validate(c) for c in controls]
 
-    async def get_control(self, code: str) -> ControlResponse:
+    async def get_control(self, code: str, conditional: ConditionalRequest) -> Response:
         """Get a specific control by its code."""
         logger.info(f"Getting control {code}")
 
-        result = await self.db.execute(select(Control).where(Control.code == code))
-        control = result.scalar_one_or_none()
+        catalog = await get_catalog(self.db)
+        control = catalog.control_by_code.get(code)
 
         if not control:
             logger.warning(f"Control {code} not found")
             raise HTTPException(status_code=404, detail="Control not found")
 
-        return ControlResponse.model_validate(control)
+        rendered = catalog.memoize(
+            ("get_control", code),
+            lambda: RenderedJSON.from_body(
+                ControlResponse.model_validate(control).model_dump_json().encode()
+            ),
+        )
+        return catalog_json_response(catalog, rendered, conditional)
+
+    async def search_controls(
+        self,
+        q: str,
+        framework_id: UUID | None,
+        prefix: bool,
+        limit: int,
+        cursor: str | None,
+    ) -> Page[ControlSearchResult]:
+        """
+        Full-text search of the control library, best match first.
+
+        Optionally restricted to the controls of one framework.
+        """
+        logger.info(f"Searching controls: q={q!r}, framework_id={framework_id}")
+
+        if framework_id is not None:
+            catalog = await get_catalog(self.db)
+            if framework_id not in catalog.framework_by_id:
+                raise HTTPException(status_code=404, detail="Framework not found")
+
+        return await search_controls(self.db, q, framework_id, prefix, limit, cursor)
@@ -1,88 +1,146 @@
 """Framework API routes."""
 
 import logging
+from uuid import UUID
 
-from fastapi import HTTPException
-from sqlalchemy import select
+from fastapi import HTTPException, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.base import BaseController
-from app.models import Framework, FrameworkControl
-from app.schemas import ControlInFramework, FrameworkResponse
+from app.helpers.catalog import CatalogSnapshot, catalog_json_response, get_catalog
+from app.helpers.framework_diff import check_diffable, diff_framework_versions
+from app.helpers.http import ConditionalRequest, RenderedJSON
+from app.helpers.overlap import get_overlap_index
+from app.helpers.pagination import PageRequest, next_cursor_headers, page_at, page_start
+from app.models import FrameworkStatus
+from app.schemas import (
+    ControlCrosswalk,
+    ControlInFramework,
+    CrosswalkFramework,
+    FrameworkDiffResponse,
+    FrameworkOverlapResponse,
+    FrameworkResponse,
+)
 
 logger = logging.getLogger(__name__)
 
+framework_list_adapter = TypeAdapter(list[FrameworkResponse])
+control_in_framework_list_adapter = TypeAdapter(list[ControlInFramework])
+control_crosswalk_list_adapter = TypeAdapter(list[ControlCrosswalk])
+
 
 class FrameworkController(BaseController):
     def __init__(self, db: AsyncSession):
         super().__init__(db)
 
     async def list_frameworks(
-        self, code: str | None, status: str | None
-    ) -> list[FrameworkResponse]:
+        self,
+        code: str | None,
+        status: FrameworkStatus | None,
+        page: PageRequest,
+        conditional: ConditionalRequest,
+    ) -> Response:
         """
-        List all frameworks.
+        List all frameworks, one page at a time.
 
         Optionally filter by code (e.g., 'soc2') to get all versions of a framework.
+        Each page is rendered once per catalog version, filter combination, start
+        position and page size; unknown codes are not memoized.
         """
         logger.info(f"Listing frameworks with filters: code={code}, status={status}")
 
-        query = select(Framework)
+        catalog = await get_catalog(self.db)
+        code = code or None
+        filters = (code, status)
+        if code is None or code in catalog.frameworks_by_code:
+            frameworks = catalog.memoize(
+                ("filter_frameworks", *filters),
+                lambda: self._filter_frameworks(catalog, code, status),
+            )
+        else:
+            frameworks = []
+        start = page_start(frameworks, page, lambda f: f.id)
 
-        if code:
-            query = query.where(Framework.code == code)
-        if status:
-            query = query.where(Framework.status == status)
+        def render() -> tuple[RenderedJSON, dict[str, str]]:
+            result = page_at(frameworks, start, page.limit, lambda f: f.id)
+            return (
+                RenderedJSON.from_body(framework_list_adapter.dump_json(result.items)),
+                next_cursor_headers(result),
+            )
 
-        query = query.order_by(Framework.code, Framework.version)
+        if frameworks:
+            rendered, headers = catalog.memoize(
+                ("list_frameworks", *filters, start, page.limit), render
+            )
+        else:
+            rendered, headers = render()
+        return catalog_json_response(catalog, rendered, conditional, headers)
 
-        result = await self.db.execute(query)
-        frameworks = result.scalars().all()
+    @staticmethod
+    def _filter_frameworks(
+        catalog: CatalogSnapshot, code: str | None, status: FrameworkStatus | None
+    ) -> list[FrameworkResponse]:
+        frameworks = catalog.frameworks_by_code.get(code, ()) if code else catalog.frameworks
+        if status is not None:
+            frameworks = [f for f in frameworks if f.status == status]
 
         return [FrameworkResponse.model_validate(f) for f in frameworks]
 
-    async def get_framework(self, framework_id: int) -> FrameworkResponse:
+    async def get_framework(self, framework_id: UUID, conditional: ConditionalRequest) -> Response:
         """Get a specific framework by ID."""
         logger.info(f"Getting framework {framework_id}")
 
-        result = await self.db.execute(select(Framework).where(Framework.id == framework_id))
-        framework = result.scalar_one_or_none()
+        catalog = await get_catalog(self.db)
+        framework = catalog.framework_by_id.get(framework_id)
 
         if not framework:
             logger.warning(f"Framework {framework_id} not found")
             raise HTTPException(status_code=404, detail="Framework not found")
 
-        return FrameworkResponse.model_validate(framework)
+        rendered = catalog.memoize(
+            ("get_framework", framework_id),
+            lambda: RenderedJSON.from_body(
+                FrameworkResponse.model_validate(framework).model_dump_json().encode()
+            ),
+        )
+        return catalog_json_response(catalog, rendered, conditional)
 
-    async def list_framework_controls(self, framework_id: int) -> list[ControlInFramework]:
+    async def list_framework_controls(
+        self, framework_id: UUID, conditional: ConditionalRequest
+    ) -> Response:
         """
         List all controls for a specific framework.
 
         Returns controls with their framework-specific codes (e.g., CC6.1 for SOC 2).
+        The JSON body is rendered once per catalog version and framework.
         """
         logger.info(f"Listing controls for framework {framework_id}")
 
+        catalog = await get_catalog(self.db)
+
         # First verify framework exists
-        framework_result = await self.db.execute(
-            select(Framework).where(Framework.id == framework_id)
-        )
-        if not framework_result.scalar_one_or_none():
+        if framework_id not in catalog.framework_by_id:
             raise HTTPException(status_code=404, detail="Framework not found")
 
-        # Get framework controls with related control data
-        result = await self.db.execute(
-            select(FrameworkControl)
-            .options(selectinload(FrameworkControl.control))
-            .where(FrameworkControl.framework_id == framework_id)
-            .order_by(FrameworkControl.framework_control_code)
+        rendered = catalog.memoize(
+            ("list_framework_controls", framework_id),
+            lambda: RenderedJSON.from_body(
+                control_in_framework_list_adapter.dump_json(
+                    self._framework_controls(catalog, framework_id)
+                )
+            ),
         )
-        framework_controls = result.scalars().all()
+        return catalog_json_response(catalog, rendered, conditional)
 
+    @staticmethod
+    def _framework_controls(
+        catalog: CatalogSnapshot, framework_id: UUID
+    ) -> list[ControlInFramework]:
         # Build response with control details
         controls = []
-        for fc in framework_controls:
-            control = fc.control
+        for fc in catalog.controls_for_framework(framework_id):
+            control = catalog.control_by_id[fc.control_id]
             controls.append(
                 ControlInFramework(
                     id=control.id,
@@ -97,3 +155,107 @@ class FrameworkController(BaseController):
             )
 
         return controls
+
+    async def diff_framework_versions(
+        self, framework_id: UUID, other_framework_id: UUID, conditional: ConditionalRequest
+    ) -> Response:
+        """
+        Diff two versions of a framework.
+
+        The diff is computed with one query and its JSON body rendered once per
+        catalog version and pair of frameworks.
+        """
+        logger.info(f"Diffing framework {framework_id} to {other_framework_id}")
+
+        catalog = await get_catalog(self.db)
+        source, target = check_diffable(catalog, framework_id, other_framework_id)
+
+        async def render() -> RenderedJSON:
+            diff = await diff_framework_versions(self.db, source.id, target.id)
+            return RenderedJSON.from_body(
+                FrameworkDiffResponse(
+                    from_framework=FrameworkResponse.model_validate(source),
+                    to_framework=FrameworkResponse.model_validate(target),
+                    added=diff.added,
+                    removed=diff.removed,
+                    remapped=diff.remapped,
+                    requirement_changed=diff.requirement_changed,
+                )
+                .model_dump_json()
+                .encode()
+            )
+
+        rendered = await catalog.memoize_async(
+            ("diff_framework_versions", source.id, target.id), render
+        )
+        return catalog_json_response(catalog, rendered, conditional)
+
+    async def get_framework_overlap(self, conditional: ConditionalRequest) -> Response:
+        """
+        Get the overlap matrix of all frameworks.
+
+        Built from the catalog's overlap index once per catalog version.
+        """
+        logger.info("Getting framework overlap matrix")
+
+        catalog = await get_catalog(self.db)
+        rendered = catalog.memoize(
+            "get_framework_overlap",
+            lambda: RenderedJSON.from_body(
+                self._framework_overlap(catalog).model_dump_json().encode()
+            ),
+        )
+        return catalog_json_response(catalog, rendered, conditional)
+
+    @staticmethod
+    def _framework_overlap(catalog: CatalogSnapshot) -> FrameworkOverlapResponse:
+        index = get_overlap_index(catalog)
+        return FrameworkOverlapResponse(
+            frameworks=[FrameworkResponse.model_validate(f) for f in index.frameworks],
+            control_counts=index.control_counts,
+            shared_controls=index.shared,
+            jaccard=index.jaccard,
+        )
+
+    async def get_control_crosswalk(self, conditional: ConditionalRequest) -> Response:
+        """
+        List every control with the framework requirements it satisfies.
+
+        Built from the catalog's overlap index once per catalog version.
+        """
+        logger.info("Getting control crosswalk")
+
+        catalog = await get_catalog(self.db)
+        rendered = catalog.memoize(
+            "get_control_crosswalk",
+            lambda: RenderedJSON.from_body(
+                control_crosswalk_list_adapter.dump_json(self._control_crosswalk(catalog))
+            ),
+        )
+        return catalog_json_response(catalog, rendered, conditional)
+
+    @staticmethod
+    def _control_crosswalk(catalog: CatalogSnapshot) -> list[ControlCrosswalk]:
+        index = get_overlap_index(catalog)
+        crosswalk = []
+        for control in catalog.controls:
+            codes = index.framework_control_codes.get(control.id, {})
+            crosswalk.append(
+                ControlCrosswalk(
+                    control_id=control.id,
+                    control_code=control.code,
+                    control_title=control.title,
+                    frameworks=[
+                        CrosswalkFramework(
+                            framework_id=f.id,
+                            code=f.code,
+                            version=f.version,
+                            framework_control_code=codes[f.id],
+                        )
+                        for f in index.frameworks
+                        if f.id in codes
+                    ],
+                )
+            )
+
+        return crosswalk
@@ -1,38 +1,82 @@
 """Organization API routes."""
 
 import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import AsyncIterator
+from uuid import UUID
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.base import BaseController
-from app.helpers import calculate_readiness, get_org_framework_or_404, get_org_or_404
+from app.helpers import (
+    calculate_readiness,
+    get_catalog,
+    get_org_framework_or_404,
+    get_org_or_404,
+)
+from app.helpers.adoption import adopt_frameworks, check_adoptable, shared_controls
+from app.helpers.audit import record_status_change
+from app.helpers.evidence_ingest import ingest_evidence, ndjson_lines
+from app.helpers.evidence_links import link_evidence
+from app.helpers.freshness import adopted_frameworks_state, evidence_state, org_controls_state
+from app.helpers.http import ConditionalRequest
+from app.helpers.org_controls import (
+    batch_update_org_controls,
+    org_control,
+    org_control_response,
+)
+from app.helpers.pagination import Page, PageRequest, decode_cursor, paginate
+from app.helpers.readiness import shift_readiness_counter
+from app.helpers.readiness_history import readiness_history
+from app.helpers.search import search_evidence, search_org_control_notes, search_organizations
+from app.helpers.streaming import StreamRequest, stream_json
+from app.helpers.version_migration import check_version_target, migrate_org_framework
 from app.models import (
-    ControlEvidence,
     Evidence,
-    Framework,
     FrameworkControl,
     Organization,
     OrgControl,
     OrgFramework,
 )
 from app.schemas import (
+    AdoptionResult,
+    BulkAdoptionCreate,
+    BulkAdoptionResponse,
     ControlEvidenceCreate,
     EvidenceCreate,
+    EvidenceIngestResponse,
+    EvidenceLink,
+    EvidenceLinkBatch,
+    EvidenceLinkBatchResponse,
     EvidenceResponse,
+    EvidenceSearchResult,
+    FrameworkMigrationCreate,
+    FrameworkMigrationResponse,
+    HistoryInterval,
+    MigratedControl,
     OrganizationCreate,
     OrganizationResponse,
+    OrganizationSearchResult,
+    OrgControlBatchItem,
+    OrgControlBatchUpdate,
     OrgControlResponse,
+    OrgControlSearchResult,
     OrgControlUpdate,
     OrgFrameworkCreate,
     OrgFrameworkResponse,
+    ReadinessHistoryResponse,
     ReadinessResponse,
+    SharedControl,
 )
 
 logger = logging.getLogger(__name__)
 
+# Window returned by the readiness history endpoint when no start is given
+DEFAULT_HISTORY_DAYS = 90
+
 
 class OrganizationController(BaseController):
     def __init__(self, db: AsyncSession):
@@ -63,6 +107,13 @@ class OrganizationController(BaseController):
         org = await get_org_or_404(self.db, slug)
         return OrganizationResponse.model_validate(org)
 
+    async def search_organizations(
+        self, q: str, limit: int, cursor: str | None
+    ) -> Page[OrganizationSearchResult]:
+        """Fuzzy search of organizations by name or slug, best match first."""
+        logger.info(f"Searching organizations: q={q!r}")
+        return await search_organizations(self.db, q, limit, cursor)
+
     async def adopt_framework(self, slug: str, data: OrgFrameworkCreate) -> OrgFrameworkResponse:
         """
         Adopt a framework for the organization.
@@ -71,124 +122,202 @@ class OrganizationController(BaseController):
         """
         logger.info(f"Organization {slug} adopting framework {data.framework_id}")
 
-        org = await get_org_or_404(self.db, slug)
+        organization_id = await check_adoptable(self.db, slug, [data.framework_id])
+        (adoption,) = await adopt_frameworks(self.db, organization_id, [data.framework_id])
 
-        # Check framework exists
-        framework_result = await self.db.execute(
-            select(Framework).where(Framework.id == data.framework_id)
+        logger.info(
+            f"Organization {slug} adopted framework {data.framework_id} "
+            f"with {adoption.control_count} controls"
         )
-        framework = framework_result.scalar_one_or_none()
-        if not framework:
-            raise HTTPException(status_code=404, detail="Framework not found")
+        return OrgFrameworkResponse.model_validate(adoption.org_framework)
 
-        # Check if already adopted
-        existing = await self.db.execute(
-            select(OrgFramework)
-            .where(OrgFramework.organization_id == org.id)
-            .where(OrgFramework.framework_id == data.framework_id)
-        )
-        if existing.scalar_one_or_none():
-            raise HTTPException(status_code=400, detail="Framework already adopted")
+    async def adopt_frameworks_bulk(
+        self, slug: str, data: BulkAdoptionCreate
+    ) -> BulkAdoptionResponse:
+        """
+        Adopt several frameworks in one transaction.
 
-        # Create OrgFramework
-        org_framework = OrgFramework(
-            organization_id=org.id,
-            framework_id=data.framework_id,
-        )
-        self.db.add(org_framework)
-        await self.db.flush()
+        The request is validated with one query and all OrgFrameworks and
+        OrgControls are created with set-based inserts. Controls mapped by more
+        than one of the frameworks are reported as shared.
+        """
+        framework_ids = list(dict.fromkeys(data.framework_ids))
+        logger.info(f"Organization {slug} adopting {len(framework_ids)} frameworks")
 
-        # Get all controls for this framework and create OrgControl entries
-        fc_result = await self.db.execute(
-            select(FrameworkControl).where(FrameworkControl.framework_id == data.framework_id)
-        )
-        framework_controls = fc_result.scalars().all()
+        organization_id = await check_adoptable(self.db, slug, framework_ids)
+        adoptions = await adopt_frameworks(self.db, organization_id, framework_ids)
 
-        for fc in framework_controls:
-            org_control = OrgControl(
-                org_framework_id=org_framework.id,
-                framework_control_id=fc.id,
-            )
-            self.db.add(org_control)
+        catalog = await get_catalog(self.db)
+        shared = shared_controls(catalog, framework_ids)
 
-        await self.db.flush()
-        await self.db.refresh(org_framework)
+        logger.info(
+            f"Organization {slug} adopted {len(adoptions)} frameworks "
+            f"({sum(a.control_count for a in adoptions)} controls, {len(shared)} shared)"
+        )
+        return BulkAdoptionResponse(
+            adopted=[
+                AdoptionResult(
+                    **OrgFrameworkResponse.model_validate(a.org_framework).model_dump(),
+                    control_count=a.control_count,
+                )
+                for a in adoptions
+            ],
+            shared_controls=[
+                SharedControl(
+                    control_id=control_id,
+                    control_code=catalog.control_by_id[control_id].code,
+                    framework_ids=list(frameworks),
+                )
+                for control_id, frameworks in shared.items()
+            ],
+        )
 
-        logger.info(f"Organization {slug} adopted framework {framework.code} v{framework.version}")
-        return OrgFrameworkResponse.model_validate(org_framework)
+    async def migrate_framework_version(
+        self, slug: str, framework_id: UUID, data: FrameworkMigrationCreate
+    ) -> FrameworkMigrationResponse:
+        """
+        Migrate an adopted framework to another version of the same framework.
 
-    async def list_adopted_frameworks(self, slug: str) -> list[OrgFrameworkResponse]:
-        """List all frameworks adopted by the organization."""
-        logger.info(f"Listing adopted frameworks for {slug}")
+        A new OrgFramework is created for the target version. Control status,
+        due dates, notes and evidence links are carried over for controls
+        present in both versions; the previous adoption is left untouched.
+        """
+        logger.info(f"Migrating {slug} framework {framework_id} to {data.target_framework_id}")
 
         org = await get_org_or_404(self.db, slug)
+        source = await get_org_framework_or_404(self.db, org, framework_id)
+        catalog = await get_catalog(self.db)
+        check_version_target(catalog, framework_id, data.target_framework_id)
+        await check_adoptable(self.db, slug, [data.target_framework_id])
+
+        migration = await migrate_org_framework(self.db, catalog, source, data.target_framework_id)
+
+        def migrated(fc) -> MigratedControl:
+            return MigratedControl(
+                control_id=fc.control_id,
+                control_code=catalog.control_by_id[fc.control_id].code,
+                framework_control_code=fc.framework_control_code,
+            )
 
-        result = await self.db.execute(
-            select(OrgFramework)
-            .where(OrgFramework.organization_id == org.id)
-            .order_by(OrgFramework.adopted_at)
+        return FrameworkMigrationResponse(
+            org_framework=OrgFrameworkResponse.model_validate(migration.org_framework),
+            carried_over=migration.carried_over,
+            evidence_links=migration.evidence_links,
+            added=[migrated(fc) for fc in migration.added],
+            removed=[migrated(fc) for fc in migration.removed],
         )
-        org_frameworks = result.scalars().all()
 
-        return [OrgFrameworkResponse.model_validate(of) for of in org_frameworks]
+    async def list_adopted_frameworks(
+        self, slug: str, page: PageRequest, conditional: ConditionalRequest
+    ) -> list[OrgFrameworkResponse] | Response:
+        """List the frameworks adopted by the organization, in adoption order."""
+        logger.info(f"Listing adopted frameworks for {slug}")
+
+        state = await adopted_frameworks_state(self.db, slug)
+        if state:
+            state = state.varied(page.limit, page.cursor)
+            if conditional.is_fresh(state):
+                return conditional.not_modified(state)
+
+        org = await get_org_or_404(self.db, slug)
 
-    async def list_org_controls(self, slug: str, framework_id: int) -> list[OrgControlResponse]:
-        """List all controls for an adopted framework."""
+        # UUIDv7 ids follow adoption order; ix_orgframework_organization_id_id
+        stmt = select(OrgFramework).where(OrgFramework.organization_id == org.id)
+        if page.cursor is not None:
+            (after_id,) = decode_cursor(page.cursor, UUID)
+            stmt = stmt.where(OrgFramework.id > after_id)
+        result = await self.db.scalars(stmt.order_by(OrgFramework.id).limit(page.limit + 1))
+        org_frameworks = paginate(result.all(), page.limit, key=lambda of: (of.id,))
+
+        conditional.apply(state)
+        page.apply(org_frameworks)
+        return [OrgFrameworkResponse.model_validate(of) for of in org_frameworks.items]
+
+    async def list_org_controls(
+        self,
+        slug: str,
+        framework_id: UUID,
+        page: PageRequest,
+        stream: StreamRequest,
+        conditional: ConditionalRequest,
+    ) -> list[OrgControlResponse] | Response:
+        """
+        List the controls of an adopted framework, ordered by id.
+
+        Returns one page, or with `stream` every row from the cursor on.
+        """
         logger.info(f"Listing controls for {slug} framework {framework_id}")
 
+        catalog = await get_catalog(self.db)
+        state = await org_controls_state(self.db, slug, framework_id, catalog.version)
+        if state:
+            state = state.varied(page.limit, page.cursor, stream)
+            if conditional.is_fresh(state):
+                return conditional.not_modified(state)
+
         org = await get_org_or_404(self.db, slug)
         org_framework = await get_org_framework_or_404(self.db, org, framework_id)
 
-        # Get org controls with related data
-        result = await self.db.execute(
-            select(OrgControl)
-            .options(
-                selectinload(OrgControl.framework_control).selectinload(FrameworkControl.control),
-                selectinload(OrgControl.control_evidence),
-            )
-            .where(OrgControl.org_framework_id == org_framework.id)
-        )
-        org_controls = result.scalars().all()
-
-        # Build response
-        controls = []
-        for oc in org_controls:
-            fc = oc.framework_control
-            control = fc.control
-            controls.append(
-                OrgControlResponse(
-                    id=oc.id,
-                    org_framework_id=oc.org_framework_id,
-                    framework_control_id=oc.framework_control_id,
-                    framework_control_code=fc.framework_control_code,
-                    control_code=control.code,
-                    control_title=control.title,
-                    status=oc.status,
-                    due_date=oc.due_date,
-                    notes=oc.notes,
-                    evidence_count=len(oc.control_evidence),
-                )
+        # Codes and titles come from the catalog; ix_orgcontrol_org_framework_id_id
+        stmt = select(
+            org_control.c.id,
+            org_control.c.org_framework_id,
+            org_control.c.framework_control_id,
+            org_control.c.status,
+            org_control.c.due_date,
+            org_control.c.notes,
+            org_control.c.evidence_count,
+        ).where(org_control.c.org_framework_id == org_framework.id)
+        if page.cursor is not None:
+            (after_id,) = decode_cursor(page.cursor, UUID)
+            stmt = stmt.where(org_control.c.id > after_id)
+        stmt = stmt.order_by(org_control.c.id)
+
+        if stream.enabled:
+            return stream_json(
+                stmt,
+                lambda row: org_control_response(catalog, row),
+                stream,
+                headers=state.headers if state else None,
             )
 
-        return controls
+        result = await self.db.execute(stmt.limit(page.limit + 1))
+        rows = paginate(result.all(), page.limit, key=lambda row: (row.id,))
+
+        conditional.apply(state)
+        page.apply(rows)
+        return [org_control_response(catalog, row) for row in rows.items]
 
     async def update_org_control(
-        self, slug: str, control_id: int, data: OrgControlUpdate
+        self, slug: str, control_id: int, data: OrgControlUpdate, propagate: bool = False
     ) -> OrgControlResponse:
-        """Update the status or details of an organization's control."""
-        logger.info(f"Updating control {control_id} for {slug}")
+        """
+        Update the status or details of an organization's control.
+
+        With `propagate`, the change is also applied to the organization's other
+        OrgControls backed by the same lookup control, in one set-based UPDATE.
+        """
+        logger.info(f"Updating control {control_id} for {slug} (propagate={propagate})")
 
         org = await get_org_or_404(self.db, slug)
 
-        # Get the org control
+        if propagate:
+            catalog = await get_catalog(self.db)
+            item = OrgControlBatchItem(control_id=control_id, **data.model_dump())
+            updated = await batch_update_org_controls(
+                self.db, catalog, org.id, [item], propagate=True
+            )
+            return updated[0]
+
+        # Get the org control, locked so concurrent status changes serialize
         result = await self.db.execute(
             select(OrgControl)
             .options(
                 selectinload(OrgControl.org_framework),
                 selectinload(OrgControl.framework_control).selectinload(FrameworkControl.control),
-                selectinload(OrgControl.control_evidence),
             )
             .where(OrgControl.id == control_id)
+            .with_for_update(of=OrgControl)
         )
         org_control = result.scalar_one_or_none()
 
@@ -200,6 +329,7 @@ class OrganizationController(BaseController):
             raise HTTPException(status_code=404, detail="Control not found")
 
         # Update fields
+        old_status = org_control.status
         if data.status is not None:
             org_control.status = data.status
         if data.due_date is not None:
@@ -208,6 +338,10 @@ class OrganizationController(BaseController):
             org_control.notes = data.notes
 
         await self.db.flush()
+        await shift_readiness_counter(
+            self.db, org_control.org_framework_id, old_status, org_control.status
+        )
+        await record_status_change(self.db, org_control, old_status, org_control.status)
         await self.db.refresh(org_control)
 
         fc = org_control.framework_control
@@ -223,9 +357,26 @@ class OrganizationController(BaseController):
             status=org_control.status,
             due_date=org_control.due_date,
             notes=org_control.notes,
-            evidence_count=len(org_control.control_evidence),
+            evidence_count=org_control.evidence_count,
         )
 
+    async def batch_update_org_controls(
+        self, slug: str, data: OrgControlBatchUpdate, propagate: bool = False
+    ) -> list[OrgControlResponse]:
+        """
+        Update many of the organization's controls at once.
+
+        Ownership of every control is checked in one query and the changes are
+        applied with a single UPDATE. Nothing is written if any control is not
+        found. With `propagate`, controls sharing a lookup control are updated
+        too and returned after the requested ones.
+        """
+        logger.info(f"Updating {len(data.updates)} controls for {slug} (propagate={propagate})")
+
+        org = await get_org_or_404(self.db, slug)
+        catalog = await get_catalog(self.db)
+        return await batch_update_org_controls(self.db, catalog, org.id, data.updates, propagate)
+
     async def create_evidence(self, slug: str, data: EvidenceCreate) -> EvidenceResponse:
         """Create a new evidence artifact for the organization."""
         logger.info(f"Creating evidence for {slug}: {data.title}")
@@ -248,81 +399,182 @@ class OrganizationController(BaseController):
         logger.info(f"Created evidence {evidence.id}")
         return EvidenceResponse.model_validate(evidence)
 
-    async def list_evidence(self, slug: str) -> list[EvidenceResponse]:
-        """List all evidence for the organization."""
+    async def ingest_evidence(
+        self, slug: str, body: AsyncIterator[bytes], content_encoding: str | None = None
+    ) -> EvidenceIngestResponse:
+        """Load NDJSON evidence, optionally gzip-encoded, reporting rejected lines."""
+        encoding = (content_encoding or "identity").strip().lower()
+        if encoding not in ("identity", "gzip"):
+            raise HTTPException(
+                status_code=415, detail=f"Unsupported Content-Encoding: {content_encoding}"
+            )
+
+        org = await get_org_or_404(self.db, slug)
+        report = await ingest_evidence(
+            self.db, org.id, ndjson_lines(body, gzipped=encoding == "gzip")
+        )
+        return EvidenceIngestResponse.model_validate(report)
+
+    async def list_evidence(
+        self,
+        slug: str,
+        page: PageRequest,
+        stream: StreamRequest,
+        conditional: ConditionalRequest,
+    ) -> list[EvidenceResponse] | Response:
+        """
+        List the organization's evidence, newest first.
+
+        Returns one page, or with `stream` every row from the cursor on.
+        """
         logger.info(f"Listing evidence for {slug}")
 
+        state = await evidence_state(self.db, slug)
+        if state:
+            state = state.varied(page.limit, page.cursor, stream)
+            if conditional.is_fresh(state):
+                return conditional.not_modified(state)
+
         org = await get_org_or_404(self.db, slug)
 
-        result = await self.db.execute(
-            select(Evidence)
-            .where(Evidence.organization_id == org.id)
-            .order_by(Evidence.created_at.desc())
-        )
-        evidence_list = result.scalars().all()
+        # UUIDv7 ids follow creation order; ix_evidence_organization_id_id
+        stmt = select(*Evidence.__table__.c).where(Evidence.organization_id == org.id)
+        if page.cursor is not None:
+            (after_id,) = decode_cursor(page.cursor, UUID)
+            stmt = stmt.where(Evidence.id < after_id)
+        stmt = stmt.order_by(Evidence.id.desc())
+
+        if stream.enabled:
+            return stream_json(
+                stmt,
+                lambda row: EvidenceResponse.model_validate(row._mapping),
+                stream,
+                headers=state.headers if state else None,
+            )
+
+        result = await self.db.execute(stmt.limit(page.limit + 1))
+        rows = paginate(result.all(), page.limit, key=lambda row: (row.id,))
+
+        conditional.apply(state)
+        page.apply(rows)
+        return [EvidenceResponse.model_validate(row._mapping) for row in rows.items]
+
+    async def search_evidence(
+        self, slug: str, q: str, limit: int, cursor: str | None
+    ) -> Page[EvidenceSearchResult]:
+        """Fuzzy search of the organization's evidence by title or description."""
+        logger.info(f"Searching evidence for {slug}: q={q!r}")
+
+        org = await get_org_or_404(self.db, slug)
+        return await search_evidence(self.db, org.id, q, limit, cursor)
 
-        return [EvidenceResponse.model_validate(e) for e in evidence_list]
+    async def search_org_control_notes(
+        self, slug: str, q: str, limit: int, cursor: str | None
+    ) -> Page[OrgControlSearchResult]:
+        """Fuzzy search of the notes on the organization's controls."""
+        logger.info(f"Searching control notes for {slug}: q={q!r}")
+
+        org = await get_org_or_404(self.db, slug)
+        catalog = await get_catalog(self.db)
+        return await search_org_control_notes(self.db, catalog, org.id, q, limit, cursor)
 
     async def link_evidence_to_control(
-        self, slug: str, control_id: int, data: ControlEvidenceCreate
+        self, slug: str, control_id: UUID, data: ControlEvidenceCreate
     ) -> dict:
         """Link an evidence artifact to a control."""
         logger.info(f"Linking evidence {data.evidence_id} to control {control_id}")
 
         org = await get_org_or_404(self.db, slug)
+        links = await link_evidence(self.db, org.id, [(data.evidence_id, control_id)])
+        if links.already_linked:
+            raise HTTPException(status_code=400, detail="Evidence already linked to this control")
 
-        # Get the org control and verify it belongs to this org
-        oc_result = await self.db.execute(
-            select(OrgControl)
-            .options(selectinload(OrgControl.org_framework))
-            .where(OrgControl.id == control_id)
-        )
-        org_control = oc_result.scalar_one_or_none()
-
-        if not org_control or org_control.org_framework.organization_id != org.id:
-            raise HTTPException(status_code=404, detail="Control not found")
+        logger.info(f"Linked evidence {data.evidence_id} to control {control_id}")
+        return {"message": "Evidence linked successfully"}
 
-        # Verify evidence exists and belongs to this org
-        ev_result = await self.db.execute(
-            select(Evidence)
-            .where(Evidence.id == data.evidence_id)
-            .where(Evidence.organization_id == org.id)
+    async def link_evidence_bulk(
+        self, slug: str, data: EvidenceLinkBatch
+    ) -> EvidenceLinkBatchResponse:
+        """Link many evidence artifacts to controls, skipping existing links."""
+        org = await get_org_or_404(self.db, slug)
+        links = await link_evidence(
+            self.db, org.id, [(link.evidence_id, link.control_id) for link in data.links]
+        )
+        return EvidenceLinkBatchResponse(
+            linked=[
+                EvidenceLink(evidence_id=evidence_id, control_id=control_id)
+                for evidence_id, control_id in links.linked
+            ],
+            already_linked=[
+                EvidenceLink(evidence_id=evidence_id, control_id=control_id)
+                for evidence_id, control_id in links.already_linked
+            ],
         )
-        evidence = ev_result.scalar_one_or_none()
 
-        if not evidence:
-            raise HTTPException(status_code=404, detail="Evidence not found")
+    async def get_framework_readiness(
+        self,
+        slug: str,
+        framework_id: UUID,
+        conditional: ConditionalRequest,
+        as_of: datetime | None = None,
+    ) -> ReadinessResponse | Response:
+        """
+        Calculate compliance readiness for a framework.
 
-        # Check if already linked
-        existing = await self.db.execute(
-            select(ControlEvidence)
-            .where(ControlEvidence.org_control_id == control_id)
-            .where(ControlEvidence.evidence_id == data.evidence_id)
-        )
-        if existing.scalar_one_or_none():
-            raise HTTPException(status_code=400, detail="Evidence already linked to this control")
+        Returns the percentage of controls that are complete and a list of gaps.
+        Readiness is not recalculated when the client's copy is still current.
+        With `as_of`, readiness is rebuilt from the status event log as it stood
+        at that moment; naive timestamps are taken as UTC.
+        """
+        logger.info(f"Calculating readiness for {slug} framework {framework_id} as of {as_of}")
 
-        # Create link
-        link = ControlEvidence(
-            org_control_id=control_id,
-            evidence_id=data.evidence_id,
-            linked_by=data.linked_by,
-        )
-        self.db.add(link)
-        await self.db.flush()
+        if as_of is not None:
+            if as_of.tzinfo is None:
+                as_of = as_of.replace(tzinfo=timezone.utc)
+            org = await get_org_or_404(self.db, slug)
+            org_framework = await get_org_framework_or_404(self.db, org, framework_id)
+            return await calculate_readiness(self.db, org_framework, as_of)
 
-        logger.info(f"Linked evidence {data.evidence_id} to control {control_id}")
-        return {"message": "Evidence linked successfully"}
+        catalog = await get_catalog(self.db)
+        state = await org_controls_state(self.db, slug, framework_id, catalog.version)
+        if state and conditional.is_fresh(state):
+            return conditional.not_modified(state)
+
+        org = await get_org_or_404(self.db, slug)
+        org_framework = await get_org_framework_or_404(self.db, org, framework_id)
 
-    async def get_framework_readiness(self, slug: str, framework_id: int) -> ReadinessResponse:
+        readiness = await calculate_readiness(self.db, org_framework)
+        conditional.apply(state)
+        return readiness
+
+    async def get_readiness_history(
+        self,
+        slug: str,
+        framework_id: UUID,
+        start: date | None,
+        end: date | None,
+        interval: HistoryInterval,
+    ) -> ReadinessHistoryResponse:
         """
-        Calculate compliance readiness for a framework.
+        Readiness trend for a framework, read from the daily snapshots.
 
-        Returns the percentage of controls that are complete and a list of gaps.
+        Defaults to the last 90 days, one point per `interval`.
         """
-        logger.info(f"Calculating readiness for {slug} framework {framework_id}")
+        logger.info(f"Getting readiness history for {slug} framework {framework_id}")
+
+        end = end or datetime.now(timezone.utc).date()
+        start = start or end - timedelta(days=DEFAULT_HISTORY_DAYS)
+        if start > end:
+            raise HTTPException(status_code=400, detail="start must not be after end")
 
         org = await get_org_or_404(self.db, slug)
         org_framework = await get_org_framework_or_404(self.db, org, framework_id)
 
-        return await calculate_readiness(self.db, org_framework)
+        points = await readiness_history(self.db, org_framework.id, start, end, interval)
+        return ReadinessHistoryResponse(
+            framework_id=framework_id,
+            interval=interval,
+            start=start,
+            end=end,
+            points=points,
+        )
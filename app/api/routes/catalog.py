@@ -0,0 +1,34 @@
+"""Catalog API routes."""
+
+import logging
+
+from fastapi import APIRouter, Depends
+
+from app.api.controllers import CatalogController
+from app.base import get_controller
+from app.schemas.catalog import CatalogVersionResponse
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get("", response_model=CatalogVersionResponse)
+async def get_catalog_version(
+    controller: CatalogController = Depends(get_controller(CatalogController)),
+) -> CatalogVersionResponse:
+    """Get the version stamp of the catalog snapshot served by this worker."""
+    logger.info("Inside the router for get_catalog_version")
+    return await controller.get_catalog_version()
+
+
+@router.post("/reload", response_model=CatalogVersionResponse)
+async def reload_catalog(
+    controller: CatalogController = Depends(get_controller(CatalogController)),
+) -> CatalogVersionResponse:
+    """
+    Reload the catalog snapshot from the database.
+
+    Only the worker handling the request is refreshed.
+    """
+    logger.info("Inside the router for reload_catalog")
+    return await controller.reload_catalog()
@@ -1,12 +1,16 @@
 """Control API routes."""
 
 import logging
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
 from app.api.controllers import ControlController
 from app.base import get_controller
-from app.schemas.control import ControlResponse
+from app.helpers.http import ConditionalRequest, get_conditional_request
+from app.helpers.pagination import PageRequest, get_page_request, set_next_cursor
+from app.models import ControlCategory, ControlType
+from app.schemas.control import ControlResponse, ControlSearchResult
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -14,24 +18,51 @@ router = APIRouter()
 
 @router.get("", response_model=list[ControlResponse])
 async def list_controls(
-    category: str | None = Query(None, description="Filter by category"),
-    control_type: str | None = Query(None, description="Filter by control type"),
+    category: ControlCategory | None = Query(None, description="Filter by category"),
+    control_type: ControlType | None = Query(None, description="Filter by control type"),
+    page: PageRequest = Depends(get_page_request),
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     controller: ControlController = Depends(get_controller(ControlController)),
-) -> list[ControlResponse]:
+) -> Response:
     """
     List all controls in the reusable control library.
 
-    Controls can be filtered by category or type.
+    Controls can be filtered by category or type. Paginated with `limit` and
+    `cursor`; the next page's cursor is returned in the `X-Next-Cursor` header.
+    Supports `If-None-Match` revalidation against the returned ETag.
     """
     logger.info("Inside the router for list_controls")
-    return await controller.list_controls(category, control_type)
+    return await controller.list_controls(category, control_type, page, conditional)
+
+
+@router.get("/search", response_model=list[ControlSearchResult])
+async def search_controls(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    framework_id: UUID | None = Query(None, description="Only search this framework's controls"),
+    prefix: bool = Query(True, description="Match words starting with each term"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    controller: ControlController = Depends(get_controller(ControlController)),
+) -> list[ControlSearchResult]:
+    """
+    Full-text search over control code, title and description.
+
+    Results are ranked best match first. When more results exist, the cursor
+    of the next page is returned in the `X-Next-Cursor` header.
+    """
+    logger.info("Inside the router for search_controls")
+    page = await controller.search_controls(q, framework_id, prefix, limit, cursor)
+    set_next_cursor(response, page)
+    return page.items
 
 
 @router.get("/{code}", response_model=ControlResponse)
 async def get_control(
     code: str,
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     controller: ControlController = Depends(get_controller(ControlController)),
-) -> ControlResponse:
+) -> Response:
     """Get a specific control by its code."""
     logger.info("Inside the router for get_control")
-    return await controller.get_control(code)
+    return await controller.get_control(code, conditional)
@@ -3,11 +3,20 @@
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
 from app.api.controllers import FrameworkController
 from app.base import get_controller
-from app.schemas.framework import ControlInFramework, FrameworkResponse
+from app.helpers.http import ConditionalRequest, get_conditional_request
+from app.helpers.pagination import PageRequest, get_page_request
+from app.models import FrameworkStatus
+from app.schemas.framework import (
+    ControlCrosswalk,
+    ControlInFramework,
+    FrameworkDiffResponse,
+    FrameworkOverlapResponse,
+    FrameworkResponse,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -16,33 +25,68 @@ router = APIRouter()
 @router.get("", response_model=list[FrameworkResponse])
 async def list_frameworks(
     code: str | None = Query(None, description="Filter by framework code"),
-    status: str | None = Query(None, description="Filter by status"),
+    status: FrameworkStatus | None = Query(None, description="Filter by status"),
+    page: PageRequest = Depends(get_page_request),
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     controller: FrameworkController = Depends(get_controller(FrameworkController)),
-) -> list[FrameworkResponse]:
+) -> Response:
     """
     List all frameworks.
 
     Optionally filter by code (e.g., 'soc2') to get all versions of a framework.
+    Paginated with `limit` and `cursor`; the next page's cursor is returned in
+    the `X-Next-Cursor` header. Supports `If-None-Match` revalidation against
+    the returned ETag.
     """
     logger.info(f"Listing frameworks with filters: code={code}, status={status}")
-    return await controller.list_frameworks(code, status)
+    return await controller.list_frameworks(code, status, page, conditional)
+
+
+# Static paths are declared before /{framework_id}, which would otherwise match them
+
+
+@router.get("/overlap", response_model=FrameworkOverlapResponse)
+async def get_framework_overlap(
+    conditional: ConditionalRequest = Depends(get_conditional_request),
+    controller: FrameworkController = Depends(get_controller(FrameworkController)),
+) -> Response:
+    """
+    Get the N x N framework overlap matrix.
+
+    For every pair of frameworks, the number of controls they share and their
+    Jaccard similarity.
+    """
+    logger.info("Getting framework overlap matrix")
+    return await controller.get_framework_overlap(conditional)
+
+
+@router.get("/crosswalk", response_model=list[ControlCrosswalk])
+async def get_control_crosswalk(
+    conditional: ConditionalRequest = Depends(get_conditional_request),
+    controller: FrameworkController = Depends(get_controller(FrameworkController)),
+) -> Response:
+    """List every control with the framework requirements it satisfies."""
+    logger.info("Getting control crosswalk")
+    return await controller.get_control_crosswalk(conditional)
 
 
 @router.get("/{framework_id}", response_model=FrameworkResponse)
 async def get_framework(
     framework_id: UUID,
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     controller: FrameworkController = Depends(get_controller(FrameworkController)),
-) -> FrameworkResponse:
+) -> Response:
     """Get a specific framework by ID."""
     logger.info(f"Getting framework {framework_id}")
-    return await controller.get_framework(framework_id)
+    return await controller.get_framework(framework_id, conditional)
 
 
 @router.get("/{framework_id}/controls", response_model=list[ControlInFramework])
 async def list_framework_controls(
     framework_id: UUID,
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     controller: FrameworkController = Depends(get_controller(FrameworkController)),
-) -> list[ControlInFramework]:
+) -> Response:
     """
     List all controls for a specific framework.
 
@@ -50,4 +94,21 @@ async def list_framework_controls(
     """
     logger.info(f"Listing controls for framework {framework_id}")
 
-    return await controller.list_framework_controls(framework_id)
+    return await controller.list_framework_controls(framework_id, conditional)
+
+
+@router.get("/{framework_id}/diff/{other_framework_id}", response_model=FrameworkDiffResponse)
+async def diff_framework_versions(
+    framework_id: UUID,
+    other_framework_id: UUID,
+    conditional: ConditionalRequest = Depends(get_conditional_request),
+    controller: FrameworkController = Depends(get_controller(FrameworkController)),
+) -> Response:
+    """
+    Diff two versions of the same framework.
+
+    Lists controls added in, removed from, remapped to a new framework control
+    code in, or with a changed `is_required` flag in `other_framework_id`.
+    """
+    logger.info(f"Diffing framework {framework_id} to {other_framework_id}")
+    return await controller.diff_framework_versions(framework_id, other_framework_id, conditional)
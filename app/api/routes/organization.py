@@ -1,26 +1,49 @@
 """Organization API routes."""
 
 import logging
+from datetime import date, datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 
 from app.api.controllers import OrganizationController
 from app.base import get_controller
-from app.schemas.evidence import ControlEvidenceCreate, EvidenceCreate, EvidenceResponse
+from app.helpers.http import ConditionalRequest, get_conditional_request
+from app.helpers.pagination import PageRequest, get_page_request, set_next_cursor
+from app.helpers.streaming import StreamRequest, get_stream_request
+from app.schemas.evidence import (
+    ControlEvidenceCreate,
+    EvidenceCreate,
+    EvidenceIngestResponse,
+    EvidenceLinkBatch,
+    EvidenceLinkBatchResponse,
+    EvidenceResponse,
+    EvidenceSearchResult,
+)
 from app.schemas.organization import (
+    BulkAdoptionCreate,
+    BulkAdoptionResponse,
+    FrameworkMigrationCreate,
+    FrameworkMigrationResponse,
     OrganizationCreate,
     OrganizationResponse,
+    OrganizationSearchResult,
+    OrgControlBatchUpdate,
     OrgControlResponse,
+    OrgControlSearchResult,
     OrgControlUpdate,
     OrgFrameworkCreate,
     OrgFrameworkResponse,
 )
-from app.schemas.readiness import ReadinessResponse
+from app.schemas.readiness import HistoryInterval, ReadinessHistoryResponse, ReadinessResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+SEARCH_QUERY = Query(..., min_length=2, max_length=200, description="Search text")
+SEARCH_LIMIT = Query(20, ge=1, le=100)
+SEARCH_CURSOR = Query(None, description="X-Next-Cursor of the previous page")
+
 # ============== Organization Endpoints ==============
 
 
@@ -34,6 +57,26 @@ async def create_organization(
     return await controller.create_organization(org_data)
 
 
+@router.get("/search", response_model=list[OrganizationSearchResult])
+async def search_organizations(
+    response: Response,
+    q: str = SEARCH_QUERY,
+    limit: int = SEARCH_LIMIT,
+    cursor: str | None = SEARCH_CURSOR,
+    controller: OrganizationController = Depends(get_controller(OrganizationController)),
+) -> list[OrganizationSearchResult]:
+    """
+    Fuzzy search of organizations by name or slug.
+
+    Tolerates typos; results are ranked by trigram word similarity. When more
+    results exist, the cursor of the next page is in the `X-Next-Cursor` header.
+    """
+    logger.info(f"Searching organizations: {q}")
+    page = await controller.search_organizations(q, limit, cursor)
+    set_next_cursor(response, page)
+    return page.items
+
+
 @router.get("/{slug}", response_model=OrganizationResponse)
 async def get_organization(
     slug: str,
@@ -62,14 +105,60 @@ async def adopt_framework(
     return await controller.adopt_framework(slug, data)
 
 
+@router.post("/{slug}/frameworks/bulk", response_model=BulkAdoptionResponse, status_code=201)
+async def adopt_frameworks_bulk(
+    slug: str,
+    data: BulkAdoptionCreate,
+    controller: OrganizationController = Depends(get_controller(OrganizationController)),
+) -> BulkAdoptionResponse:
+    """
+    Adopt several frameworks at once.
+
+    All adoptions succeed or fail together. The response lists each adoption
+    with its control count, and the controls shared between the frameworks.
+    """
+    logger.info(f"Organization {slug} adopting frameworks {data.framework_ids}")
+    return await controller.adopt_frameworks_bulk(slug, data)
+
+
+@router.post(
+    "/{slug}/frameworks/{framework_id}/migrate",
+    response_model=FrameworkMigrationResponse,
+    status_code=201,
+)
+async def migrate_framework_version(
+    slug: str,
+    framework_id: UUID,
+    data: FrameworkMigrationCreate,
+    controller: OrganizationController = Depends(get_controller(OrganizationController)),
+) -> FrameworkMigrationResponse:
+    """
+    Migrate an adopted framework to another version of the same framework.
+
+    Status, due dates, notes and evidence links carry over for controls present
+    in both versions. The response lists controls added and removed by the
+    new version.
+    """
+    logger.info(f"Migrating {slug} framework {framework_id} to {data.target_framework_id}")
+    return await controller.migrate_framework_version(slug, framework_id, data)
+
+
 @router.get("/{slug}/frameworks", response_model=list[OrgFrameworkResponse])
 async def list_adopted_frameworks(
     slug: str,
+    page: PageRequest = Depends(get_page_request),
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     controller: OrganizationController = Depends(get_controller(OrganizationController)),
-) -> list[OrgFrameworkResponse]:
-    """List all frameworks adopted by the organization."""
+) -> list[OrgFrameworkResponse] | Response:
+    """
+    List all frameworks adopted by the organization.
+
+    Paginated with `limit` and `cursor`; the next page's cursor is returned in
+    the `X-Next-Cursor` header. Supports conditional GET via `If-None-Match` /
+    `If-Modified-Since`.
+    """
     logger.info(f"Listing adopted frameworks for {slug}")
-    return await controller.list_adopted_frameworks(slug)
+    return await controller.list_adopted_frameworks(slug, page, conditional)
 
 
 # ============== Control Status Endpoints ==============
@@ -79,11 +168,55 @@ async def list_adopted_frameworks(
 async def list_org_controls(
     slug: str,
     framework_id: UUID,
+    page: PageRequest = Depends(get_page_request),
+    stream: StreamRequest = Depends(get_stream_request),
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     controller: OrganizationController = Depends(get_controller(OrganizationController)),
-) -> list[OrgControlResponse]:
-    """List all controls for an adopted framework."""
+) -> list[OrgControlResponse] | Response:
+    """
+    List all controls for an adopted framework.
+
+    Paginated with `limit` and `cursor`; the next page's cursor is returned in
+    the `X-Next-Cursor` header. With `stream=true` every row is streamed as a
+    JSON array instead, or as NDJSON with `Accept: application/x-ndjson`.
+    Supports conditional GET via `If-None-Match` / `If-Modified-Since`.
+    """
     logger.info(f"Listing controls for {slug} framework {framework_id}")
-    return await controller.list_org_controls(slug, framework_id)
+    return await controller.list_org_controls(slug, framework_id, page, stream, conditional)
+
+
+@router.get("/{slug}/controls/search", response_model=list[OrgControlSearchResult])
+async def search_org_control_notes(
+    slug: str,
+    response: Response,
+    q: str = SEARCH_QUERY,
+    limit: int = SEARCH_LIMIT,
+    cursor: str | None = SEARCH_CURSOR,
+    controller: OrganizationController = Depends(get_controller(OrganizationController)),
+) -> list[OrgControlSearchResult]:
+    """Fuzzy search of the notes on the organization's controls."""
+    logger.info(f"Searching control notes for {slug}: {q}")
+    page = await controller.search_org_control_notes(slug, q, limit, cursor)
+    set_next_cursor(response, page)
+    return page.items
+
+
+@router.patch("/{slug}/controls", response_model=list[OrgControlResponse])
+async def batch_update_org_controls(
+    slug: str,
+    data: OrgControlBatchUpdate,
+    propagate: bool = Query(False, description="Also update controls sharing a lookup control"),
+    controller: OrganizationController = Depends(get_controller(OrganizationController)),
+) -> list[OrgControlResponse]:
+    """
+    Update the status or details of many controls at once.
+
+    All updates are applied together, or none if any control is not found.
+    With `propagate`, each change also applies to the organization's controls in
+    other frameworks that map the same control.
+    """
+    logger.info(f"Batch updating {len(data.updates)} controls for {slug}")
+    return await controller.batch_update_org_controls(slug, data, propagate)
 
 
 @router.patch("/{slug}/controls/{control_id}", response_model=OrgControlResponse)
@@ -91,11 +224,17 @@ async def update_org_control(
     slug: str,
     control_id: UUID,
     data: OrgControlUpdate,
+    propagate: bool = Query(False, description="Also update controls sharing a lookup control"),
     controller: OrganizationController = Depends(get_controller(OrganizationController)),
 ) -> OrgControlResponse:
-    """Update the status or details of an organization's control."""
+    """
+    Update the status or details of an organization's control.
+
+    With `propagate`, the change also applies to the organization's controls in
+    other frameworks that map the same control.
+    """
     logger.info(f"Updating control {control_id} for {slug}")
-    return await controller.update_org_control(slug, control_id, data)
+    return await controller.update_org_control(slug, control_id, data, propagate)
 
 
 # ============== Evidence Endpoints ==============
@@ -112,14 +251,73 @@ async def create_evidence(
     return await controller.create_evidence(slug, data)
 
 
+@router.post("/{slug}/evidence/ingest", response_model=EvidenceIngestResponse)
+async def ingest_evidence(
+    slug: str,
+    request: Request,
+    content_encoding: str | None = Header(None),
+    controller: OrganizationController = Depends(get_controller(OrganizationController)),
+) -> EvidenceIngestResponse:
+    """
+    Bulk load evidence from an NDJSON body, one evidence object per line.
+
+    The body may be gzip-encoded (`Content-Encoding: gzip`) and is read as a
+    stream. Valid lines are inserted, the others are reported by line number.
+    """
+    logger.info(f"Ingesting evidence for {slug}")
+    return await controller.ingest_evidence(slug, request.stream(), content_encoding)
+
+
 @router.get("/{slug}/evidence", response_model=list[EvidenceResponse])
 async def list_evidence(
     slug: str,
+    page: PageRequest = Depends(get_page_request),
+    stream: StreamRequest = Depends(get_stream_request),
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     controller: OrganizationController = Depends(get_controller(OrganizationController)),
-) -> list[EvidenceResponse]:
-    """List all evidence for the organization."""
+) -> list[EvidenceResponse] | Response:
+    """
+    List all evidence for the organization.
+
+    Paginated with `limit` and `cursor`; the next page's cursor is returned in
+    the `X-Next-Cursor` header. With `stream=true` every row is streamed as a
+    JSON array instead, or as NDJSON with `Accept: application/x-ndjson`.
+    Supports conditional GET via `If-None-Match` / `If-Modified-Since`.
+    """
     logger.info(f"Listing evidence for {slug}")
-    return await controller.list_evidence(slug)
+    return await controller.list_evidence(slug, page, stream, conditional)
+
+
+@router.get("/{slug}/evidence/search", response_model=list[EvidenceSearchResult])
+async def search_evidence(
+    slug: str,
+    response: Response,
+    q: str = SEARCH_QUERY,
+    limit: int = SEARCH_LIMIT,
+    cursor: str | None = SEARCH_CURSOR,
+    controller: OrganizationController = Depends(get_controller(OrganizationController)),
+) -> list[EvidenceSearchResult]:
+    """Fuzzy search of the organization's evidence by title or description."""
+    logger.info(f"Searching evidence for {slug}: {q}")
+    page = await controller.search_evidence(slug, q, limit, cursor)
+    set_next_cursor(response, page)
+    return page.items
+
+
+@router.post("/{slug}/evidence/links", response_model=EvidenceLinkBatchResponse)
+async def link_evidence_bulk(
+    slug: str,
+    data: EvidenceLinkBatch,
+    controller: OrganizationController = Depends(get_controller(OrganizationController)),
+) -> EvidenceLinkBatchResponse:
+    """
+    Link many evidence artifacts to controls at once.
+
+    Nothing is linked if any control or evidence is not found. Links that
+    already exist are left as they are and reported under `already_linked`.
+    """
+    logger.info(f"Linking {len(data.links)} evidence links for {slug}")
+    return await controller.link_evidence_bulk(slug, data)
 
 
 @router.post("/{slug}/controls/{control_id}/evidence", status_code=201)
@@ -141,12 +339,39 @@ async def link_evidence_to_control(
 async def get_framework_readiness(
     slug: str,
     framework_id: UUID,
+    as_of: datetime | None = Query(None, description="Report readiness as of this time"),
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     controller: OrganizationController = Depends(get_controller(OrganizationController)),
-) -> ReadinessResponse:
+) -> ReadinessResponse | Response:
     """
     Calculate compliance readiness for a framework.
 
     Returns the percentage of controls that are complete and a list of gaps.
+    With `as_of`, readiness is rebuilt from the status event log for that
+    moment. Otherwise supports conditional GET via `If-None-Match` /
+    `If-Modified-Since`.
     """
     logger.info(f"Calculating readiness for {slug} framework {framework_id}")
-    return await controller.get_framework_readiness(slug, framework_id)
+    return await controller.get_framework_readiness(slug, framework_id, conditional, as_of)
+
+
+@router.get(
+    "/{slug}/frameworks/{framework_id}/readiness/history",
+    response_model=ReadinessHistoryResponse,
+)
+async def get_readiness_history(
+    slug: str,
+    framework_id: UUID,
+    start: date | None = Query(None, description="First day (defaults to 90 days before end)"),
+    end: date | None = Query(None, description="Last day (defaults to today, UTC)"),
+    interval: HistoryInterval = Query(HistoryInterval.DAY, description="Bucket size"),
+    controller: OrganizationController = Depends(get_controller(OrganizationController)),
+) -> ReadinessHistoryResponse:
+    """
+    Readiness trend for a framework.
+
+    Points come from daily snapshots; with `week` or `month` each point is the
+    last snapshot of its bucket.
+    """
+    logger.info(f"Getting readiness history for {slug} framework {framework_id}")
+    return await controller.get_readiness_history(slug, framework_id, start, end, interval)
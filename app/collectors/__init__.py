@@ -0,0 +1,13 @@
+"""Evidence collectors, keyed by the EvidenceSource they collect from."""
+
+from app.collectors.base import Collector, CollectorError, CollectorRegistry, load_collector
+from app.collectors.fake import FakeCollector, fake_collectors
+
+__all__ = [
+    "Collector",
+    "CollectorError",
+    "CollectorRegistry",
+    "load_collector",
+    "FakeCollector",
+    "fake_collectors",
+]
@@ -0,0 +1,40 @@
+"""Collector interface."""
+
+import importlib
+from abc import ABC, abstractmethod
+from typing import Mapping
+
+from app.helpers.collection_jobs import ClaimedJob, CollectedEvidence
+from app.models import EvidenceSource
+
+
+class CollectorError(Exception):
+    """A collection attempt failed and may be retried."""
+
+
+class Collector(ABC):
+    """
+    Collects evidence for one EvidenceSource.
+
+    `collect` is called once per job attempt and returns the evidence found;
+    raising fails the attempt, which is retried with backoff. Collectors are
+    shared by all tasks of a worker, so they must not keep per-job state.
+    """
+
+    source: EvidenceSource
+
+    @abstractmethod
+    async def collect(self, job: ClaimedJob) -> list[CollectedEvidence]:
+        """Collect the evidence requested by `job`."""
+
+
+CollectorRegistry = Mapping[EvidenceSource, Collector]
+
+
+def load_collector(path: str) -> Collector:
+    """Instantiate the Collector class at `module:ClassName`."""
+    module_name, _, class_name = path.partition(":")
+    collector = getattr(importlib.import_module(module_name), class_name)()
+    if not isinstance(collector, Collector):
+        raise TypeError(f"{path} is not a Collector")
+    return collector
@@ -0,0 +1,67 @@
+"""Offline collectors producing synthetic evidence, for local runs and tests."""
+
+import asyncio
+import json
+import random
+from datetime import datetime, timezone
+
+from app.collectors.base import Collector, CollectorError
+from app.helpers.collection_jobs import ClaimedJob, CollectedEvidence
+from app.models import EvidenceSource, EvidenceType
+
+# What each fake source pretends to export
+_ARTIFACTS = {
+    EvidenceSource.AWS: ("AWS Config snapshot", EvidenceType.CONFIGURATION),
+    EvidenceSource.GITHUB: ("GitHub branch protection export", EvidenceType.CONFIGURATION),
+    EvidenceSource.OKTA: ("Okta MFA enrollment report", EvidenceType.LOG_EXPORT),
+}
+
+
+class FakeCollector(Collector):
+    """
+    Collector that returns `evidence_per_job` synthetic artifacts after `latency` seconds.
+
+    Every job fails its first `fail_attempts` attempts, and any attempt fails
+    with probability `failure_rate`, so retries and backoff can be exercised
+    without the real APIs.
+    """
+
+    def __init__(
+        self,
+        source: EvidenceSource,
+        evidence_per_job: int = 3,
+        latency: float = 0.0,
+        fail_attempts: int = 0,
+        failure_rate: float = 0.0,
+        seed: int | None = None,
+    ):
+        self.source = source
+        self.evidence_per_job = evidence_per_job
+        self.latency = latency
+        self.fail_attempts = fail_attempts
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+
+    async def collect(self, job: ClaimedJob) -> list[CollectedEvidence]:
+        await asyncio.sleep(self.latency)
+        if job.attempts <= self.fail_attempts or self._random.random() < self.failure_rate:
+            raise CollectorError(f"{self.source.value} API unavailable (attempt {job.attempts})")
+
+        title, evidence_type = _ARTIFACTS.get(
+            self.source, ("Collected artifact", EvidenceType.OTHER)
+        )
+        collected_at = datetime.now(timezone.utc)
+        return [
+            CollectedEvidence(
+                title=f"{title} {i + 1}",
+                evidence_type=evidence_type,
+                description=json.dumps(job.parameters, sort_keys=True) if job.parameters else None,
+                collected_at=collected_at,
+            )
+            for i in range(self.evidence_per_job)
+        ]
+
+
+def fake_collectors(**options) -> dict[EvidenceSource, FakeCollector]:
+    """A FakeCollector for each automated source (AWS, GitHub, Okta)."""
+    return {source: FakeCollector(source, **options) for source in _ARTIFACTS}
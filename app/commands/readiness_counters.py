@@ -0,0 +1,69 @@
+"""
+Verify and repair the maintained readiness counters.
+
+Recomputes every OrgFramework's status counts from its OrgControl rows in one
+aggregate query and reports counters that are missing or have drifted.
+
+Usage:
+    python -m app.commands.readiness_counters           # report drift
+    python -m app.commands.readiness_counters --repair  # report and fix drift
+"""
+
+import argparse
+import asyncio
+import sys
+
+from rich.console import Console
+from rich.table import Table
+
+from app.database import async_session
+from app.helpers.readiness import (
+    COUNTER_COLUMNS,
+    readiness_counter_drift_query,
+    refresh_readiness_counters,
+)
+
+console = Console()
+
+REPAIR_BATCH_SIZE = 1000
+
+
+async def verify_readiness_counters(repair: bool) -> int:
+    """Report drifted counters, optionally repairing them. Returns the drift count."""
+    async with async_session() as session:
+        drift = (await session.execute(readiness_counter_drift_query())).all()
+
+        if not drift:
+            console.print("All readiness counters are consistent.")
+            return 0
+
+        table = Table(title=f"{len(drift)} drifted readiness counters")
+        table.add_column("org_framework_id")
+        for column in COUNTER_COLUMNS.values():
+            table.add_column(f"{column} (stored → actual)")
+        for row in drift:
+            table.add_row(
+                str(row.org_framework_id),
+                *(
+                    f"{getattr(row, f'stored_{column}')} → {getattr(row, column)}"
+                    for column in COUNTER_COLUMNS.values()
+                ),
+            )
+        console.print(table)
+
+        if repair:
+            ids = [row.org_framework_id for row in drift]
+            for start in range(0, len(ids), REPAIR_BATCH_SIZE):
+                await refresh_readiness_counters(session, ids[start : start + REPAIR_BATCH_SIZE])
+                await session.commit()
+            console.print(f"Repaired {len(drift)} readiness counters.")
+
+        return len(drift)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verify and repair readiness counters.")
+    parser.add_argument("--repair", action="store_true", help="recompute drifted counters")
+    args = parser.parse_args()
+    drifted = asyncio.run(verify_readiness_counters(args.repair))
+    sys.exit(1 if drifted and not args.repair else 0)
@@ -0,0 +1,37 @@
+"""
+Snapshot the readiness of every adopted framework.
+
+The API workers take the snapshot on their own schedule; this command is for
+cron-driven deployments and for backfilling a specific day.
+
+Usage:
+    python -m app.commands.snapshot_readiness                     # today (UTC)
+    python -m app.commands.snapshot_readiness --date 2026-01-31   # a given day
+"""
+
+import argparse
+import asyncio
+from datetime import date
+
+from rich.console import Console
+
+from app.database import async_session
+from app.helpers.readiness_history import snapshot_readiness
+
+console = Console()
+
+
+async def run_snapshot(day: date | None) -> int:
+    """Write the snapshot for `day` and return the number of rows written."""
+    async with async_session() as session:
+        written = await snapshot_readiness(session, day)
+        await session.commit()
+    console.print(f"Wrote {written} readiness snapshots.")
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snapshot readiness of adopted frameworks.")
+    parser.add_argument("--date", type=date.fromisoformat, help="snapshot date (YYYY-MM-DD)")
+    args = parser.parse_args()
+    asyncio.run(run_snapshot(args.date))
@@ -32,6 +32,22 @@ class Settings:
     api_title: str = "RMF Compliance Engine"
     api_version: str = "1.0.0"
 
+    # Catalog
+    catalog_reload_debounce: float = 0.5
+    catalog_cache_control: str = "public, max-age=60, stale-while-revalidate=300"
+
+    # Readiness history
+    readiness_snapshot_interval: float = 3600.0
+
+    # Evidence collection worker
+    collection_concurrency: int = 4
+    collection_batch_size: int = 10
+    collection_poll_interval: float = 1.0
+    collection_lock_timeout: float = 300.0
+    collection_collect_timeout: float = 120.0
+    collection_retry_base: float = 30.0
+    collection_retry_max: float = 3600.0
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -45,6 +45,11 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+def get_session_factory() -> async_sessionmaker:
+    """Dependency that provides the factory for sessions outliving the request's own."""
+    return async_session
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
@@ -1,5 +1,6 @@
 """Services package."""
 
+from app.helpers.catalog import catalog_cache, get_catalog
 from app.helpers.common import (
     get_org_framework_or_404,
     get_org_or_404,
@@ -8,6 +9,8 @@ from app.helpers.readiness import calculate_readiness
 
 __all__ = [
     "calculate_readiness",
+    "catalog_cache",
+    "get_catalog",
     "get_org_or_404",
     "get_org_framework_or_404",
 ]
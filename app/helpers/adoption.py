@@ -0,0 +1,204 @@
+"""Framework adoption.
+
+Adopting a framework creates one OrgFramework plus one OrgControl per
+FrameworkControl. The OrgControls are created with a single
+INSERT ... SELECT from `lookup.frameworkcontrol`, so no FrameworkControl or
+OrgControl objects are loaded into Python, however large the framework.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import and_, exists, func, insert, literal, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers.audit import record_adoption
+from app.helpers.catalog import CatalogSnapshot
+from app.helpers.readiness import refresh_readiness_counters
+from app.models import (
+    ComplianceStatus,
+    Framework,
+    FrameworkControl,
+    Organization,
+    OrgControl,
+    OrgControlEvent,
+    OrgFramework,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Adoption:
+    """A newly created OrgFramework and the number of OrgControls created for it."""
+
+    org_framework: OrgFramework
+    control_count: int
+
+
+async def check_adoptable(db: AsyncSession, slug: str, framework_ids: list[UUID]) -> UUID:
+    """
+    Validate an adoption request in one query and return the organization id.
+
+    Raises 404 for an unknown organization or framework and 400 when a
+    framework is already adopted.
+    """
+    result = await db.execute(
+        select(
+            Organization.id,
+            Framework.id.label("framework_id"),
+            OrgFramework.id.label("org_framework_id"),
+        )
+        .select_from(Organization)
+        .outerjoin(Framework, Framework.id.in_(framework_ids))
+        .outerjoin(
+            OrgFramework,
+            and_(
+                OrgFramework.organization_id == Organization.id,
+                OrgFramework.framework_id == Framework.id,
+            ),
+        )
+        .where(Organization.slug == slug)
+    )
+    rows = result.all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="Organization not found")
+    missing = set(framework_ids) - {row.framework_id for row in rows}
+    if missing:
+        raise HTTPException(status_code=404, detail=_framework_error("not found", missing))
+    adopted = {row.framework_id for row in rows if row.org_framework_id}
+    if adopted:
+        raise HTTPException(status_code=400, detail=_framework_error("already adopted", adopted))
+    return rows[0].id
+
+
+def _framework_error(reason: str, framework_ids: set[UUID]) -> str:
+    if len(framework_ids) == 1:
+        return f"Framework {reason}"
+    return f"Frameworks {reason}: {', '.join(sorted(map(str, framework_ids)))}"
+
+
+def shared_controls(
+    catalog: CatalogSnapshot, framework_ids: list[UUID]
+) -> dict[UUID, tuple[UUID, ...]]:
+    """
+    Controls mapped by more than one of the given frameworks.
+
+    Maps each shared control id to the frameworks that map it, in the order
+    of `framework_ids`. Computed from the catalog without a query.
+    """
+    frameworks_by_control: dict[UUID, list[UUID]] = defaultdict(list)
+    for framework_id in framework_ids:
+        for fc in catalog.controls_for_framework(framework_id):
+            frameworks_by_control[fc.control_id].append(framework_id)
+    return {
+        control_id: tuple(frameworks)
+        for control_id, frameworks in frameworks_by_control.items()
+        if len(frameworks) > 1
+    }
+
+
+async def adopt_frameworks(
+    db: AsyncSession, organization_id: UUID, framework_ids: list[UUID]
+) -> list[Adoption]:
+    """
+    Create OrgFrameworks with their OrgControls, counters and adoption events.
+
+    All frameworks are adopted with the same handful of statements, whatever
+    their number. Callers validate the request first (see `check_adoptable`).
+    Results follow the order of `framework_ids`.
+    """
+    org_frameworks = (
+        await db.scalars(
+            insert(OrgFramework).returning(OrgFramework, sort_by_parameter_order=True),
+            [
+                {"organization_id": organization_id, "framework_id": framework_id}
+                for framework_id in framework_ids
+            ],
+        )
+    ).all()
+    org_framework_ids = [of.id for of in org_frameworks]
+
+    # One OrgControl per FrameworkControl; RETURNING feeds the per-framework counts
+    inserted = (
+        insert(OrgControl)
+        .from_select(
+            ["org_framework_id", "framework_control_id", "status"],
+            select(
+                OrgFramework.id,
+                FrameworkControl.id,
+                literal(ComplianceStatus.NOT_STARTED, OrgControl.status.type),
+            )
+            .join(FrameworkControl, FrameworkControl.framework_id == OrgFramework.framework_id)
+            .where(OrgFramework.id.in_(org_framework_ids)),
+            # Leave id to the uuidv7() server default, one per row
+            include_defaults=False,
+        )
+        .returning(OrgControl.org_framework_id)
+        .cte("inserted")
+    )
+    counts = dict(
+        (
+            await db.execute(
+                select(inserted.c.org_framework_id, func.count()).group_by(
+                    inserted.c.org_framework_id
+                )
+            )
+        ).all()
+    )
+
+    await refresh_readiness_counters(db, org_framework_ids)
+    await record_adoption(db, org_framework_ids)
+
+    logger.info(f"Created {sum(counts.values())} org controls for {len(org_frameworks)} adoptions")
+    return [Adoption(of, counts.get(of.id, 0)) for of in org_frameworks]
+
+
+def missing_org_controls_insert(org_framework_ids: list[UUID]) -> postgresql.Insert:
+    """
+    Statement creating the OrgControls missing from existing adoptions.
+
+    FrameworkControls added to the catalog after an organization adopted the
+    framework have no OrgControl yet. They are found with an anti-join, and
+    each inserted control gets its adoption event in the same statement. The
+    statement returns one `org_framework_id` per created OrgControl.
+    """
+    missing = (
+        select(
+            OrgFramework.id,
+            FrameworkControl.id,
+            literal(ComplianceStatus.NOT_STARTED, OrgControl.status.type),
+        )
+        .join(FrameworkControl, FrameworkControl.framework_id == OrgFramework.framework_id)
+        .where(OrgFramework.id.in_(org_framework_ids))
+        .where(
+            ~exists().where(
+                OrgControl.org_framework_id == OrgFramework.id,
+                OrgControl.framework_control_id == FrameworkControl.id,
+            )
+        )
+    )
+    inserted = (
+        postgresql.insert(OrgControl)
+        .from_select(
+            ["org_framework_id", "framework_control_id", "status"],
+            missing,
+            include_defaults=False,
+        )
+        .on_conflict_do_nothing(constraint="uq_org_control")
+        .returning(OrgControl.org_framework_id, OrgControl.id, OrgControl.status)
+        .cte("inserted")
+    )
+    return (
+        postgresql.insert(OrgControlEvent)
+        .from_select(
+            ["org_framework_id", "org_control_id", "to_status"],
+            select(inserted.c.org_framework_id, inserted.c.id, inserted.c.status),
+            include_defaults=False,
+        )
+        .returning(OrgControlEvent.org_framework_id)
+    )
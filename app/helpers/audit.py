@@ -0,0 +1,87 @@
+"""OrgControl status event log.
+
+Every status an OrgControl takes is appended to `audit.orgcontrolevent`.
+The log is never updated, so the status of every control at any past moment
+can be recovered with a window function over it.
+"""
+
+from datetime import datetime
+from typing import Iterable, NamedTuple
+from uuid import UUID
+
+from sqlalchemy import Subquery, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ComplianceStatus, OrgControl, OrgControlEvent
+
+
+class StatusChange(NamedTuple):
+    """One OrgControl status transition."""
+
+    org_framework_id: UUID
+    org_control_id: UUID
+    from_status: ComplianceStatus
+    to_status: ComplianceStatus
+
+
+async def record_adoption(db: AsyncSession, org_framework_ids: Iterable[UUID]) -> None:
+    """Log the initial status of every OrgControl of new adoptions."""
+    await db.execute(
+        insert(OrgControlEvent).from_select(
+            ["org_framework_id", "org_control_id", "to_status"],
+            select(OrgControl.org_framework_id, OrgControl.id, OrgControl.status).where(
+                OrgControl.org_framework_id.in_(list(org_framework_ids))
+            ),
+            # Leave id to the uuidv7() server default, one per row
+            include_defaults=False,
+        )
+    )
+
+
+async def record_status_change(
+    db: AsyncSession,
+    org_control: OrgControl,
+    from_status: ComplianceStatus,
+    to_status: ComplianceStatus,
+) -> None:
+    """Log a status transition. Updates that keep the status are not logged."""
+    await record_status_changes(
+        db, [StatusChange(org_control.org_framework_id, org_control.id, from_status, to_status)]
+    )
+
+
+async def record_status_changes(db: AsyncSession, changes: Iterable[StatusChange]) -> None:
+    """Log several status transitions in one statement, skipping unchanged ones."""
+    rows = [change._asdict() for change in changes if change.from_status != change.to_status]
+    if rows:
+        await db.execute(insert(OrgControlEvent), rows)
+
+
+def status_as_of(org_framework_id: UUID, as_of: datetime) -> Subquery:
+    """
+    Status of each OrgControl of an adoption at `as_of`.
+
+    Ranks each control's events newest first and keeps the first one; events
+    in the same transaction share `occurred_at` and are ordered by their
+    time-ordered id. Controls without events before `as_of` are absent.
+    """
+    ranked = (
+        select(
+            OrgControlEvent.org_control_id,
+            OrgControlEvent.to_status.label("status"),
+            func.row_number()
+            .over(
+                partition_by=OrgControlEvent.org_control_id,
+                order_by=(OrgControlEvent.occurred_at.desc(), OrgControlEvent.id.desc()),
+            )
+            .label("rank"),
+        )
+        .where(OrgControlEvent.org_framework_id == org_framework_id)
+        .where(OrgControlEvent.occurred_at <= as_of)
+        .subquery("ranked")
+    )
+    return (
+        select(ranked.c.org_control_id, ranked.c.status)
+        .where(ranked.c.rank == 1)
+        .subquery("status_as_of")
+    )
@@ -0,0 +1,411 @@
+"""In-memory snapshot of the lookup catalog.
+
+Frameworks, controls and their mappings live in the `lookup` schema and only
+change when the seed runner (`migrations.seed.gen_seed_data`) is executed.
+Each worker therefore loads them once into an immutable snapshot and serves
+the read-only catalog endpoints from memory instead of querying Postgres.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Hashable, Mapping
+from uuid import UUID
+
+import asyncpg
+from fastapi import Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.helpers.http import ConditionalRequest, RenderedJSON, conditional_json_response
+from app.models import (
+    Control,
+    ControlCategory,
+    ControlType,
+    Framework,
+    FrameworkControl,
+    FrameworkStatus,
+)
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Postgres channel the seed runner notifies after changing the lookup tables.
+CATALOG_CHANNEL = "lookup_catalog_changed"
+
+# Upper bound on values memoized per snapshot. Filters come from query strings,
+# so the set of keys is client controlled; the least recently used is evicted.
+MEMO_MAX_ENTRIES = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogFramework:
+    """Read-only copy of a `lookup.framework` row."""
+
+    id: UUID
+    code: str
+    version: str
+    name: str
+    description: str | None
+    status: FrameworkStatus
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogControl:
+    """Read-only copy of a `lookup.control` row."""
+
+    id: UUID
+    code: str
+    title: str
+    description: str | None
+    category: ControlCategory
+    control_type: ControlType
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogFrameworkControl:
+    """Read-only copy of a `lookup.frameworkcontrol` row."""
+
+    id: UUID
+    framework_id: UUID
+    control_id: UUID
+    framework_control_code: str
+    is_required: bool
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """
+    Immutable, indexed view of the lookup catalog.
+
+    `version` is a digest of the catalog content, so every worker serving the
+    same data reports the same version regardless of when it was loaded.
+    """
+
+    version: str
+    loaded_at: datetime
+    frameworks: tuple[CatalogFramework, ...]
+    controls: tuple[CatalogControl, ...]
+    framework_by_id: Mapping[UUID, CatalogFramework]
+    frameworks_by_code: Mapping[str, tuple[CatalogFramework, ...]]
+    framework_by_code_version: Mapping[tuple[str, str], CatalogFramework]
+    control_by_id: Mapping[UUID, CatalogControl]
+    control_by_code: Mapping[str, CatalogControl]
+    framework_control_by_id: Mapping[UUID, CatalogFrameworkControl]
+    framework_controls_by_framework: Mapping[UUID, tuple[CatalogFrameworkControl, ...]]
+    _memo: OrderedDict[Hashable, Any] = field(
+        default_factory=OrderedDict, repr=False, compare=False
+    )
+
+    @classmethod
+    def build(
+        cls,
+        frameworks: list[CatalogFramework],
+        controls: list[CatalogControl],
+        framework_controls: list[CatalogFrameworkControl],
+    ) -> "CatalogSnapshot":
+        """Index catalog rows. Input order is preserved in every tuple."""
+        frameworks_by_code: dict[str, list[CatalogFramework]] = defaultdict(list)
+        for f in frameworks:
+            frameworks_by_code[f.code].append(f)
+
+        fcs_by_framework: dict[UUID, list[CatalogFrameworkControl]] = defaultdict(list)
+        for fc in framework_controls:
+            fcs_by_framework[fc.framework_id].append(fc)
+
+        return cls(
+            version=_digest(frameworks, controls, framework_controls),
+            loaded_at=datetime.now(timezone.utc),
+            frameworks=tuple(frameworks),
+            controls=tuple(controls),
+            framework_by_id=MappingProxyType({f.id: f for f in frameworks}),
+            frameworks_by_code=MappingProxyType(
+                {code: tuple(items) for code, items in frameworks_by_code.items()}
+            ),
+            framework_by_code_version=MappingProxyType(
+                {(f.code, f.version): f for f in frameworks}
+            ),
+            control_by_id=MappingProxyType({c.id: c for c in controls}),
+            control_by_code=MappingProxyType({c.code: c for c in controls}),
+            framework_control_by_id=MappingProxyType({fc.id: fc for fc in framework_controls}),
+            framework_controls_by_framework=MappingProxyType(
+                {fid: tuple(items) for fid, items in fcs_by_framework.items()}
+            ),
+        )
+
+    def controls_for_framework(self, framework_id: UUID) -> tuple[CatalogFrameworkControl, ...]:
+        """FrameworkControls of a framework, ordered by framework_control_code."""
+        return self.framework_controls_by_framework.get(framework_id, ())
+
+    def memoize(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Compute a value derived from this snapshot once and reuse it.
+
+        The memo lives and dies with the snapshot, so a catalog reload
+        invalidates everything derived from the previous version. Past
+        `MEMO_MAX_ENTRIES` values, the least recently used is evicted.
+        """
+        try:
+            return self._recall(key)
+        except KeyError:
+            pass
+        value = factory()
+        self._remember(key, value)
+        return value
+
+    async def memoize_async(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Like `memoize`, for values that need a query against the lookup tables.
+
+        Concurrent first requests may each run the factory; the value is the
+        same for a given catalog version, so the last one simply wins.
+        """
+        try:
+            return self._recall(key)
+        except KeyError:
+            pass
+        value = await factory()
+        self._remember(key, value)
+        return value
+
+    def _recall(self, key: Hashable) -> Any:
+        value = self._memo[key]
+        self._memo.move_to_end(key)
+        return value
+
+    def _remember(self, key: Hashable, value: Any) -> None:
+        self._memo[key] = value
+        self._memo.move_to_end(key)
+        while len(self._memo) > MEMO_MAX_ENTRIES:
+            self._memo.popitem(last=False)
+
+
+def _digest(
+    frameworks: list[CatalogFramework],
+    controls: list[CatalogControl],
+    framework_controls: list[CatalogFrameworkControl],
+) -> str:
+    """Content hash of the catalog, used as its version stamp."""
+    h = hashlib.sha256()
+    for rows in (frameworks, controls, framework_controls):
+        for row in rows:
+            h.update(repr(row).encode())
+        h.update(b"\x00")
+    return h.hexdigest()[:16]
+
+
+async def load_catalog(db: AsyncSession) -> CatalogSnapshot:
+    """Read the lookup tables and build a new snapshot."""
+    framework_rows = await db.execute(
+        select(
+            Framework.id,
+            Framework.code,
+            Framework.version,
+            Framework.name,
+            Framework.description,
+            Framework.status,
+        ).order_by(Framework.code, Framework.version)
+    )
+    control_rows = await db.execute(
+        select(
+            Control.id,
+            Control.code,
+            Control.title,
+            Control.description,
+            Control.category,
+            Control.control_type,
+        ).order_by(Control.code)
+    )
+    fc_rows = await db.execute(
+        select(
+            FrameworkControl.id,
+            FrameworkControl.framework_id,
+            FrameworkControl.control_id,
+            FrameworkControl.framework_control_code,
+            FrameworkControl.is_required,
+        ).order_by(FrameworkControl.framework_control_code)
+    )
+
+    return CatalogSnapshot.build(
+        frameworks=[CatalogFramework(**row._mapping) for row in framework_rows],
+        controls=[CatalogControl(**row._mapping) for row in control_rows],
+        framework_controls=[CatalogFrameworkControl(**row._mapping) for row in fc_rows],
+    )
+
+
+class CatalogCache:
+    """
+    Holder for the snapshot served by this worker.
+
+    The snapshot is replaced as a whole on reload, so readers always see a
+    consistent catalog without locking.
+    """
+
+    def __init__(self):
+        self._snapshot: CatalogSnapshot | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def snapshot(self) -> CatalogSnapshot | None:
+        return self._snapshot
+
+    async def get(self, db: AsyncSession) -> CatalogSnapshot:
+        """Return the current snapshot, loading it on first use."""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        async with self._lock:
+            if self._snapshot is None:
+                await self._load(db)
+            return self._snapshot
+
+    async def reload(self, db: AsyncSession) -> CatalogSnapshot:
+        """Load a fresh snapshot and swap it in."""
+        async with self._lock:
+            return await self._load(db)
+
+    def clear(self) -> None:
+        """Drop the snapshot; the next `get` loads it again."""
+        self._snapshot = None
+
+    async def _load(self, db: AsyncSession) -> CatalogSnapshot:
+        snapshot = await load_catalog(db)
+        previous = self._snapshot
+        self._snapshot = snapshot
+        logger.info(
+            f"Loaded catalog {snapshot.version} "
+            f"(previous: {previous.version if previous else None}): "
+            f"{len(snapshot.frameworks)} frameworks, {len(snapshot.controls)} controls, "
+            f"{len(snapshot.framework_control_by_id)} framework controls"
+        )
+        return snapshot
+
+
+catalog_cache = CatalogCache()
+
+
+async def get_catalog(db: AsyncSession) -> CatalogSnapshot:
+    """Get the catalog snapshot served by this worker."""
+    return await catalog_cache.get(db)
+
+
+def catalog_json_response(
+    catalog: CatalogSnapshot,
+    rendered: RenderedJSON,
+    conditional: ConditionalRequest,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    Serve JSON rendered from the catalog.
+
+    The response is cacheable by clients and CDNs, carries a strong ETag and is
+    stamped with the catalog version. Clients that already hold the current
+    representation get a 304 without a body.
+    """
+    return conditional_json_response(
+        rendered,
+        conditional,
+        headers={
+            **(headers or {}),
+            "Cache-Control": settings.catalog_cache_control,
+            "X-Catalog-Version": catalog.version,
+        },
+    )
+
+
+def notify_catalog_changed(session: Session, table: str) -> None:
+    """
+    Tell every worker that the lookup catalog changed.
+
+    The notification is delivered when the session's transaction commits.
+    """
+    session.execute(select(func.pg_notify(CATALOG_CHANNEL, table)))
+
+
+class CatalogListener:
+    """
+    Reload the catalog whenever the seed runner publishes on `CATALOG_CHANNEL`.
+
+    Each worker holds one dedicated asyncpg connection for LISTEN, since pooled
+    connections are returned to the pool between requests and would drop the
+    subscription. Bursts of notifications (one per seeded table) are coalesced
+    into a single reload.
+    """
+
+    def __init__(
+        self,
+        cache: CatalogCache,
+        session_factory: async_sessionmaker,
+        dsn: str,
+        debounce: float = 0.5,
+        reconnect_delay: float = 5.0,
+    ):
+        self.cache = cache
+        self.session_factory = session_factory
+        self.dsn = dsn
+        self.debounce = debounce
+        self.reconnect_delay = reconnect_delay
+        self._conn: asyncpg.Connection | None = None
+        self._reload_task: asyncio.Task | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._dirty = False
+        self._closing = False
+
+    async def start(self) -> None:
+        """Open the LISTEN connection."""
+        self._conn = await asyncpg.connect(self.dsn)
+        self._conn.add_termination_listener(self._on_terminate)
+        await self._conn.add_listener(CATALOG_CHANNEL, self._on_notify)
+        logger.info(f"Listening for catalog changes on {CATALOG_CHANNEL}")
+
+    async def stop(self) -> None:
+        """Close the LISTEN connection and cancel pending reloads."""
+        self._closing = True
+        for task in (self._reload_task, self._reconnect_task):
+            if task and not task.done():
+                task.cancel()
+        if self._conn and not self._conn.is_closed():
+            await self._conn.close()
+
+    def _on_notify(self, conn, pid, channel, payload) -> None:
+        logger.info(f"Catalog change notified: {payload}")
+        self._schedule_reload()
+
+    def _on_terminate(self, conn) -> None:
+        if self._closing:
+            return
+        logger.warning("Catalog listener connection lost, reconnecting")
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    def _schedule_reload(self) -> None:
+        self._dirty = True
+        if self._reload_task is None or self._reload_task.done():
+            self._reload_task = asyncio.create_task(self._reload())
+
+    async def _reload(self) -> None:
+        while self._dirty:
+            self._dirty = False
+            await asyncio.sleep(self.debounce)
+            try:
+                async with self.session_factory() as session:
+                    await self.cache.reload(session)
+            except Exception as e:
+                logger.error(f"Catalog reload failed: {e}")
+
+    async def _reconnect(self) -> None:
+        while not self._closing:
+            await asyncio.sleep(self.reconnect_delay)
+            try:
+                await self.start()
+            except Exception as e:
+                logger.warning(f"Catalog listener reconnect failed: {e}")
+                continue
+            # Notifications sent while disconnected are lost, so reload anyway.
+            self._schedule_reload()
+            return
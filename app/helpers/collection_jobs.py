@@ -0,0 +1,323 @@
+"""Evidence collection job queue.
+
+Jobs live in `data.collectionjob`. A worker claims due jobs with one
+UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED) RETURNING, so
+concurrent workers never wait on, or claim, each other's rows, and commits the
+claim at once. Results are written afterwards in a second transaction, with the
+evidence of the whole batch in one INSERT and its control links in another.
+
+A failed job goes back to the queue with exponential backoff until it has used
+`max_attempts`; a job whose worker died is re-queued once its lock is older
+than the lock timeout. Results are only written for jobs still running under
+the claim that produced them, identified by (id, attempts), so a worker that
+outlived its lock cannot overwrite a later attempt.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    Integer,
+    Text,
+    and_,
+    case,
+    column,
+    func,
+    insert,
+    literal,
+    null,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid_extensions import uuid7
+
+from app.helpers.evidence_links import insert_links
+from app.models import CollectionJob, CollectionJobStatus, Evidence, EvidenceSource, EvidenceType
+
+logger = logging.getLogger(__name__)
+
+collection_job = CollectionJob.__table__
+
+
+@dataclass(frozen=True, slots=True)
+class ClaimedJob:
+    """A job claimed by a worker; `attempts` includes the current one."""
+
+    id: UUID
+    organization_id: UUID
+    org_control_id: UUID | None
+    source: EvidenceSource
+    parameters: dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+
+@dataclass(frozen=True, slots=True)
+class CollectedEvidence:
+    """One evidence artifact returned by a collector."""
+
+    title: str
+    evidence_type: EvidenceType = EvidenceType.OTHER
+    description: str | None = None
+    file_url: str | None = None
+    collected_at: datetime | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CollectionJobRequest:
+    """A job to enqueue."""
+
+    organization_id: UUID
+    source: EvidenceSource
+    org_control_id: UUID | None = None
+    parameters: dict[str, Any] = field(default_factory=dict)
+    max_attempts: int = 5
+
+
+async def enqueue_collection_jobs(
+    db: AsyncSession, requests: list[CollectionJobRequest]
+) -> list[UUID]:
+    """Queue jobs to run now, returning their ids."""
+    ids = [uuid7() for _ in requests]
+    await db.execute(
+        insert(collection_job),
+        [
+            {
+                "id": job_id,
+                "organization_id": request.organization_id,
+                "org_control_id": request.org_control_id,
+                "source": request.source,
+                "parameters": request.parameters,
+                "max_attempts": request.max_attempts,
+            }
+            for job_id, request in zip(ids, requests)
+        ],
+    )
+    return ids
+
+
+async def claim_collection_jobs(db: AsyncSession, limit: int) -> list[ClaimedJob]:
+    """
+    Claim up to `limit` due jobs, oldest first, skipping rows locked by others.
+
+    Claimed jobs are marked running and their attempt counted. The caller
+    should commit straight away, so the locks are held only for the claim.
+    """
+    due = (
+        select(collection_job.c.id)
+        .where(collection_job.c.status == CollectionJobStatus.QUEUED)
+        .where(collection_job.c.run_at <= func.now())
+        .order_by(collection_job.c.run_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(
+        update(collection_job)
+        .where(collection_job.c.id.in_(due))
+        .values(
+            status=CollectionJobStatus.RUNNING,
+            attempts=collection_job.c.attempts + 1,
+            locked_at=func.now(),
+        )
+        .returning(
+            collection_job.c.id,
+            collection_job.c.organization_id,
+            collection_job.c.org_control_id,
+            collection_job.c.source,
+            collection_job.c.parameters,
+            collection_job.c.attempts,
+            collection_job.c.max_attempts,
+        )
+    )
+    return [ClaimedJob(**row._mapping) for row in result]
+
+
+def validate_collected_evidence(items: list[CollectedEvidence]) -> str | None:
+    """Why a job's evidence cannot be stored, or None if every item fits the Evidence columns."""
+    title_length = Evidence.title.type.length
+    file_url_length = Evidence.file_url.type.length
+    for i, item in enumerate(items):
+        if not item.title or not item.title.strip():
+            return f"Evidence {i + 1} has no title"
+        if len(item.title) > title_length:
+            return f"Evidence {i + 1} title is longer than {title_length} characters"
+        if item.file_url is not None and len(item.file_url) > file_url_length:
+            return f"Evidence {i + 1} file_url is longer than {file_url_length} characters"
+    return None
+
+
+def _claims(rows: list[tuple], *extra_columns):
+    """VALUES of (job id, claimed attempts, *extra_columns) rows."""
+    return values(
+        column("id", collection_job.c.id.type),
+        column("attempts", Integer),
+        *extra_columns,
+        name="claims",
+    ).data(rows)
+
+
+def _holds_claim(claims):
+    return and_(
+        collection_job.c.id == claims.c.id,
+        collection_job.c.attempts == claims.c.attempts,
+        collection_job.c.status == CollectionJobStatus.RUNNING,
+    )
+
+
+async def lock_claimed_jobs(db: AsyncSession, jobs: list[ClaimedJob]) -> set[UUID]:
+    """
+    Lock the jobs still running under the given claims and return their ids.
+
+    Jobs re-queued by the reaper since, or claimed again, are left out. The
+    locks keep the reaper off the returned jobs until the transaction ends.
+    """
+    if not jobs:
+        return set()
+    claims = _claims([(job.id, job.attempts) for job in jobs])
+    result = await db.execute(
+        select(collection_job.c.id)
+        .where(_holds_claim(claims))
+        .order_by(collection_job.c.id)
+        .with_for_update(of=collection_job)
+    )
+    return set(result.scalars())
+
+
+async def save_collected_evidence(
+    db: AsyncSession, results: list[tuple[ClaimedJob, list[CollectedEvidence]]]
+) -> int:
+    """
+    Insert the evidence of many jobs at once and link it to the jobs' controls.
+
+    Returns the number of evidence rows written.
+    """
+    rows = []
+    links: list[tuple[UUID, UUID]] = []
+    for job, items in results:
+        for item in items:
+            evidence_id = uuid7()
+            collected_at = item.collected_at
+            if collected_at is not None and collected_at.tzinfo is not None:
+                collected_at = collected_at.astimezone(timezone.utc).replace(tzinfo=None)
+            rows.append(
+                {
+                    "id": evidence_id,
+                    "organization_id": job.organization_id,
+                    "title": item.title,
+                    "description": item.description,
+                    "evidence_type": item.evidence_type,
+                    "file_url": item.file_url,
+                    "source": job.source,
+                    "collected_at": collected_at,
+                }
+            )
+            if job.org_control_id is not None:
+                links.append((evidence_id, job.org_control_id))
+
+    if rows:
+        await db.execute(insert(Evidence), rows)
+    if links:
+        # Job controls belong to the job's organization, and the evidence is new
+        await insert_links(db, links)
+    return len(rows)
+
+
+async def complete_collection_jobs(db: AsyncSession, jobs: list[ClaimedJob]) -> int:
+    """Mark jobs as succeeded, unless their claim was lost. Returns the number marked."""
+    if not jobs:
+        return 0
+    claims = _claims([(job.id, job.attempts) for job in jobs])
+    result = await db.execute(
+        update(collection_job)
+        .where(_holds_claim(claims))
+        .values(status=CollectionJobStatus.SUCCEEDED, locked_at=None, last_error=None)
+        .returning(collection_job.c.id)
+    )
+    return len(result.all())
+
+
+def _retry_delay(attempts, retry_base: float, retry_max: float):
+    return func.least(literal(retry_base) * func.power(2, attempts - 1), literal(retry_max))
+
+
+def _next_status(attempts, max_attempts):
+    return case(
+        (
+            attempts >= max_attempts,
+            literal(CollectionJobStatus.FAILED, collection_job.c.status.type),
+        ),
+        else_=literal(CollectionJobStatus.QUEUED, collection_job.c.status.type),
+    )
+
+
+async def retry_collection_jobs(
+    db: AsyncSession,
+    errors: list[tuple[ClaimedJob, str]],
+    retry_base: float,
+    retry_max: float,
+) -> dict[CollectionJobStatus, int]:
+    """
+    Record failed attempts, in one UPDATE.
+
+    Jobs with attempts left are queued again after `retry_base` seconds,
+    doubled per attempt up to `retry_max`; the others are marked failed. Jobs
+    whose claim was lost are not touched. Returns the number of jobs per
+    resulting status.
+    """
+    if not errors:
+        return {}
+    failures = _claims(
+        [(job.id, job.attempts, error) for job, error in errors], column("error", Text)
+    )
+    delay = _retry_delay(collection_job.c.attempts, retry_base, retry_max)
+    result = await db.execute(
+        update(collection_job)
+        .where(_holds_claim(failures))
+        .values(
+            status=_next_status(collection_job.c.attempts, collection_job.c.max_attempts),
+            run_at=func.now() + func.make_interval(0, 0, 0, 0, 0, 0, delay),
+            locked_at=None,
+            last_error=failures.c.error,
+        )
+        .returning(collection_job.c.status)
+    )
+    counts: dict[CollectionJobStatus, int] = defaultdict(int)
+    for (status,) in result:
+        counts[status] += 1
+    return dict(counts)
+
+
+async def requeue_stale_collection_jobs(db: AsyncSession, lock_timeout: float) -> int:
+    """
+    Release jobs whose worker has held them longer than `lock_timeout` seconds.
+
+    Such a worker is assumed dead: its attempt counts as failed, and the job is
+    queued again at once, or marked failed if it has no attempts left.
+    """
+    result = await db.execute(
+        update(collection_job)
+        .where(
+            and_(
+                collection_job.c.status == CollectionJobStatus.RUNNING,
+                collection_job.c.locked_at
+                < func.now() - func.make_interval(0, 0, 0, 0, 0, 0, lock_timeout),
+            )
+        )
+        .values(
+            status=_next_status(collection_job.c.attempts, collection_job.c.max_attempts),
+            run_at=func.now(),
+            locked_at=null(),
+            last_error="Worker lock timed out",
+        )
+        .returning(collection_job.c.id)
+    )
+    stale = len(result.all())
+    if stale:
+        logger.warning(f"Re-queued {stale} collection jobs with expired locks")
+    return stale
@@ -0,0 +1,195 @@
+"""Evidence collection worker.
+
+`EvidenceCollectorWorker` runs a pool of asyncio tasks over the collection job
+queue. Each task claims a batch of due jobs, runs the batch's collectors
+concurrently, then writes all collected evidence and every job's outcome in
+one transaction. A reaper task re-queues jobs whose worker died mid-batch.
+
+Collectors are cut off after `collect_timeout`, well inside `lock_timeout`, so
+a batch is normally saved before the reaper may take its jobs back; if it was
+not, the results of the jobs whose claim was lost are dropped.
+"""
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.collectors import CollectorRegistry
+from app.helpers.collection_jobs import (
+    ClaimedJob,
+    CollectedEvidence,
+    claim_collection_jobs,
+    complete_collection_jobs,
+    lock_claimed_jobs,
+    requeue_stale_collection_jobs,
+    retry_collection_jobs,
+    save_collected_evidence,
+    validate_collected_evidence,
+)
+from app.models import CollectionJobStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class WorkerStats:
+    """Running totals of a worker."""
+
+    succeeded: int = 0
+    retried: int = 0
+    failed: int = 0
+    evidence: int = 0
+
+
+class EvidenceCollectorWorker:
+    """
+    Pool of `concurrency` tasks draining the collection job queue.
+
+    Jobs are dispatched to `collectors` by their EvidenceSource. Failed
+    attempts are retried after `retry_base` seconds, doubled per attempt up to
+    `retry_max`, and jobs locked for more than `lock_timeout` seconds are
+    re-queued. A collector running longer than `collect_timeout` seconds (half
+    of `lock_timeout` by default) fails its attempt, leaving the rest of the
+    lock for saving the batch.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        collectors: CollectorRegistry,
+        concurrency: int = 4,
+        batch_size: int = 10,
+        poll_interval: float = 1.0,
+        lock_timeout: float = 300.0,
+        retry_base: float = 30.0,
+        retry_max: float = 3600.0,
+        collect_timeout: float | None = None,
+    ):
+        if collect_timeout is None:
+            collect_timeout = lock_timeout / 2
+        if not 0 < collect_timeout < lock_timeout:
+            raise ValueError("collect_timeout must be positive and shorter than lock_timeout")
+        self.session_factory = session_factory
+        self.collectors = collectors
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lock_timeout = lock_timeout
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.collect_timeout = collect_timeout
+        self.stats = WorkerStats()
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Process jobs until `stop` is set; batches in flight are finished."""
+        tasks = [asyncio.create_task(self._poll(stop)) for _ in range(self.concurrency)]
+        reaper = asyncio.create_task(self._reap(stop))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            reaper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await reaper
+
+    async def drain(self) -> WorkerStats:
+        """Process jobs until none is due, then return the totals."""
+        await asyncio.gather(*(self._drain() for _ in range(self.concurrency)))
+        return self.stats
+
+    async def run_once(self) -> int:
+        """Claim and process one batch of due jobs. Returns the number of jobs claimed."""
+        async with self.session_factory() as session:
+            jobs = await claim_collection_jobs(session, self.batch_size)
+            await session.commit()
+        if not jobs:
+            return 0
+
+        outcomes = await asyncio.gather(*(self._collect(job) for job in jobs))
+        results: list[tuple[ClaimedJob, list[CollectedEvidence]]] = []
+        errors: list[tuple[ClaimedJob, str]] = []
+        for job, items, error in outcomes:
+            # One job's unstorable evidence must not fail the batch's INSERT
+            error = error or validate_collected_evidence(items)
+            if error is None:
+                results.append((job, items))
+            else:
+                errors.append((job, error))
+        try:
+            async with self.session_factory() as session:
+                held = await lock_claimed_jobs(session, jobs)
+                results = [(job, items) for job, items in results if job.id in held]
+                errors = [(job, error) for job, error in errors if job.id in held]
+                written = await save_collected_evidence(session, results)
+                succeeded = await complete_collection_jobs(session, [job for job, _ in results])
+                retried = await retry_collection_jobs(
+                    session, errors, self.retry_base, self.retry_max
+                )
+                await session.commit()
+        except Exception as e:
+            # Nothing of the batch was written; every job is retried
+            logger.error(f"Saving collection batch failed: {e}")
+            errors = [(job, f"Saving results failed: {e}") for job in jobs]
+            async with self.session_factory() as session:
+                retried = await retry_collection_jobs(
+                    session, errors, self.retry_base, self.retry_max
+                )
+                await session.commit()
+            held, written, succeeded = {job.id for job in jobs}, 0, 0
+
+        lost = len(jobs) - len(held)
+        if lost:
+            logger.warning(f"Dropped the results of {lost} collection jobs whose claim was lost")
+        self.stats.succeeded += succeeded
+        self.stats.retried += retried.get(CollectionJobStatus.QUEUED, 0)
+        self.stats.failed += retried.get(CollectionJobStatus.FAILED, 0)
+        self.stats.evidence += written
+        logger.info(
+            f"Processed {len(jobs)} collection jobs: {succeeded} succeeded, "
+            f"{len(errors)} failed, {written} evidence written"
+        )
+        return len(jobs)
+
+    async def _collect(
+        self, job: ClaimedJob
+    ) -> tuple[ClaimedJob, list[CollectedEvidence], str | None]:
+        collector = self.collectors.get(job.source)
+        if collector is None:
+            return job, [], f"No collector for source {job.source.value}"
+        try:
+            items = await asyncio.wait_for(collector.collect(job), self.collect_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Collection job {job.id} attempt {job.attempts} timed out")
+            return job, [], f"Collector timed out after {self.collect_timeout:g}s"
+        except Exception as e:
+            logger.warning(f"Collection job {job.id} attempt {job.attempts} failed: {e!r}")
+            return job, [], f"{type(e).__name__}: {e}"
+        return job, items, None
+
+    async def _poll(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Collection worker batch failed: {e}")
+                claimed = 0
+            if not claimed:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(stop.wait(), self.poll_interval)
+
+    async def _drain(self) -> None:
+        while await self.run_once():
+            pass
+
+    async def _reap(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                async with self.session_factory() as session:
+                    await requeue_stale_collection_jobs(session, self.lock_timeout)
+                    await session.commit()
+            except Exception as e:
+                logger.error(f"Re-queueing stale collection jobs failed: {e}")
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop.wait(), self.lock_timeout / 2)
@@ -0,0 +1,143 @@
+"""Set-based evidence-to-control linking.
+
+Links are created for many (evidence, control) pairs at once. Ownership of
+every control and evidence is checked with one query outer-joining the pairs
+to `data.orgcontrol` and `data.evidence`; the links are then written with one
+INSERT ... SELECT ... ON CONFLICT DO NOTHING on `uq_control_evidence`, whose
+RETURNING clause tells new links from existing ones. Concurrent requests for
+the same link cannot both create it.
+"""
+
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import and_, column, literal, or_, select, values
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers.org_controls import shift_evidence_counts
+from app.models import ControlEvidence, Evidence, OrgControl, OrgFramework
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class EvidenceLinks:
+    """Requested (evidence_id, control_id) pairs, split into new and existing links."""
+
+    linked: list[tuple[UUID, UUID]]
+    already_linked: list[tuple[UUID, UUID]]
+
+
+def _pairs_values(pairs: list[tuple[UUID, UUID]]):
+    return values(
+        column("evidence_id", ControlEvidence.evidence_id.type),
+        column("org_control_id", ControlEvidence.org_control_id.type),
+        name="pairs",
+    ).data(pairs)
+
+
+async def check_link_ownership(
+    db: AsyncSession, organization_id: UUID, pairs: list[tuple[UUID, UUID]]
+) -> None:
+    """Raise 404 unless every control and evidence of `pairs` belongs to the organization."""
+    requested = _pairs_values(pairs)
+    result = await db.execute(
+        select(
+            requested.c.evidence_id,
+            requested.c.org_control_id,
+            Evidence.id.label("found_evidence_id"),
+            OrgFramework.id.label("found_org_framework_id"),
+        )
+        .select_from(requested)
+        .outerjoin(OrgControl, OrgControl.id == requested.c.org_control_id)
+        .outerjoin(
+            OrgFramework,
+            and_(
+                OrgFramework.id == OrgControl.org_framework_id,
+                OrgFramework.organization_id == organization_id,
+            ),
+        )
+        .outerjoin(
+            Evidence,
+            and_(
+                Evidence.id == requested.c.evidence_id,
+                Evidence.organization_id == organization_id,
+            ),
+        )
+        .where(or_(OrgFramework.id.is_(None), Evidence.id.is_(None)))
+    )
+    rows = result.all()
+    missing_controls = sorted(
+        {str(row.org_control_id) for row in rows if row.found_org_framework_id is None}
+    )
+    missing_evidence = sorted(
+        {str(row.evidence_id) for row in rows if row.found_evidence_id is None}
+    )
+    if len(pairs) == 1 and missing_controls:
+        raise HTTPException(status_code=404, detail="Control not found")
+    if len(pairs) == 1 and missing_evidence:
+        raise HTTPException(status_code=404, detail="Evidence not found")
+    if missing_controls:
+        raise HTTPException(
+            status_code=404, detail=f"Controls not found: {', '.join(missing_controls)}"
+        )
+    if missing_evidence:
+        raise HTTPException(
+            status_code=404, detail=f"Evidence not found: {', '.join(missing_evidence)}"
+        )
+
+
+async def insert_links(db: AsyncSession, pairs: list[tuple[UUID, UUID]]) -> set[tuple[UUID, UUID]]:
+    """
+    Insert the (evidence_id, control_id) links that do not exist yet and return them.
+
+    Ownership is not checked. Evidence counts of the controls are shifted by
+    the number of new links.
+    """
+    requested = _pairs_values(pairs)
+    result = await db.execute(
+        postgresql.insert(ControlEvidence)
+        .from_select(
+            ["evidence_id", "org_control_id", "linked_at"],
+            select(
+                requested.c.evidence_id,
+                requested.c.org_control_id,
+                literal(datetime.utcnow(), ControlEvidence.linked_at.type),
+            ),
+            include_defaults=False,
+        )
+        .on_conflict_do_nothing(constraint="uq_control_evidence")
+        .returning(ControlEvidence.evidence_id, ControlEvidence.org_control_id)
+    )
+    created = {(row.evidence_id, row.org_control_id) for row in result}
+    await shift_evidence_counts(db, Counter(control_id for _, control_id in created))
+    return created
+
+
+async def link_evidence(
+    db: AsyncSession, organization_id: UUID, pairs: list[tuple[UUID, UUID]]
+) -> EvidenceLinks:
+    """
+    Link each (evidence_id, control_id) pair, skipping links that already exist.
+
+    Raises 404, before anything is written, if any control or evidence does
+    not belong to the organization. Repeated pairs are linked once.
+    """
+    pairs = list(dict.fromkeys(pairs))
+    await check_link_ownership(db, organization_id, pairs)
+
+    created = await insert_links(db, pairs)
+    links = EvidenceLinks(
+        linked=[pair for pair in pairs if pair in created],
+        already_linked=[pair for pair in pairs if pair not in created],
+    )
+    logger.info(
+        f"Linked {len(links.linked)} evidence links for organization {organization_id}, "
+        f"{len(links.already_linked)} already existed"
+    )
+    return links
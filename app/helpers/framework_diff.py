@@ -0,0 +1,119 @@
+"""Differences between two versions of a framework.
+
+Versions are compared by the `lookup.control` each FrameworkControl maps. One
+query full-outer-joins the two versions' rows of `lookup.frameworkcontrol` on
+`control_id`, keeping only controls that were added, removed, remapped to a
+new framework control code or whose `is_required` flag changed.
+"""
+
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers.catalog import CatalogFramework, CatalogSnapshot
+from app.models import Control, FrameworkControl
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ControlDiff:
+    """One control that differs between two framework versions."""
+
+    control_id: UUID
+    control_code: str
+    control_title: str
+    from_framework_control_code: str | None
+    to_framework_control_code: str | None
+    from_is_required: bool | None
+    to_is_required: bool | None
+
+
+@dataclass(frozen=True, slots=True)
+class FrameworkDiff:
+    """Controls added, removed, remapped and with changed requirement."""
+
+    added: list[ControlDiff]
+    removed: list[ControlDiff]
+    remapped: list[ControlDiff]
+    requirement_changed: list[ControlDiff]
+
+
+def check_diffable(
+    catalog: CatalogSnapshot, from_framework_id: UUID, to_framework_id: UUID
+) -> tuple[CatalogFramework, CatalogFramework]:
+    """Return both frameworks, raising unless they are versions of one framework."""
+    source = catalog.framework_by_id.get(from_framework_id)
+    target = catalog.framework_by_id.get(to_framework_id)
+    if source is None or target is None:
+        raise HTTPException(status_code=404, detail="Framework not found")
+    if source.code != target.code:
+        raise HTTPException(
+            status_code=400, detail=f"Framework {target.id} is not a version of {source.code}"
+        )
+    return source, target
+
+
+async def diff_framework_versions(
+    db: AsyncSession, from_framework_id: UUID, to_framework_id: UUID
+) -> FrameworkDiff:
+    """Compare the controls of two framework versions with a single query."""
+    source = (
+        select(FrameworkControl)
+        .where(FrameworkControl.framework_id == from_framework_id)
+        .subquery("source")
+    )
+    target = (
+        select(FrameworkControl)
+        .where(FrameworkControl.framework_id == to_framework_id)
+        .subquery("target")
+    )
+    control_id = func.coalesce(source.c.control_id, target.c.control_id)
+    result = await db.execute(
+        select(
+            Control.id.label("control_id"),
+            Control.code.label("control_code"),
+            Control.title.label("control_title"),
+            source.c.framework_control_code.label("from_framework_control_code"),
+            target.c.framework_control_code.label("to_framework_control_code"),
+            source.c.is_required.label("from_is_required"),
+            target.c.is_required.label("to_is_required"),
+        )
+        .select_from(source)
+        .join(target, source.c.control_id == target.c.control_id, full=True)
+        .join(Control, Control.id == control_id)
+        .where(
+            or_(
+                source.c.id.is_(None),
+                target.c.id.is_(None),
+                source.c.framework_control_code != target.c.framework_control_code,
+                source.c.is_required != target.c.is_required,
+            )
+        )
+        .order_by(Control.code)
+    )
+
+    diff = FrameworkDiff(added=[], removed=[], remapped=[], requirement_changed=[])
+    for row in result:
+        control = ControlDiff(**row._mapping)
+        if control.from_framework_control_code is None:
+            diff.added.append(control)
+        elif control.to_framework_control_code is None:
+            diff.removed.append(control)
+        else:
+            # A control can be both remapped and change requirement
+            if control.from_framework_control_code != control.to_framework_control_code:
+                diff.remapped.append(control)
+            if control.from_is_required != control.to_is_required:
+                diff.requirement_changed.append(control)
+
+    logger.info(
+        f"Diffed framework {from_framework_id} to {to_framework_id}: "
+        f"{len(diff.added)} added, {len(diff.removed)} removed, {len(diff.remapped)} remapped, "
+        f"{len(diff.requirement_changed)} requirement changed"
+    )
+    return diff
@@ -0,0 +1,94 @@
+"""Freshness checks for organization-scoped reads.
+
+Each function answers, with a single aggregate query, whether anything behind
+an endpoint changed since the client's last poll. The result feeds the ETag and
+Last-Modified validators, so a revalidation that ends in 304 never loads ORM
+objects or recomputes readiness.
+
+Every function returns None when the organization (or adoption) does not
+exist, leaving the regular code path to produce the 404.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Select, and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers.http import ResourceState
+from app.models import Evidence, Organization, OrgControl, OrgFramework
+
+
+def _aggregates(updated_at):
+    """Row count, newest change and a checksum that moves on any change."""
+    return (
+        func.count(updated_at),
+        func.max(updated_at),
+        func.sum(func.extract("epoch", updated_at)),
+    )
+
+
+async def _state(db: AsyncSession, stmt: Select, *extra) -> ResourceState | None:
+    """
+    Run a freshness query and fingerprint its row.
+
+    The first column is a baseline timestamp for empty collections, followed
+    by `_aggregates` and any further columns; every timestamp in the row
+    counts towards Last-Modified.
+    """
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        return None
+    last_modified = max(value for value in row if isinstance(value, datetime))
+    return ResourceState.fingerprint(last_modified, *row[1:], *extra)
+
+
+async def adopted_frameworks_state(db: AsyncSession, slug: str) -> ResourceState | None:
+    """State of the frameworks adopted by an organization."""
+    stmt = (
+        select(Organization.created_at, *_aggregates(OrgFramework.updated_at))
+        .select_from(Organization)
+        .outerjoin(OrgFramework, OrgFramework.organization_id == Organization.id)
+        .where(Organization.slug == slug)
+        .group_by(Organization.id)
+    )
+    return await _state(db, stmt)
+
+
+async def evidence_state(db: AsyncSession, slug: str) -> ResourceState | None:
+    """State of an organization's evidence."""
+    stmt = (
+        select(Organization.created_at, *_aggregates(Evidence.updated_at))
+        .select_from(Organization)
+        .outerjoin(Evidence, Evidence.organization_id == Organization.id)
+        .where(Organization.slug == slug)
+        .group_by(Organization.id)
+    )
+    return await _state(db, stmt)
+
+
+async def org_controls_state(
+    db: AsyncSession, slug: str, framework_id: UUID, catalog_version: str
+) -> ResourceState | None:
+    """
+    State of the OrgControls of an adopted framework.
+
+    Control codes and titles come from the catalog, so its version is part of
+    the state. Evidence links are covered through `orgcontrol.evidence_count`,
+    which moves `updated_at` on every link change.
+    """
+    stmt = (
+        select(OrgFramework.updated_at, *_aggregates(OrgControl.updated_at))
+        .select_from(Organization)
+        .join(
+            OrgFramework,
+            and_(
+                OrgFramework.organization_id == Organization.id,
+                OrgFramework.framework_id == framework_id,
+            ),
+        )
+        .outerjoin(OrgControl, OrgControl.org_framework_id == OrgFramework.id)
+        .where(Organization.slug == slug)
+        .group_by(OrgFramework.id)
+    )
+    return await _state(db, stmt, catalog_version)
@@ -0,0 +1,126 @@
+"""HTTP caching helpers for conditional GET requests."""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Header, Response
+
+# Org data changes at any time: clients may keep a copy but must revalidate it.
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedJSON:
+    """A JSON body rendered ahead of time, with its strong ETag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "RenderedJSON":
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceState:
+    """Validators describing the current state of a resource."""
+
+    etag: str
+    last_modified: datetime | None = None
+
+    @classmethod
+    def fingerprint(cls, last_modified: datetime | None, *parts) -> "ResourceState":
+        """
+        Weak ETag derived from cheap aggregates rather than the rendered body.
+
+        `parts` must change whenever the representation would.
+        """
+        digest = hashlib.sha256(repr((last_modified, *parts)).encode()).hexdigest()[:32]
+        return cls(etag=f'W/"{digest}"', last_modified=last_modified)
+
+    def varied(self, *parts) -> "ResourceState":
+        """The state of one variant of the resource, such as a page of a list."""
+        return ResourceState.fingerprint(self.last_modified, self.etag, *parts)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": PRIVATE_CACHE_CONTROL}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                self.last_modified.astimezone(timezone.utc), usegmt=True
+            )
+        return headers
+
+
+@dataclass(frozen=True, slots=True)
+class ConditionalRequest:
+    """Validators sent by the client to revalidate its cached copy."""
+
+    if_none_match: str | None = None
+    if_modified_since: str | None = None
+    response: Response | None = None
+
+    def etag_matches(self, etag: str) -> bool:
+        """Whether `If-None-Match` lists `etag` (weak comparison, RFC 9110 13.1.2)."""
+        if not self.if_none_match:
+            return False
+        candidates = [tag.strip() for tag in self.if_none_match.split(",")]
+        return "*" in candidates or _opaque(etag) in {_opaque(tag) for tag in candidates}
+
+    def is_fresh(self, state: ResourceState) -> bool:
+        """
+        Whether the client's copy is current.
+
+        `If-Modified-Since` is only consulted when `If-None-Match` is absent.
+        """
+        if self.if_none_match:
+            return self.etag_matches(state.etag)
+        if not self.if_modified_since or state.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(self.if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return state.last_modified.replace(microsecond=0) <= since
+
+    def not_modified(self, state: ResourceState) -> Response:
+        """A bodiless 304 carrying the current validators."""
+        return Response(status_code=304, headers=state.headers)
+
+    def apply(self, state: ResourceState | None) -> None:
+        """Attach the validators to the outgoing 200 response."""
+        if state is not None and self.response is not None:
+            self.response.headers.update(state.headers)
+
+
+def _opaque(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def get_conditional_request(
+    response: Response,
+    if_none_match: str | None = Header(None),
+    if_modified_since: str | None = Header(None),
+) -> ConditionalRequest:
+    """Dependency that collects the conditional request headers."""
+    return ConditionalRequest(
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
+        response=response,
+    )
+
+
+def conditional_json_response(
+    rendered: RenderedJSON,
+    conditional: ConditionalRequest,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Return `rendered`, or a bodiless 304 if the client already has it."""
+    headers = {**(headers or {}), "ETag": rendered.etag}
+    if conditional.etag_matches(rendered.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=rendered.body, media_type="application/json", headers=headers)
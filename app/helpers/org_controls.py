@@ -0,0 +1,253 @@
+"""Set-based OrgControl updates.
+
+A batch of control changes is validated with one locking SELECT and applied
+with a single UPDATE ... FROM (VALUES ...), optionally propagated to every
+OrgControl backed by the same `lookup.control`. Response rows are built from the
+UPDATE's RETURNING clause and the in-memory catalog, so no OrgControl objects
+are loaded.
+
+`orgcontrol.evidence_count` is kept in step with `data.controlevidence` by
+`shift_evidence_counts`, called in the same transaction as every link change.
+"""
+
+import logging
+from typing import Mapping
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import (
+    Date,
+    Integer,
+    Select,
+    Text,
+    cast,
+    column,
+    func,
+    null,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.helpers.audit import StatusChange, record_status_changes
+from app.helpers.catalog import CatalogSnapshot
+from app.helpers.readiness import shift_readiness_counters
+from app.models import ControlEvidence, FrameworkControl, OrgControl, OrgFramework
+from app.schemas.organization import OrgControlBatchItem, OrgControlResponse
+
+logger = logging.getLogger(__name__)
+
+org_control = OrgControl.__table__
+framework_control = FrameworkControl.__table__
+
+
+def org_control_response(catalog: CatalogSnapshot, row) -> OrgControlResponse:
+    """Build an OrgControlResponse from an OrgControl row and the catalog."""
+    fc = catalog.framework_control_by_id[row.framework_control_id]
+    control = catalog.control_by_id[fc.control_id]
+    return OrgControlResponse(
+        id=row.id,
+        org_framework_id=row.org_framework_id,
+        framework_control_id=row.framework_control_id,
+        framework_control_code=fc.framework_control_code,
+        control_code=control.code,
+        control_title=control.title,
+        status=row.status,
+        due_date=row.due_date,
+        notes=row.notes,
+        evidence_count=row.evidence_count,
+    )
+
+
+async def shift_evidence_counts(db: AsyncSession, deltas: Mapping[UUID, int]) -> None:
+    """
+    Add `deltas[id]` to the evidence count of each OrgControl, in one UPDATE.
+
+    Linking adds 1 per new link; unlinking, or deleting evidence (whose links
+    cascade), subtracts 1 per removed link.
+    """
+    deltas = {org_control_id: delta for org_control_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    changes = values(
+        column("id", org_control.c.id.type), column("delta", Integer), name="deltas"
+    ).data(list(deltas.items()))
+    await db.execute(
+        update(org_control)
+        .where(org_control.c.id == changes.c.id)
+        .values(evidence_count=org_control.c.evidence_count + changes.c.delta)
+    )
+
+
+def evidence_count_drift_query() -> Select:
+    """OrgControls whose evidence count disagrees with their ControlEvidence rows."""
+    links = (
+        select(func.count())
+        .where(ControlEvidence.org_control_id == org_control.c.id)
+        .scalar_subquery()
+    )
+    return (
+        select(org_control.c.id, org_control.c.evidence_count, links.label("actual"))
+        .where(org_control.c.evidence_count != links)
+        .order_by(org_control.c.id)
+    )
+
+
+async def lock_org_controls(
+    db: AsyncSession, organization_id: UUID, control_ids: list[UUID], propagate: bool = False
+):
+    """
+    Lock the organization's OrgControls among `control_ids`, keyed by id.
+
+    With `propagate`, every OrgControl of the organization backed by the same
+    `lookup.control` as one of `control_ids` is locked too. Rows are locked in
+    id order, so concurrent batches cannot deadlock.
+    """
+    stmt = (
+        select(
+            OrgControl.id,
+            OrgControl.org_framework_id,
+            OrgControl.framework_control_id,
+            OrgControl.status,
+        )
+        .join(OrgFramework, OrgFramework.id == OrgControl.org_framework_id)
+        .where(OrgFramework.organization_id == organization_id)
+    )
+    if propagate:
+        target = aliased(OrgControl)
+        target_fc = aliased(FrameworkControl)
+        shared_control_ids = (
+            select(target_fc.control_id)
+            .join(target, target.framework_control_id == target_fc.id)
+            .where(target.id.in_(control_ids))
+        )
+        stmt = stmt.join(
+            FrameworkControl, FrameworkControl.id == OrgControl.framework_control_id
+        ).where(FrameworkControl.control_id.in_(shared_control_ids))
+    else:
+        stmt = stmt.where(OrgControl.id.in_(control_ids))
+
+    result = await db.execute(stmt.order_by(OrgControl.id).with_for_update(of=OrgControl))
+    return {row.id: row for row in result}
+
+
+def _changes_values(key: str, rows: list[tuple]):
+    """
+    Changes as a VALUES list of (key, status, due_date, notes).
+
+    NULLs are typed so that columns that are NULL in every row still resolve.
+    """
+    columns = [
+        column(key, org_control.c.id.type),
+        column("status", org_control.c.status.type),
+        column("due_date", Date),
+        column("notes", Text),
+    ]
+    return values(*columns, name="changes").data(
+        [
+            tuple(
+                cast(null(), col.type) if value is None else value
+                for col, value in zip(columns, row)
+            )
+            for row in rows
+        ]
+    )
+
+
+async def batch_update_org_controls(
+    db: AsyncSession,
+    catalog: CatalogSnapshot,
+    organization_id: UUID,
+    updates: list[OrgControlBatchItem],
+    propagate: bool = False,
+) -> list[OrgControlResponse]:
+    """
+    Apply many control updates with one UPDATE and return the updated rows.
+
+    As with a single update, fields left as None are not changed. Raises 404
+    if any control does not belong to the organization, before anything is
+    written. Readiness counters and the status event log are kept in step.
+
+    With `propagate`, each change is also applied to every other OrgControl of
+    the organization backed by the same `lookup.control`, e.g. the MFA control
+    in SOC 2, PCI DSS and ISO 27001. The UPDATE then matches rows through
+    `lookup.frameworkcontrol` instead of by id. Propagated rows follow the
+    requested ones in the result.
+    """
+    control_ids = [item.control_id for item in updates]
+    if len(set(control_ids)) != len(control_ids):
+        raise HTTPException(status_code=400, detail="Duplicate control_id in batch")
+
+    current = await lock_org_controls(db, organization_id, control_ids, propagate)
+    missing = [str(control_id) for control_id in control_ids if control_id not in current]
+    if len(control_ids) == 1 and missing:
+        raise HTTPException(status_code=404, detail="Control not found")
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Controls not found: {', '.join(missing)}")
+
+    if propagate:
+        # Key each change by the lookup.control behind the requested OrgControl
+        by_control: dict[UUID, OrgControlBatchItem] = {}
+        for item in updates:
+            fc = catalog.framework_control_by_id[current[item.control_id].framework_control_id]
+            if by_control.setdefault(fc.control_id, item) is not item:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Controls {by_control[fc.control_id].control_id} and "
+                    f"{item.control_id} share a control and cannot both be propagated",
+                )
+        changes = _changes_values(
+            "control_id",
+            [
+                (control_id, item.status, item.due_date, item.notes)
+                for control_id, item in by_control.items()
+            ],
+        )
+        stmt = (
+            update(org_control)
+            .where(org_control.c.framework_control_id == framework_control.c.id)
+            .where(framework_control.c.control_id == changes.c.control_id)
+            .where(org_control.c.id.in_(list(current)))
+        )
+    else:
+        changes = _changes_values(
+            "id",
+            [(item.control_id, item.status, item.due_date, item.notes) for item in updates],
+        )
+        stmt = update(org_control).where(org_control.c.id == changes.c.id)
+
+    result = await db.execute(
+        stmt.values(
+            status=func.coalesce(changes.c.status, org_control.c.status),
+            due_date=func.coalesce(changes.c.due_date, org_control.c.due_date),
+            notes=func.coalesce(changes.c.notes, org_control.c.notes),
+        ).returning(
+            org_control.c.id,
+            org_control.c.org_framework_id,
+            org_control.c.framework_control_id,
+            org_control.c.status,
+            org_control.c.due_date,
+            org_control.c.notes,
+            org_control.c.evidence_count,
+        )
+    )
+    rows = {row.id: row for row in result}
+
+    status_changes = [
+        StatusChange(row.org_framework_id, row.id, current[row.id].status, row.status)
+        for row in rows.values()
+        if current[row.id].status != row.status
+    ]
+    if status_changes:
+        await shift_readiness_counters(db, status_changes)
+        await record_status_changes(db, status_changes)
+
+    logger.info(
+        f"Updated {len(rows)} org controls ({len(rows) - len(control_ids)} propagated), "
+        f"{len(status_changes)} status changes"
+    )
+    requested = set(control_ids)
+    ordered = control_ids + sorted(row_id for row_id in rows if row_id not in requested)
+    return [org_control_response(catalog, rows[row_id]) for row_id in ordered]
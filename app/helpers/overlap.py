@@ -0,0 +1,70 @@
+"""Control overlap between frameworks.
+
+The reusable control library maps one `lookup.control` into many frameworks.
+`OverlapIndex` is the bipartite control <-> framework graph of
+`lookup.frameworkcontrol`, built from the catalog snapshot. Each framework's
+controls are held as a bitset (a Python int, one bit per control), so the
+shared controls of two frameworks are a single AND and a popcount rather than
+a set intersection over control ids.
+"""
+
+from dataclasses import dataclass
+from typing import Mapping
+from uuid import UUID
+
+from app.helpers.catalog import CatalogFramework, CatalogSnapshot
+
+
+@dataclass(frozen=True, slots=True)
+class OverlapIndex:
+    """Control <-> framework index with the precomputed overlap matrix."""
+
+    frameworks: tuple[CatalogFramework, ...]
+    # framework_control_codes[control_id][framework_id] -> code in that framework
+    framework_control_codes: Mapping[UUID, Mapping[UUID, str]]
+    control_counts: tuple[int, ...]
+    shared: tuple[tuple[int, ...], ...]
+    jaccard: tuple[tuple[float, ...], ...]
+
+
+def build_overlap_index(catalog: CatalogSnapshot) -> OverlapIndex:
+    """
+    Index the catalog and compute the N x N framework overlap matrix.
+
+    `shared[i][j]` counts controls mapped by both frameworks `i` and `j` (the
+    diagonal is each framework's own control count) and `jaccard[i][j]` is
+    shared over the union. Frameworks follow catalog order.
+    """
+    bit_by_control = {control.id: 1 << i for i, control in enumerate(catalog.controls)}
+    framework_control_codes: dict[UUID, dict[UUID, str]] = {}
+    bitsets = []
+    for framework in catalog.frameworks:
+        bits = 0
+        for fc in catalog.controls_for_framework(framework.id):
+            bits |= bit_by_control[fc.control_id]
+            framework_control_codes.setdefault(fc.control_id, {})[
+                framework.id
+            ] = fc.framework_control_code
+        bitsets.append(bits)
+
+    counts = [bits.bit_count() for bits in bitsets]
+    shared = [[(a & b).bit_count() for b in bitsets] for a in bitsets]
+    jaccard = [
+        [
+            round(both / (counts[i] + counts[j] - both), 4) if both else 0.0
+            for j, both in enumerate(row)
+        ]
+        for i, row in enumerate(shared)
+    ]
+    return OverlapIndex(
+        frameworks=catalog.frameworks,
+        framework_control_codes=framework_control_codes,
+        control_counts=tuple(counts),
+        shared=tuple(map(tuple, shared)),
+        jaccard=tuple(map(tuple, jaccard)),
+    )
+
+
+def get_overlap_index(catalog: CatalogSnapshot) -> OverlapIndex:
+    """The overlap index of a catalog version, built on first use."""
+    return catalog.memoize("overlap_index", lambda: build_overlap_index(catalog))
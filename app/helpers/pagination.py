@@ -0,0 +1,119 @@
+"""Keyset pagination.
+
+A page ends with the sort key of its last row. That key is handed to the
+client as an opaque cursor in the `X-Next-Cursor` response header, and the
+next page starts strictly after it, so every page is an index range scan
+whatever its depth. List bodies stay plain JSON arrays.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Sequence, TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException, Query, Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Page size of list endpoints when the client does not ask for one, and the cap
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class Page(Generic[T]):
+    """One page of results and the cursor of the next page, if any."""
+
+    items: list[T]
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PageRequest:
+    """Page size and cursor sent by the client."""
+
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: str | None = None
+    response: Response | None = None
+
+    def apply(self, page: Page) -> None:
+        """Attach the next cursor to the outgoing 200 response."""
+        if self.response is not None:
+            set_next_cursor(self.response, page)
+
+
+def get_page_request(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+) -> PageRequest:
+    """Dependency that collects the pagination query parameters."""
+    return PageRequest(limit=limit, cursor=cursor, response=response)
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque cursor for a sort key. Values are serialized as JSON (UUIDs as str)."""
+    raw = json.dumps(values, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, *types: Callable[[Any], Any]) -> tuple:
+    """
+    Decode a cursor into a sort key, converting each value with `types`.
+
+    Raises 400 for cursors that were not produced by `encode_cursor` with the
+    same key shape.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError(cursor)
+        return tuple(convert(value) for convert, value in zip(types, values))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate(rows: Sequence[T], limit: int, key: Callable[[T], tuple]) -> Page[T]:
+    """
+    Cut `rows`, fetched with `limit + 1`, into a page.
+
+    The extra row only tells whether another page exists; the cursor is the
+    key of the last row returned.
+    """
+    items = list(rows[:limit])
+    next_cursor = encode_cursor(*key(items[-1])) if len(rows) > limit else None
+    return Page(items=items, next_cursor=next_cursor)
+
+
+def page_start(items: Sequence[T], request: PageRequest, id_of: Callable[[T], UUID]) -> int:
+    """
+    Index of the first item of the requested page of an in-memory sequence.
+
+    Raises 400 unless the cursor is the id of one of the items.
+    """
+    if request.cursor is None:
+        return 0
+    (after_id,) = decode_cursor(request.cursor, UUID)
+    position = next((i for i, item in enumerate(items) if id_of(item) == after_id), None)
+    if position is None:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return position + 1
+
+
+def page_at(items: Sequence[T], start: int, limit: int, id_of: Callable[[T], UUID]) -> Page[T]:
+    """The page of `limit` items of an in-memory sequence from index `start`."""
+    return paginate(items[start : start + limit + 1], limit, lambda item: (id_of(item),))
+
+
+def next_cursor_headers(page: Page) -> dict[str, str]:
+    """Headers exposing the cursor of the next page, if any."""
+    return {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor is not None else {}
+
+
+def set_next_cursor(response: Response, page: Page) -> None:
+    """Expose the cursor of the next page, if any, on the response."""
+    response.headers.update(next_cursor_headers(page))
@@ -8,87 +8,327 @@ Separating this from the API layer allows for:
 """
 
 import logging
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Iterable, Mapping
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Integer, Select, Update, column, func, or_, select, true, update, values
+from sqlalchemy.dialects.postgresql import Insert, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.models import ComplianceStatus, Framework, FrameworkControl, OrgControl, OrgFramework
+from app.helpers.audit import StatusChange, status_as_of
+from app.models import (
+    ComplianceStatus,
+    Control,
+    Framework,
+    FrameworkControl,
+    OrgControl,
+    OrgFramework,
+    ReadinessCounter,
+)
 from app.schemas.readiness import ControlGap, ReadinessResponse
 
 logger = logging.getLogger(__name__)
 
+# Statuses that count as an open gap
+GAP_STATUSES = (ComplianceStatus.NOT_STARTED, ComplianceStatus.IN_PROGRESS)
 
-async def calculate_readiness(db: AsyncSession, org_framework: OrgFramework) -> ReadinessResponse:
+# ReadinessCounter column holding the count of each status
+COUNTER_COLUMNS = {
+    ComplianceStatus.COMPLETE: "completed",
+    ComplianceStatus.IN_PROGRESS: "in_progress",
+    ComplianceStatus.NOT_STARTED: "not_started",
+    ComplianceStatus.NOT_APPLICABLE: "not_applicable",
+}
+
+
+def _count_status(status: ComplianceStatus):
+    return func.count(OrgControl.id).filter(OrgControl.status == status)
+
+
+def status_counts_query() -> Select:
+    """Per-OrgFramework status counts, computed from the OrgControl rows."""
+    return (
+        select(
+            OrgFramework.id.label("org_framework_id"),
+            *(_count_status(status).label(column) for status, column in COUNTER_COLUMNS.items()),
+        )
+        .select_from(OrgFramework)
+        .outerjoin(OrgControl, OrgControl.org_framework_id == OrgFramework.id)
+        .group_by(OrgFramework.id)
+    )
+
+
+def readiness_counters_upsert(org_framework_ids: Iterable[UUID] | None = None) -> Insert:
+    """Statement recounting the readiness counters of the given OrgFrameworks (all if None)."""
+    counts = status_counts_query()
+    if org_framework_ids is not None:
+        counts = counts.where(OrgFramework.id.in_(list(org_framework_ids)))
+
+    columns = ["org_framework_id", *COUNTER_COLUMNS.values()]
+    stmt = insert(ReadinessCounter).from_select(columns, counts)
+    return stmt.on_conflict_do_update(
+        index_elements=[ReadinessCounter.org_framework_id],
+        set_={
+            **{column: stmt.excluded[column] for column in COUNTER_COLUMNS.values()},
+            "updated_at": func.now(),
+        },
+    )
+
+
+async def refresh_readiness_counters(
+    db: AsyncSession, org_framework_ids: Iterable[UUID] | None = None
+) -> None:
+    """
+    Recount the readiness counters of the given OrgFrameworks (all if None).
+
+    The recount reads the OrgControls as of the start of the statement, so it
+    can overwrite a concurrent transaction's changes. Use it only for
+    OrgFrameworks created in the current transaction and for repairing drift;
+    shift the counters of live adoptions instead.
+    """
+    await db.execute(readiness_counters_upsert(org_framework_ids))
+
+
+def readiness_counters_shift(deltas: Mapping[UUID, Mapping[ComplianceStatus, int]]) -> Update:
+    """
+    Statement adding per-status deltas to the readiness counters, in one UPDATE.
+
+    Counter rows are locked in `org_framework_id` order first, so concurrent
+    shifts spanning several OrgFrameworks cannot deadlock.
+    """
+    counter = ReadinessCounter.__table__
+    ids = sorted(deltas)
+    locked = (
+        select(counter.c.org_framework_id)
+        .where(counter.c.org_framework_id.in_(ids))
+        .order_by(counter.c.org_framework_id)
+        .with_for_update()
+        .cte("locked")
+    )
+    shifts = values(
+        column("org_framework_id", counter.c.org_framework_id.type),
+        *(column(name, Integer) for name in COUNTER_COLUMNS.values()),
+        name="shifts",
+    ).data(
+        [
+            (
+                org_framework_id,
+                *(deltas[org_framework_id].get(status, 0) for status in COUNTER_COLUMNS),
+            )
+            for org_framework_id in ids
+        ]
+    )
+    return (
+        update(counter)
+        .where(counter.c.org_framework_id == locked.c.org_framework_id)
+        .where(counter.c.org_framework_id == shifts.c.org_framework_id)
+        .values({name: counter.c[name] + shifts.c[name] for name in COUNTER_COLUMNS.values()})
+    )
+
+
+async def shift_readiness_counters(db: AsyncSession, changes: Iterable[StatusChange]) -> None:
+    """Apply many OrgControl status transitions to the counters, netted per OrgFramework."""
+    deltas: dict[UUID, Counter] = defaultdict(Counter)
+    for change in changes:
+        if change.from_status != change.to_status:
+            deltas[change.org_framework_id][change.from_status] -= 1
+            deltas[change.org_framework_id][change.to_status] += 1
+    if deltas:
+        await db.execute(readiness_counters_shift(deltas))
+
+
+async def shift_readiness_counter(
+    db: AsyncSession,
+    org_framework_id: UUID,
+    old_status: ComplianceStatus,
+    new_status: ComplianceStatus,
+) -> None:
+    """Move one OrgControl between status counters."""
+    if old_status == new_status:
+        return
+    old_column = getattr(ReadinessCounter, COUNTER_COLUMNS[old_status])
+    new_column = getattr(ReadinessCounter, COUNTER_COLUMNS[new_status])
+    await db.execute(
+        update(ReadinessCounter)
+        .where(ReadinessCounter.org_framework_id == org_framework_id)
+        .values({old_column: old_column - 1, new_column: new_column + 1})
+    )
+
+
+def readiness_counter_drift_query() -> Select:
+    """Counters that are missing or disagree with the OrgControl rows."""
+    actual = status_counts_query().subquery("actual")
+    return (
+        select(
+            actual,
+            *(
+                getattr(ReadinessCounter, column).label(f"stored_{column}")
+                for column in COUNTER_COLUMNS.values()
+            ),
+        )
+        .outerjoin(ReadinessCounter, ReadinessCounter.org_framework_id == actual.c.org_framework_id)
+        .where(
+            or_(
+                ReadinessCounter.org_framework_id.is_(None),
+                *(
+                    getattr(ReadinessCounter, column).is_distinct_from(actual.c[column])
+                    for column in COUNTER_COLUMNS.values()
+                ),
+            )
+        )
+        .order_by(actual.c.org_framework_id)
+    )
+
+
+async def _read_counters(db: AsyncSession, org_framework: OrgFramework):
+    result = await db.execute(
+        select(
+            Framework.code,
+            Framework.version,
+            Framework.name,
+            (
+                ReadinessCounter.completed
+                + ReadinessCounter.in_progress
+                + ReadinessCounter.not_started
+                + ReadinessCounter.not_applicable
+            ).label("total"),
+            ReadinessCounter.completed,
+            ReadinessCounter.in_progress,
+            ReadinessCounter.not_started,
+            ReadinessCounter.not_applicable,
+        )
+        .select_from(ReadinessCounter)
+        .join(Framework, Framework.id == org_framework.framework_id)
+        .where(ReadinessCounter.org_framework_id == org_framework.id)
+    )
+    return result.one_or_none()
+
+
+async def _read_counters_as_of(db: AsyncSession, org_framework: OrgFramework, statuses):
+    result = await db.execute(
+        select(
+            Framework.code,
+            Framework.version,
+            Framework.name,
+            func.count(statuses.c.org_control_id).label("total"),
+            *(
+                func.count(statuses.c.org_control_id)
+                .filter(statuses.c.status == status)
+                .label(column)
+                for status, column in COUNTER_COLUMNS.items()
+            ),
+        )
+        .select_from(Framework)
+        .outerjoin(statuses, true())
+        .where(Framework.id == org_framework.framework_id)
+        .group_by(Framework.id)
+    )
+    return result.one()
+
+
+async def calculate_readiness(
+    db: AsyncSession, org_framework: OrgFramework, as_of: datetime | None = None
+) -> ReadinessResponse:
     """
     Calculate compliance readiness for an organization's framework.
 
+    Status counts are a primary-key read of the ReadinessCounter row joined
+    with the framework details, and gaps are fetched as plain column tuples,
+    so no ORM objects are loaded for the controls.
+
+    With `as_of`, counts and gaps are rebuilt from the status event log as it
+    stood at that moment instead.
+
     Args:
         db: Database session
         org_framework: The organization's framework adoption record
+        as_of: Point in time to report readiness for (default: now)
 
     Returns:
         ReadinessResponse with statistics and gap list
     """
-    logger.info(f"Calculating readiness for org_framework {org_framework.id}")
+    logger.info(f"Calculating readiness for org_framework {org_framework.id} as of {as_of}")
 
-    # Get framework details
-    framework_result = await db.execute(
-        select(Framework).where(Framework.id == org_framework.framework_id)
-    )
-    framework = framework_result.scalar_one()
+    if as_of is None:
+        # Framework details and status counts from the maintained counters
+        stats = await _read_counters(db, org_framework)
+        if stats is None:
+            logger.warning(f"Readiness counter missing for org_framework {org_framework.id}")
+            await refresh_readiness_counters(db, [org_framework.id])
+            stats = await _read_counters(db, org_framework)
+        status = OrgControl.status
+        gap_query = select().where(OrgControl.org_framework_id == org_framework.id)
+    else:
+        # Status of every control at `as_of`, from the event log
+        statuses = status_as_of(org_framework.id, as_of)
+        stats = await _read_counters_as_of(db, org_framework, statuses)
+        status = statuses.c.status
+        gap_query = (
+            select()
+            .select_from(statuses)
+            .join(OrgControl, OrgControl.id == statuses.c.org_control_id)
+        )
 
-    # Get all org controls for this framework
-    result = await db.execute(
-        select(OrgControl)
-        .options(selectinload(OrgControl.framework_control).selectinload(FrameworkControl.control))
-        .where(OrgControl.org_framework_id == org_framework.id)
+    # Find gaps (controls that are not complete or N/A)
+    gap_result = await db.execute(
+        gap_query.add_columns(
+            Control.code,
+            Control.title,
+            FrameworkControl.framework_control_code,
+            status,
+        )
+        .join(FrameworkControl, FrameworkControl.id == OrgControl.framework_control_id)
+        .join(Control, Control.id == FrameworkControl.control_id)
+        .where(status.in_(GAP_STATUSES))
+        .order_by(FrameworkControl.framework_control_code)
     )
-    org_controls = result.scalars().all()
+    gaps = [
+        ControlGap(
+            code=code,
+            title=title,
+            framework_control_code=framework_control_code,
+            status=status.value,
+        )
+        for code, title, framework_control_code, status in gap_result
+    ]
+
+    return build_readiness(stats, gaps)
 
-    # Calculate statistics
-    total = len(org_controls)
-    completed = sum(1 for oc in org_controls if oc.status == ComplianceStatus.COMPLETE)
-    in_progress = sum(1 for oc in org_controls if oc.status == ComplianceStatus.IN_PROGRESS)
-    not_started = sum(1 for oc in org_controls if oc.status == ComplianceStatus.NOT_STARTED)
-    not_applicable = sum(1 for oc in org_controls if oc.status == ComplianceStatus.NOT_APPLICABLE)
 
-    # Calculate readiness percentage (excluding N/A)
+def calculate_percentage(total: int, completed: int, not_applicable: int) -> float:
+    """Readiness percentage, excluding N/A controls."""
     applicable_total = total - not_applicable
     if applicable_total > 0:
-        readiness_percentage = round((completed / applicable_total) * 100, 1)
-    else:
-        readiness_percentage = 100.0 if total == 0 else 0.0
+        return round((completed / applicable_total) * 100, 1)
+    return 100.0 if total == 0 else 0.0
 
-    # Find gaps (controls that are not complete or N/A)
-    gaps = []
-    for oc in org_controls:
-        if oc.status not in [ComplianceStatus.COMPLETE, ComplianceStatus.NOT_APPLICABLE]:
-            fc = oc.framework_control
-            control = fc.control
-            gaps.append(
-                ControlGap(
-                    code=control.code,
-                    title=control.title,
-                    framework_control_code=fc.framework_control_code,
-                    status=oc.status.value,
-                )
-            )
+
+def build_readiness(stats, gaps: list[ControlGap]) -> ReadinessResponse:
+    """
+    Build the readiness response from framework details and status counts.
+
+    `stats` is any object exposing code, version, name, total, completed,
+    in_progress, not_started and not_applicable.
+    """
+    readiness_percentage = calculate_percentage(stats.total, stats.completed, stats.not_applicable)
+    applicable_total = stats.total - stats.not_applicable
 
     logger.info(
-        f"Readiness for {framework.code} v{framework.version}: "
-        f"{readiness_percentage}% ({completed}/{applicable_total})"
+        f"Readiness for {stats.code} v{stats.version}: "
+        f"{readiness_percentage}% ({stats.completed}/{applicable_total})"
     )
 
     return ReadinessResponse(
-        framework_code=framework.code,
-        framework_version=framework.version,
-        framework_name=framework.name,
-        total_controls=total,
-        completed=completed,
-        in_progress=in_progress,
-        not_started=not_started,
-        not_applicable=not_applicable,
+        framework_code=stats.code,
+        framework_version=stats.version,
+        framework_name=stats.name,
+        total_controls=stats.total,
+        completed=stats.completed,
+        in_progress=stats.in_progress,
+        not_started=stats.not_started,
+        not_applicable=stats.not_applicable,
         readiness_percentage=readiness_percentage,
         gaps=gaps,
     )
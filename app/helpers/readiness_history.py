@@ -0,0 +1,142 @@
+"""Readiness history.
+
+Once a day every OrgFramework's readiness counters are copied into
+ReadinessSnapshot with a single INSERT ... SELECT. Trend charts read the
+snapshots back bucketed by day, week or month, with the downsampling done by
+Postgres.
+"""
+
+import asyncio
+import contextlib
+import logging
+from datetime import date, datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import Date, DateTime, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.helpers.readiness import COUNTER_COLUMNS, calculate_percentage
+from app.models import ReadinessCounter, ReadinessSnapshot
+from app.schemas.readiness import HistoryInterval, ReadinessPoint
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock key so only one worker writes the snapshot per run
+SNAPSHOT_LOCK_KEY = 7_310_001
+
+
+async def snapshot_readiness(db: AsyncSession, day: date | None = None) -> int:
+    """
+    Snapshot the readiness of every OrgFramework for `day` (today, UTC, by default).
+
+    Re-running on the same day overwrites that day's snapshot, so the last run
+    of a day wins. Returns the number of rows written.
+    """
+    day = day or datetime.now(timezone.utc).date()
+    columns = ["org_framework_id", "snapshot_date", *COUNTER_COLUMNS.values()]
+    source = select(
+        ReadinessCounter.org_framework_id,
+        literal(day, Date),
+        *(getattr(ReadinessCounter, column) for column in COUNTER_COLUMNS.values()),
+    )
+    stmt = insert(ReadinessSnapshot).from_select(columns, source)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ReadinessSnapshot.org_framework_id, ReadinessSnapshot.snapshot_date],
+        set_={
+            **{column: stmt.excluded[column] for column in COUNTER_COLUMNS.values()},
+            "updated_at": func.now(),
+        },
+    )
+    result = await db.execute(stmt)
+    return result.rowcount
+
+
+async def try_snapshot_readiness(db: AsyncSession, day: date | None = None) -> int | None:
+    """Snapshot readiness unless another worker is already doing it (returns None)."""
+    acquired = await db.scalar(select(func.pg_try_advisory_xact_lock(SNAPSHOT_LOCK_KEY)))
+    if not acquired:
+        return None
+    return await snapshot_readiness(db, day)
+
+
+class ReadinessSnapshotJob:
+    """
+    Background task that snapshots readiness every `interval` seconds.
+
+    Every worker runs it; the advisory lock lets one of them write per run.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker, interval: float):
+        self.session_factory = session_factory
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with self.session_factory() as session:
+                    written = await try_snapshot_readiness(session)
+                    await session.commit()
+                if written is not None:
+                    logger.info(f"Wrote {written} readiness snapshots")
+            except Exception as e:
+                logger.error(f"Readiness snapshot failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+async def readiness_history(
+    db: AsyncSession,
+    org_framework_id: UUID,
+    start: date,
+    end: date,
+    interval: HistoryInterval,
+) -> list[ReadinessPoint]:
+    """
+    Readiness series between `start` and `end`, one point per bucket.
+
+    Each point is the last snapshot taken within its day, week or month.
+    """
+    period = cast(
+        func.date_trunc(interval.value, cast(ReadinessSnapshot.snapshot_date, DateTime)), Date
+    )
+    result = await db.execute(
+        select(
+            period.label("period_start"),
+            ReadinessSnapshot.snapshot_date,
+            ReadinessSnapshot.completed,
+            ReadinessSnapshot.in_progress,
+            ReadinessSnapshot.not_started,
+            ReadinessSnapshot.not_applicable,
+        )
+        .where(ReadinessSnapshot.org_framework_id == org_framework_id)
+        .where(ReadinessSnapshot.snapshot_date.between(start, end))
+        .distinct(period)
+        .order_by(period, ReadinessSnapshot.snapshot_date.desc())
+    )
+
+    points = []
+    for row in result:
+        total = row.completed + row.in_progress + row.not_started + row.not_applicable
+        points.append(
+            ReadinessPoint(
+                period_start=row.period_start,
+                snapshot_date=row.snapshot_date,
+                total_controls=total,
+                completed=row.completed,
+                in_progress=row.in_progress,
+                not_started=row.not_started,
+                not_applicable=row.not_applicable,
+                readiness_percentage=calculate_percentage(total, row.completed, row.not_applicable),
+            )
+        )
+    return points
@@ -0,0 +1,208 @@
+"""Search over the control library and organization data.
+
+Controls are matched against `lookup.control.search_vector`, a generated
+`tsvector` over code, title and description backed by a GIN index, and ranked
+with `ts_rank`.
+
+Organizations, evidence and control notes are free text typed by users, so
+they are searched with `pg_trgm` instead: typo tolerant, ranked by word
+similarity and served by GIN trigram indexes. Rows are matched with the `<%`
+operator, which the indexes support, rather than by filtering on a computed
+similarity.
+
+Every search is keyset-paginated on (score, id).
+"""
+
+import re
+from typing import Iterable
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import Label, Row, Select, Text, and_, cast, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import REAL, REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers.catalog import CatalogSnapshot
+from app.helpers.org_controls import org_control, org_control_response
+from app.helpers.pagination import Page, decode_cursor, paginate
+from app.models import Control, Evidence, FrameworkControl, Organization, OrgFramework
+from app.schemas import (
+    ControlSearchResult,
+    EvidenceSearchResult,
+    OrganizationSearchResult,
+    OrgControlSearchResult,
+)
+
+SEARCH_CONFIG = "english"
+
+# Letters and digits only: everything else, including tsquery operators and
+# the underscores of control codes, separates terms.
+_TERM = re.compile(r"[^\W_]+")
+
+
+def to_tsquery_text(q: str, prefix: bool = True) -> str:
+    """
+    Turn free text into `to_tsquery` syntax matching all of its terms.
+
+    With `prefix`, every term also matches words it starts, so `encr` finds
+    "encryption". Raises 400 when `q` has no searchable term.
+    """
+    terms = _TERM.findall(q)
+    if not terms:
+        raise HTTPException(status_code=400, detail="Search query has no searchable terms")
+    suffix = ":*" if prefix else ""
+    return " & ".join(f"{term}{suffix}" for term in terms)
+
+
+def trigram_match(q: str, *columns) -> tuple:
+    """
+    Filter and score for a typo-tolerant match of `q` against `columns`.
+
+    A row matches when `q` is similar enough (`pg_trgm.word_similarity_threshold`)
+    to part of any of the columns; its score is the best word similarity.
+    """
+    text = literal(q, Text)
+    match = or_(*(text.op("<%", is_comparison=True)(column) for column in columns))
+    score = func.greatest(*(func.word_similarity(text, column) for column in columns))
+    return match, score.label("similarity")
+
+
+async def ranked_page(
+    db: AsyncSession,
+    stmt: Select,
+    score: Label,
+    id_column,
+    limit: int,
+    cursor: str | None,
+) -> Page[Row]:
+    """Fetch one page of `stmt`, best `score` first, ties broken by id."""
+    value = score.element
+    if cursor is not None:
+        after_score, after_id = decode_cursor(cursor, float, UUID)
+        after_score = literal(after_score, REAL)
+        stmt = stmt.where(
+            or_(value < after_score, and_(value == after_score, id_column > after_id))
+        )
+
+    result = await db.execute(stmt.order_by(value.desc(), id_column).limit(limit + 1))
+    return paginate(
+        result.all(), limit, key=lambda row: (row._mapping[score], row._mapping[id_column])
+    )
+
+
+def _with_items(page: Page[Row], items: Iterable) -> Page:
+    return Page(items=list(items), next_cursor=page.next_cursor)
+
+
+async def search_controls(
+    db: AsyncSession,
+    q: str,
+    framework_id: UUID | None = None,
+    prefix: bool = True,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> Page[ControlSearchResult]:
+    """
+    Full-text search of controls, best match first.
+
+    With `framework_id`, only controls mapped by that framework are searched
+    and each result carries its framework control code.
+    """
+    query = func.to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), to_tsquery_text(q, prefix))
+    rank = func.ts_rank(Control.search_vector, query).label("rank")
+    stmt = select(
+        Control.id,
+        Control.code,
+        Control.title,
+        Control.description,
+        Control.category,
+        Control.control_type,
+        rank,
+    ).where(Control.search_vector.bool_op("@@")(query))
+    if framework_id is not None:
+        stmt = stmt.add_columns(FrameworkControl.framework_control_code).join(
+            FrameworkControl,
+            and_(
+                FrameworkControl.control_id == Control.id,
+                FrameworkControl.framework_id == framework_id,
+            ),
+        )
+
+    page = await ranked_page(db, stmt, rank, Control.id, limit, cursor)
+    return _with_items(
+        page, (ControlSearchResult.model_validate(row._mapping) for row in page.items)
+    )
+
+
+async def search_organizations(
+    db: AsyncSession, q: str, limit: int = 20, cursor: str | None = None
+) -> Page[OrganizationSearchResult]:
+    """Typo-tolerant search of organizations by name or slug."""
+    match, similarity = trigram_match(q, Organization.name, Organization.slug)
+    stmt = select(
+        Organization.id, Organization.name, Organization.slug, Organization.created_at, similarity
+    ).where(match)
+
+    page = await ranked_page(db, stmt, similarity, Organization.id, limit, cursor)
+    return _with_items(
+        page, (OrganizationSearchResult.model_validate(row._mapping) for row in page.items)
+    )
+
+
+async def search_evidence(
+    db: AsyncSession,
+    organization_id: UUID,
+    q: str,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> Page[EvidenceSearchResult]:
+    """Typo-tolerant search of an organization's evidence by title or description."""
+    match, similarity = trigram_match(q, Evidence.title, Evidence.description)
+    stmt = (
+        select(*Evidence.__table__.c, similarity)
+        .where(Evidence.organization_id == organization_id)
+        .where(match)
+    )
+
+    page = await ranked_page(db, stmt, similarity, Evidence.id, limit, cursor)
+    return _with_items(
+        page, (EvidenceSearchResult.model_validate(row._mapping) for row in page.items)
+    )
+
+
+async def search_org_control_notes(
+    db: AsyncSession,
+    catalog: CatalogSnapshot,
+    organization_id: UUID,
+    q: str,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> Page[OrgControlSearchResult]:
+    """Typo-tolerant search of the notes on an organization's controls."""
+    match, similarity = trigram_match(q, org_control.c.notes)
+    stmt = (
+        select(
+            org_control.c.id,
+            org_control.c.org_framework_id,
+            org_control.c.framework_control_id,
+            org_control.c.status,
+            org_control.c.due_date,
+            org_control.c.notes,
+            org_control.c.evidence_count,
+            similarity,
+        )
+        .join(OrgFramework, OrgFramework.id == org_control.c.org_framework_id)
+        .where(OrgFramework.organization_id == organization_id)
+        .where(match)
+    )
+
+    page = await ranked_page(db, stmt, similarity, org_control.c.id, limit, cursor)
+    return _with_items(
+        page,
+        (
+            OrgControlSearchResult(
+                **org_control_response(catalog, row).model_dump(), similarity=row.similarity
+            )
+            for row in page.items
+        ),
+    )
@@ -0,0 +1,87 @@
+"""Streaming list responses.
+
+Large organization lists can be streamed instead of paginated: rows are read
+through a server-side cursor in batches of `STREAM_BATCH_SIZE` and each batch
+is serialized and sent before the next is fetched, so memory stays flat
+however many rows there are. The cursor runs in a session of its own, opened
+when the body starts streaming, since the request's session is owned by
+`get_db`. The body is a JSON array, or NDJSON when the
+client accepts `application/x-ndjson`.
+"""
+
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable
+
+from fastapi import Depends, Header, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Row, Select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.database import async_session, get_session_factory
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Rows fetched from the server-side cursor per round trip
+STREAM_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class StreamRequest:
+    """Whether the client asked for a streamed body, and in which format."""
+
+    enabled: bool = False
+    ndjson: bool = False
+    session_factory: async_sessionmaker = async_session
+
+
+def get_stream_request(
+    stream: bool = Query(False, description="Stream every row instead of one page"),
+    accept: str | None = Header(None),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+) -> StreamRequest:
+    """
+    Dependency resolving the streaming mode.
+
+    `?stream=true` streams a JSON array; accepting `application/x-ndjson`
+    streams NDJSON, with or without `stream`.
+    """
+    ndjson = accept is not None and NDJSON_MEDIA_TYPE in accept
+    return StreamRequest(enabled=stream or ndjson, ndjson=ndjson, session_factory=session_factory)
+
+
+async def _stream_rows(
+    session_factory: async_sessionmaker,
+    stmt: Select,
+    render: Callable[[Row], BaseModel],
+    ndjson: bool,
+) -> AsyncIterator[bytes]:
+    async with session_factory() as session:
+        result = await session.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+        separator = b"\n" if ndjson else b","
+        first = True
+        if not ndjson:
+            yield b"["
+        async for rows in result.partitions():
+            chunk = separator.join(render(row).model_dump_json().encode() for row in rows)
+            if ndjson:
+                yield chunk + b"\n"
+            else:
+                yield chunk if first else b"," + chunk
+            first = False
+        if not ndjson:
+            yield b"]"
+
+
+def stream_json(
+    stmt: Select,
+    render: Callable[[Row], BaseModel],
+    request: StreamRequest,
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """Stream the rows of `stmt`, each rendered to JSON by `render`, from a new session."""
+    return StreamingResponse(
+        _stream_rows(request.session_factory, stmt, render, request.ndjson),
+        media_type=NDJSON_MEDIA_TYPE if request.ndjson else "application/json",
+        headers=headers,
+    )
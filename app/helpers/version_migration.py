@@ -0,0 +1,186 @@
+"""Migration of an adoption to another version of its framework.
+
+A version upgrade creates a new OrgFramework for the target version, as
+described in the design doc. Controls are matched across versions by their
+`lookup.control` id: matched OrgControls carry over status, due date, notes and
+evidence links, while controls new in the target start as not started. Every
+step is an INSERT ... SELECT, run in the caller's transaction, and the source
+adoption is left as it was.
+"""
+
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import and_, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.helpers.audit import record_adoption
+from app.helpers.catalog import CatalogFrameworkControl, CatalogSnapshot
+from app.helpers.readiness import refresh_readiness_counters
+from app.models import ComplianceStatus, ControlEvidence, FrameworkControl, OrgControl, OrgFramework
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class VersionMigration:
+    """Outcome of migrating an adoption to another framework version."""
+
+    org_framework: OrgFramework
+    carried_over: int
+    evidence_links: int
+    added: list[CatalogFrameworkControl]
+    removed: list[CatalogFrameworkControl]
+
+
+def check_version_target(
+    catalog: CatalogSnapshot, source_framework_id: UUID, target_framework_id: UUID
+) -> None:
+    """Raise unless the target is another version of the source framework."""
+    source = catalog.framework_by_id[source_framework_id]
+    target = catalog.framework_by_id.get(target_framework_id)
+    if target is None:
+        raise HTTPException(status_code=404, detail="Framework not found")
+    if target.code != source.code:
+        raise HTTPException(
+            status_code=400, detail=f"Target framework is not a version of {source.code}"
+        )
+    if target.id == source.id:
+        raise HTTPException(status_code=400, detail="Target is the adopted version")
+
+
+async def migrate_org_framework(
+    db: AsyncSession,
+    catalog: CatalogSnapshot,
+    source: OrgFramework,
+    target_framework_id: UUID,
+) -> VersionMigration:
+    """
+    Adopt `target_framework_id`, carrying over the state of `source`.
+
+    Callers validate the target first (see `check_version_target` and
+    `check_adoptable`).
+    """
+    org_framework = (
+        await db.scalars(
+            insert(OrgFramework).returning(OrgFramework),
+            [{"organization_id": source.organization_id, "framework_id": target_framework_id}],
+        )
+    ).one()
+
+    target_fc = aliased(FrameworkControl)
+    source_fc = aliased(FrameworkControl)
+    source_oc = aliased(OrgControl)
+    # Target controls, each with the source OrgControl backed by the same control.
+    # The source side is restricted in the join conditions so that controls new
+    # in the target are kept.
+    matches = (
+        select(
+            target_fc.id.label("target_fc_id"),
+            source_oc.id.label("source_oc_id"),
+            source_oc.status,
+            source_oc.due_date,
+            source_oc.notes,
+            source_oc.evidence_count,
+        )
+        .select_from(target_fc)
+        .outerjoin(
+            source_fc,
+            and_(
+                source_fc.control_id == target_fc.control_id,
+                source_fc.framework_id == source.framework_id,
+            ),
+        )
+        .outerjoin(
+            source_oc,
+            and_(
+                source_oc.framework_control_id == source_fc.id,
+                source_oc.org_framework_id == source.id,
+            ),
+        )
+        .where(target_fc.framework_id == target_framework_id)
+        .subquery("matches")
+    )
+
+    created = (
+        insert(OrgControl)
+        .from_select(
+            [
+                "org_framework_id",
+                "framework_control_id",
+                "status",
+                "due_date",
+                "notes",
+                "evidence_count",
+            ],
+            select(
+                literal(org_framework.id, OrgControl.org_framework_id.type),
+                matches.c.target_fc_id,
+                func.coalesce(
+                    matches.c.status,
+                    literal(ComplianceStatus.NOT_STARTED, OrgControl.status.type),
+                ),
+                matches.c.due_date,
+                matches.c.notes,
+                # Every link of the source control is copied below
+                func.coalesce(matches.c.evidence_count, 0),
+            ),
+            include_defaults=False,
+        )
+        .returning(OrgControl.framework_control_id)
+        .cte("created")
+    )
+    # Carried over means a source OrgControl was copied, not just that both
+    # versions map the control: the source row may not be backfilled yet
+    created_count, carried_over = (
+        await db.execute(
+            select(
+                func.count(),
+                func.count().filter(matches.c.source_oc_id.is_not(None)),
+            ).select_from(
+                created.join(matches, matches.c.target_fc_id == created.c.framework_control_id)
+            )
+        )
+    ).one()
+
+    # Evidence links of matched controls, re-pointed at the new OrgControls
+    new_oc = aliased(OrgControl)
+    links = await db.execute(
+        insert(ControlEvidence).from_select(
+            ["org_control_id", "evidence_id", "linked_at"],
+            select(new_oc.id, ControlEvidence.evidence_id, ControlEvidence.linked_at)
+            .join(matches, matches.c.source_oc_id == ControlEvidence.org_control_id)
+            .join(
+                new_oc,
+                and_(
+                    new_oc.framework_control_id == matches.c.target_fc_id,
+                    new_oc.org_framework_id == org_framework.id,
+                ),
+            ),
+            include_defaults=False,
+        )
+    )
+
+    await refresh_readiness_counters(db, [org_framework.id])
+    await record_adoption(db, [org_framework.id])
+
+    source_fcs = catalog.controls_for_framework(source.framework_id)
+    target_fcs = catalog.controls_for_framework(target_framework_id)
+    source_controls = {fc.control_id for fc in source_fcs}
+    target_controls = {fc.control_id for fc in target_fcs}
+    migration = VersionMigration(
+        org_framework=org_framework,
+        carried_over=carried_over,
+        evidence_links=links.rowcount,
+        added=[fc for fc in target_fcs if fc.control_id not in source_controls],
+        removed=[fc for fc in source_fcs if fc.control_id not in target_controls],
+    )
+    logger.info(
+        f"Migrated org_framework {source.id} to {org_framework.id}: {created_count} controls, "
+        f"{migration.carried_over} carried over, {migration.evidence_links} evidence links, "
+        f"{len(migration.added)} added, {len(migration.removed)} removed"
+    )
+    return migration
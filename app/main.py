@@ -17,7 +17,10 @@ from sqlalchemy import text
 
 from app.api import api_router
 from app.config import get_settings
-from app.database import engine
+from app.database import async_session, engine, sync_db_connection_string
+from app.helpers.catalog import CatalogListener, catalog_cache
+from app.helpers.pagination import NEXT_CURSOR_HEADER
+from app.helpers.readiness_history import ReadinessSnapshotJob
 
 settings = get_settings()
 
@@ -40,8 +43,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
         raise  # Prevents app from starting
+    async with async_session() as session:
+        catalog = await catalog_cache.reload(session)
+    logger.info(f"Serving catalog version {catalog.version}.")
+    catalog_listener = CatalogListener(
+        catalog_cache,
+        async_session,
+        sync_db_connection_string,
+        debounce=settings.catalog_reload_debounce,
+    )
+    await catalog_listener.start()
+    snapshot_job = ReadinessSnapshotJob(async_session, settings.readiness_snapshot_interval)
+    snapshot_job.start()
     yield
     logger.info("Shutting down RMF Compliance Engine...")
+    await snapshot_job.stop()
+    await catalog_listener.stop()
     await engine.dispose()
 
 
@@ -60,6 +77,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include API routes
@@ -1,6 +1,7 @@
 """SQLAlchemy models package."""
 
 from app.models.enums import (
+    CollectionJobStatus,
     ComplianceStatus,
     ControlCategory,
     ControlType,
@@ -9,6 +10,7 @@ from app.models.enums import (
     FrameworkStatus,
 )
 from app.models.models import (
+    CollectionJob,
     Control,
     ControlEvidence,
     Evidence,
@@ -16,7 +18,10 @@ from app.models.models import (
     FrameworkControl,
     Organization,
     OrgControl,
+    OrgControlEvent,
     OrgFramework,
+    ReadinessCounter,
+    ReadinessSnapshot,
 )
 
 __all__ = [
@@ -28,10 +33,15 @@ __all__ = [
     "OrgControl",
     "Evidence",
     "ControlEvidence",
+    "ReadinessCounter",
+    "ReadinessSnapshot",
+    "OrgControlEvent",
+    "CollectionJob",
     "FrameworkStatus",
     "ControlCategory",
     "ControlType",
     "EvidenceType",
     "EvidenceSource",
     "ComplianceStatus",
+    "CollectionJobStatus",
 ]
@@ -65,3 +65,12 @@ class ComplianceStatus(str, enum.Enum):
     IN_PROGRESS = "in_progress"
     COMPLETE = "complete"
     NOT_APPLICABLE = "not_applicable"
+
+
+class CollectionJobStatus(str, enum.Enum):
+    """State of an evidence collection job in the queue."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
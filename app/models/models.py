@@ -4,21 +4,27 @@ from sqlalchemy import (
     UUID,
     Boolean,
     Column,
+    Computed,
     Date,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
+    Integer,
     String,
     Text,
     UniqueConstraint,
     text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.sql import func
 from sqlalchemy.sql.expression import true
 from uuid_extensions import uuid7
 
 from app.database import Base
 from app.models.enums import (
+    CollectionJobStatus,
     ComplianceStatus,
     ControlCategory,
     ControlType,
@@ -27,6 +33,13 @@ from app.models.enums import (
     FrameworkStatus,
 )
 
+# Generated column expression for Control.search_vector (see migration 008)
+CONTROL_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english'::regconfig, code), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, title), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'C')"
+)
+
 
 class Control(Base):
     """
@@ -44,13 +57,21 @@ class Control(Base):
     description = Column(Text, nullable=True)
     category = Column(Enum(ControlCategory), default=ControlCategory.OTHER, nullable=False)
     control_type = Column(Enum(ControlType), default=ControlType.TECHNICAL, nullable=False)
+    # Full-text search document, maintained by Postgres; code outranks title,
+    # which outranks description. Deferred so it is never loaded by accident.
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(CONTROL_SEARCH_VECTOR, persisted=True), nullable=True)
+    )
 
     # Relationships
     framework_controls = relationship(
         "FrameworkControl", back_populates="control", cascade="all, delete-orphan"
     )
 
-    __table_args__ = {"schema": "lookup"}
+    __table_args__ = (
+        Index("ix_control_search_vector", "search_vector", postgresql_using="gin"),
+        {"schema": "lookup"},
+    )
 
     def __repr__(self) -> str:
         return f"<Control {self.code}: {self.title}>"
@@ -146,7 +167,22 @@ class Evidence(Base):
         "ControlEvidence", back_populates="evidence", cascade="all, delete-orphan"
     )
 
-    __table_args__ = {"schema": "data"}
+    __table_args__ = (
+        Index("ix_evidence_organization_id_id", "organization_id", "id"),
+        Index(
+            "ix_evidence_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_evidence_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+        {"schema": "data"},
+    )
 
     def __repr__(self) -> str:
         return f"<Evidence {self.id}: {self.title}>"
@@ -171,7 +207,10 @@ class ControlEvidence(Base):
     org_control = relationship("OrgControl", back_populates="control_evidence")
     evidence = relationship("Evidence", back_populates="control_evidence")
 
-    __table_args__ = {"schema": "data"}
+    __table_args__ = (
+        UniqueConstraint("org_control_id", "evidence_id", name="uq_control_evidence"),
+        {"schema": "data"},
+    )
 
     def __repr__(self) -> str:
         return f"<ControlEvidence control={self.org_control_id} evidence={self.evidence_id}>"
@@ -196,7 +235,21 @@ class Organization(Base):
     )
     evidence = relationship("Evidence", back_populates="organization", cascade="all, delete-orphan")
 
-    __table_args__ = {"schema": "data"}
+    __table_args__ = (
+        Index(
+            "ix_organization_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_organization_slug_trgm",
+            "slug",
+            postgresql_using="gin",
+            postgresql_ops={"slug": "gin_trgm_ops"},
+        ),
+        {"schema": "data"},
+    )
 
     def __repr__(self) -> str:
         return f"<Organization {self.slug}>"
@@ -223,9 +276,19 @@ class OrgFramework(Base):
     org_controls = relationship(
         "OrgControl", back_populates="org_framework", cascade="all, delete-orphan"
     )
+    readiness_counter = relationship(
+        "ReadinessCounter",
+        back_populates="org_framework",
+        uselist=False,
+        cascade="all, delete-orphan",
+    )
+    readiness_snapshots = relationship(
+        "ReadinessSnapshot", back_populates="org_framework", passive_deletes=True
+    )
 
     __table_args__ = (
         UniqueConstraint("organization_id", "framework_id", name="uq_org_framework"),
+        Index("ix_orgframework_organization_id_id", "organization_id", "id"),
         {"schema": "data"},
     )
 
@@ -254,6 +317,8 @@ class OrgControl(Base):
     # owner_id = Column(String(100), nullable=True) Enable it when user authentication is implemented
     due_date = Column(Date, nullable=True)
     notes = Column(Text, nullable=True)
+    # Number of ControlEvidence links, maintained with every link change
+    evidence_count = Column(Integer, default=0, nullable=False, server_default=text("0"))
 
     # Relationships
     org_framework = relationship("OrgFramework", back_populates="org_controls")
@@ -264,8 +329,131 @@ class OrgControl(Base):
 
     __table_args__ = (
         UniqueConstraint("org_framework_id", "framework_control_id", name="uq_org_control"),
+        Index("ix_orgcontrol_org_framework_id_id", "org_framework_id", "id"),
+        Index(
+            "ix_orgcontrol_notes_trgm",
+            "notes",
+            postgresql_using="gin",
+            postgresql_ops={"notes": "gin_trgm_ops"},
+        ),
         {"schema": "data"},
     )
 
     def __repr__(self) -> str:
         return f"<OrgControl {self.id} status={self.status}>"
+
+
+class ReadinessCounter(Base):
+    """
+    Per-OrgFramework count of OrgControls in each status.
+
+    Maintained in the same transaction as every OrgControl status change,
+    so the readiness summary is a primary-key read.
+    """
+
+    org_framework_id = Column(
+        ForeignKey("data.orgframework.id", ondelete="CASCADE"), primary_key=True
+    )
+    completed = Column(Integer, default=0, nullable=False, server_default=text("0"))
+    in_progress = Column(Integer, default=0, nullable=False, server_default=text("0"))
+    not_started = Column(Integer, default=0, nullable=False, server_default=text("0"))
+    not_applicable = Column(Integer, default=0, nullable=False, server_default=text("0"))
+
+    # Relationships
+    org_framework = relationship("OrgFramework", back_populates="readiness_counter")
+
+    __table_args__ = {"schema": "data"}
+
+    def __repr__(self) -> str:
+        return (
+            f"<ReadinessCounter {self.org_framework_id} "
+            f"completed={self.completed} in_progress={self.in_progress} "
+            f"not_started={self.not_started} not_applicable={self.not_applicable}>"
+        )
+
+
+class ReadinessSnapshot(Base):
+    """
+    Daily copy of an OrgFramework's readiness counters.
+
+    One row per org framework per day, written in bulk from ReadinessCounter.
+    """
+
+    org_framework_id = Column(
+        ForeignKey("data.orgframework.id", ondelete="CASCADE"), primary_key=True
+    )
+    snapshot_date = Column(Date, primary_key=True)
+    completed = Column(Integer, nullable=False)
+    in_progress = Column(Integer, nullable=False)
+    not_started = Column(Integer, nullable=False)
+    not_applicable = Column(Integer, nullable=False)
+
+    # Relationships
+    org_framework = relationship("OrgFramework", back_populates="readiness_snapshots")
+
+    __table_args__ = {"schema": "data"}
+
+    def __repr__(self) -> str:
+        return f"<ReadinessSnapshot {self.org_framework_id} {self.snapshot_date}>"
+
+
+class OrgControlEvent(Base):
+    """
+    Append-only log of OrgControl status transitions.
+
+    One row is written on adoption (from_status is NULL) and one on every
+    status change, so readiness can be rebuilt for any point in time.
+    """
+
+    id = Column(
+        UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("uuidv7()")
+    )
+    org_framework_id = Column(
+        ForeignKey("data.orgframework.id", ondelete="CASCADE"), nullable=False
+    )
+    org_control_id = Column(ForeignKey("data.orgcontrol.id", ondelete="CASCADE"), nullable=False)
+    from_status = Column(Enum(ComplianceStatus), nullable=True)
+    to_status = Column(Enum(ComplianceStatus), nullable=False)
+    occurred_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_orgcontrolevent_org_framework_occurred", "org_framework_id", "occurred_at"),
+        {"schema": "audit"},
+    )
+
+    def __repr__(self) -> str:
+        return f"<OrgControlEvent {self.org_control_id} {self.from_status} -> {self.to_status}>"
+
+
+class CollectionJob(Base):
+    """
+    A queued request to collect evidence from an external source.
+
+    Workers claim due jobs with SELECT ... FOR UPDATE SKIP LOCKED, so any number
+    of them can share the queue. A failed job is retried with exponential
+    backoff until it has used `max_attempts`.
+    """
+
+    id = Column(
+        UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("uuidv7()")
+    )
+    organization_id = Column(ForeignKey("data.organization.id", ondelete="CASCADE"), nullable=False)
+    # Control the collected evidence is linked to, if any
+    org_control_id = Column(ForeignKey("data.orgcontrol.id", ondelete="CASCADE"), nullable=True)
+    source = Column(Enum(EvidenceSource), nullable=False)
+    parameters = Column(JSONB, default=dict, nullable=False, server_default=text("'{}'::jsonb"))
+    status = Column(Enum(CollectionJobStatus), default=CollectionJobStatus.QUEUED, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False, server_default=text("0"))
+    max_attempts = Column(Integer, default=5, nullable=False, server_default=text("5"))
+    run_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    __table_args__ = (
+        Index("ix_collectionjob_due", "run_at", postgresql_where=text("status = 'QUEUED'")),
+        Index("ix_collectionjob_running", "locked_at", postgresql_where=text("status = 'RUNNING'")),
+        {"schema": "data"},
+    )
+
+    def __repr__(self) -> str:
+        return f"<CollectionJob {self.id} {self.source} {self.status}>"
@@ -1,30 +1,59 @@
 """Pydantic schemas package."""
 
+from app.schemas.catalog import CatalogVersionResponse
 from app.schemas.control import (
     ControlBase,
     ControlResponse,
+    ControlSearchResult,
 )
 from app.schemas.evidence import (
     ControlEvidenceCreate,
     EvidenceCreate,
+    EvidenceIngestError,
+    EvidenceIngestResponse,
+    EvidenceLink,
+    EvidenceLinkBatch,
+    EvidenceLinkBatchResponse,
     EvidenceResponse,
+    EvidenceSearchResult,
 )
 from app.schemas.framework import (
+    ControlCrosswalk,
+    ControlDiffResponse,
     ControlInFramework,
+    CrosswalkFramework,
     FrameworkBase,
     FrameworkControlResponse,
     FrameworkCreate,
+    FrameworkDiffResponse,
+    FrameworkOverlapResponse,
     FrameworkResponse,
 )
 from app.schemas.organization import (
+    AdoptionResult,
+    BulkAdoptionCreate,
+    BulkAdoptionResponse,
+    FrameworkMigrationCreate,
+    FrameworkMigrationResponse,
+    MigratedControl,
     OrganizationCreate,
     OrganizationResponse,
+    OrganizationSearchResult,
+    OrgControlBatchItem,
+    OrgControlBatchUpdate,
     OrgControlResponse,
+    OrgControlSearchResult,
     OrgControlUpdate,
     OrgFrameworkCreate,
     OrgFrameworkResponse,
+    SharedControl,
+)
+from app.schemas.readiness import (
+    HistoryInterval,
+    ReadinessHistoryResponse,
+    ReadinessPoint,
+    ReadinessResponse,
 )
-from app.schemas.readiness import ReadinessResponse
 
 __all__ = [
     "FrameworkBase",
@@ -32,16 +61,43 @@ __all__ = [
     "FrameworkResponse",
     "FrameworkControlResponse",
     "ControlInFramework",
+    "ControlDiffResponse",
+    "FrameworkDiffResponse",
+    "FrameworkOverlapResponse",
+    "CrosswalkFramework",
+    "ControlCrosswalk",
     "ControlBase",
     "ControlResponse",
+    "ControlSearchResult",
     "OrganizationCreate",
     "OrganizationResponse",
+    "OrganizationSearchResult",
     "OrgFrameworkCreate",
     "OrgFrameworkResponse",
+    "BulkAdoptionCreate",
+    "AdoptionResult",
+    "SharedControl",
+    "BulkAdoptionResponse",
+    "FrameworkMigrationCreate",
+    "MigratedControl",
+    "FrameworkMigrationResponse",
     "OrgControlResponse",
+    "OrgControlSearchResult",
     "OrgControlUpdate",
+    "OrgControlBatchItem",
+    "OrgControlBatchUpdate",
     "EvidenceCreate",
     "EvidenceResponse",
+    "EvidenceSearchResult",
     "ControlEvidenceCreate",
+    "EvidenceIngestError",
+    "EvidenceIngestResponse",
+    "EvidenceLink",
+    "EvidenceLinkBatch",
+    "EvidenceLinkBatchResponse",
     "ReadinessResponse",
+    "HistoryInterval",
+    "ReadinessPoint",
+    "ReadinessHistoryResponse",
+    "CatalogVersionResponse",
 ]
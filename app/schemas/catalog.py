@@ -0,0 +1,17 @@
+"""Catalog Pydantic schemas."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class CatalogVersionResponse(BaseModel):
+    """Schema for the catalog snapshot served by a worker."""
+
+    version: str
+    loaded_at: datetime
+    frameworks: int
+    controls: int
+    framework_controls: int
+
+    model_config = ConfigDict(from_attributes=True)
@@ -22,3 +22,10 @@ class ControlResponse(ControlBase):
 
     id: UUID
     model_config = ConfigDict(from_attributes=True)
+
+
+class ControlSearchResult(ControlResponse):
+    """Schema for a control matching a full-text search."""
+
+    rank: float
+    framework_control_code: str | None = None
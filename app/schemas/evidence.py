@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models import EvidenceSource, EvidenceType
 
@@ -11,10 +11,10 @@ from app.models import EvidenceSource, EvidenceType
 class EvidenceCreate(BaseModel):
     """Schema for creating Evidence."""
 
-    title: str
+    title: str = Field(..., max_length=200)
     description: str | None = None
     evidence_type: EvidenceType = EvidenceType.OTHER
-    file_url: str | None = None
+    file_url: str | None = Field(None, max_length=500)
     source: EvidenceSource = EvidenceSource.MANUAL
     collected_at: datetime | None = None
 
@@ -35,8 +35,54 @@ class EvidenceResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class EvidenceSearchResult(EvidenceResponse):
+    """Schema for evidence matching a fuzzy search."""
+
+    similarity: float
+
+
 class ControlEvidenceCreate(BaseModel):
     """Schema for linking evidence to a control."""
 
     evidence_id: UUID
     linked_by: str | None = None
+
+
+class EvidenceLink(BaseModel):
+    """One evidence-to-control link."""
+
+    evidence_id: UUID
+    control_id: UUID
+
+
+class EvidenceLinkBatch(BaseModel):
+    """Schema for linking evidence to controls in bulk."""
+
+    links: list[EvidenceLink] = Field(..., min_length=1, max_length=1000)
+
+
+class EvidenceLinkBatchResponse(BaseModel):
+    """Links created by a bulk request, and requested links that already existed."""
+
+    linked: list[EvidenceLink]
+    already_linked: list[EvidenceLink]
+
+
+class EvidenceIngestError(BaseModel):
+    """An NDJSON line rejected by an evidence ingest."""
+
+    line: int
+    error: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EvidenceIngestResponse(BaseModel):
+    """Schema for the report of an evidence ingest."""
+
+    received: int
+    inserted: int
+    failed: int
+    errors: list[EvidenceIngestError]
+
+    model_config = ConfigDict(from_attributes=True)
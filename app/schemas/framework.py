@@ -56,3 +56,59 @@ class FrameworkControlResponse(BaseModel):
     is_required: bool
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ControlDiffResponse(BaseModel):
+    """Schema for a control that differs between two framework versions."""
+
+    control_id: UUID
+    control_code: str
+    control_title: str
+    from_framework_control_code: str | None = None
+    to_framework_control_code: str | None = None
+    from_is_required: bool | None = None
+    to_is_required: bool | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class FrameworkDiffResponse(BaseModel):
+    """Schema for the differences between two versions of a framework."""
+
+    from_framework: FrameworkResponse
+    to_framework: FrameworkResponse
+    added: list[ControlDiffResponse]
+    removed: list[ControlDiffResponse]
+    remapped: list[ControlDiffResponse]
+    requirement_changed: list[ControlDiffResponse]
+
+
+class FrameworkOverlapResponse(BaseModel):
+    """
+    Schema for the framework overlap matrix.
+
+    Rows and columns of `shared_controls` and `jaccard` follow `frameworks`.
+    """
+
+    frameworks: list[FrameworkResponse]
+    control_counts: list[int]
+    shared_controls: list[list[int]]
+    jaccard: list[list[float]]
+
+
+class CrosswalkFramework(BaseModel):
+    """Schema for a framework requirement satisfied by a control."""
+
+    framework_id: UUID
+    code: str
+    version: str
+    framework_control_code: str
+
+
+class ControlCrosswalk(BaseModel):
+    """Schema for the frameworks a control satisfies."""
+
+    control_id: UUID
+    control_code: str
+    control_title: str
+    frameworks: list[CrosswalkFramework]
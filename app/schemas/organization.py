@@ -26,6 +26,12 @@ class OrganizationResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class OrganizationSearchResult(OrganizationResponse):
+    """Schema for an organization matching a fuzzy search."""
+
+    similarity: float
+
+
 class OrgFrameworkCreate(BaseModel):
     """Schema for adopting a framework."""
 
@@ -44,6 +50,57 @@ class OrgFrameworkResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BulkAdoptionCreate(BaseModel):
+    """Schema for adopting several frameworks at once."""
+
+    framework_ids: list[UUID] = Field(..., min_length=1, max_length=100)
+
+
+class AdoptionResult(OrgFrameworkResponse):
+    """An adopted framework and the number of controls created for it."""
+
+    control_count: int
+
+
+class SharedControl(BaseModel):
+    """A control mapped by more than one of the adopted frameworks."""
+
+    control_id: UUID
+    control_code: str
+    framework_ids: list[UUID]
+
+
+class BulkAdoptionResponse(BaseModel):
+    """Schema for a bulk adoption response."""
+
+    adopted: list[AdoptionResult]
+    shared_controls: list[SharedControl]
+
+
+class FrameworkMigrationCreate(BaseModel):
+    """Schema for migrating an adoption to another version of its framework."""
+
+    target_framework_id: UUID
+
+
+class MigratedControl(BaseModel):
+    """A control present in only one of the two framework versions."""
+
+    control_id: UUID
+    control_code: str
+    framework_control_code: str
+
+
+class FrameworkMigrationResponse(BaseModel):
+    """Schema for a framework version migration response."""
+
+    org_framework: OrgFrameworkResponse
+    carried_over: int
+    evidence_links: int
+    added: list[MigratedControl]
+    removed: list[MigratedControl]
+
+
 class OrgControlResponse(BaseModel):
     """Schema for OrgControl response."""
 
@@ -67,3 +124,21 @@ class OrgControlUpdate(BaseModel):
     status: ComplianceStatus | None = None
     due_date: date | None = None
     notes: str | None = None
+
+
+class OrgControlBatchItem(OrgControlUpdate):
+    """One control's changes within a batch update."""
+
+    control_id: UUID
+
+
+class OrgControlBatchUpdate(BaseModel):
+    """Schema for updating many OrgControls at once."""
+
+    updates: list[OrgControlBatchItem] = Field(..., min_length=1, max_length=1000)
+
+
+class OrgControlSearchResult(OrgControlResponse):
+    """Schema for an OrgControl whose notes match a fuzzy search."""
+
+    similarity: float
@@ -1,5 +1,9 @@
 """Readiness Pydantic schemas."""
 
+import enum
+from datetime import date
+from uuid import UUID
+
 from pydantic import BaseModel
 
 
@@ -25,3 +29,34 @@ class ReadinessResponse(BaseModel):
     not_applicable: int
     readiness_percentage: float
     gaps: list[ControlGap]
+
+
+class HistoryInterval(str, enum.Enum):
+    """Bucket size of a readiness history series."""
+
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class ReadinessPoint(BaseModel):
+    """Readiness at the end of one history bucket."""
+
+    period_start: date
+    snapshot_date: date
+    total_controls: int
+    completed: int
+    in_progress: int
+    not_started: int
+    not_applicable: int
+    readiness_percentage: float
+
+
+class ReadinessHistoryResponse(BaseModel):
+    """Schema for a readiness time series."""
+
+    framework_id: UUID
+    interval: HistoryInterval
+    start: date
+    end: date
+    points: list[ReadinessPoint]
@@ -0,0 +1,127 @@
+"""
+Benchmark framework adoption.
+
+Compares adopting a large synthetic framework the previous way (load every
+FrameworkControl, `db.add()` one OrgControl per row, flush) against the
+set-based `adopt_frameworks` (one INSERT ... SELECT for all OrgControls).
+
+Needs the database from the application settings. Everything is created in one
+transaction that is rolled back at the end:
+
+    python -m benchmarks.adoption --controls 5000 --rounds 5
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid_extensions import uuid7
+
+from app.database import async_session, engine
+from app.helpers.adoption import adopt_frameworks, check_adoptable
+from app.helpers.readiness import refresh_readiness_counters
+from app.models import Control, Framework, FrameworkControl, Organization, OrgControl, OrgFramework
+
+
+async def create_framework(db: AsyncSession, n_controls: int) -> Framework:
+    """A framework mapping `n_controls` new controls."""
+    framework = Framework(code=f"bench-{uuid7().hex[:8]}", version="1.0", name="Benchmark")
+    db.add(framework)
+    await db.flush()
+
+    control_ids = [uuid7() for _ in range(n_controls)]
+    await db.execute(
+        insert(Control),
+        [
+            {"id": control_id, "code": f"{framework.code}-{i:05d}", "title": f"Control {i}"}
+            for i, control_id in enumerate(control_ids)
+        ],
+    )
+    await db.execute(
+        insert(FrameworkControl),
+        [
+            {
+                "framework_id": framework.id,
+                "control_id": control_id,
+                "framework_control_code": f"REQ {i}",
+            }
+            for i, control_id in enumerate(control_ids)
+        ],
+    )
+    return framework
+
+
+async def create_organization(db: AsyncSession) -> Organization:
+    slug = f"bench-{uuid7().hex}"
+    org = Organization(name=slug, slug=slug)
+    db.add(org)
+    await db.flush()
+    return org
+
+
+async def adopt_per_row(db: AsyncSession, slug: str, framework: Framework) -> None:
+    """The previous adoption path: one ORM object per OrgControl."""
+    org = (await db.execute(select(Organization).where(Organization.slug == slug))).scalar_one()
+    await db.execute(select(Framework).where(Framework.id == framework.id))
+    await db.execute(
+        select(OrgFramework)
+        .where(OrgFramework.organization_id == org.id)
+        .where(OrgFramework.framework_id == framework.id)
+    )
+    org_framework = OrgFramework(organization_id=org.id, framework_id=framework.id)
+    db.add(org_framework)
+    await db.flush()
+
+    fc_result = await db.execute(
+        select(FrameworkControl).where(FrameworkControl.framework_id == framework.id)
+    )
+    for fc in fc_result.scalars().all():
+        db.add(OrgControl(org_framework_id=org_framework.id, framework_control_id=fc.id))
+    await db.flush()
+    await refresh_readiness_counters(db, [org_framework.id])
+
+
+async def adopt_set_based(db: AsyncSession, slug: str, framework: Framework) -> None:
+    organization_id = await check_adoptable(db, slug, [framework.id])
+    await adopt_frameworks(db, organization_id, [framework.id])
+
+
+async def measure(db: AsyncSession, adopt, framework: Framework, rounds: int) -> float:
+    """Median wall-clock seconds per adoption, each into a fresh organization."""
+    timings = []
+    for _ in range(rounds):
+        org = await create_organization(db)
+        db.expunge_all()
+        start = time.perf_counter()
+        await adopt(db, org.slug, framework)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+async def main(n_controls: int, rounds: int) -> None:
+    async with async_session() as db:
+        try:
+            framework = await create_framework(db, n_controls)
+            per_row = await measure(db, adopt_per_row, framework, rounds)
+            set_based = await measure(db, adopt_set_based, framework, rounds)
+        finally:
+            await db.rollback()
+    await engine.dispose()
+
+    print(f"controls per framework: {n_controls}, rounds: {rounds}")
+    print(f"per-row ORM inserts:     {per_row * 1000:8.1f} ms/adoption")
+    print(f"INSERT ... SELECT:       {set_based * 1000:8.1f} ms/adoption")
+    print(f"speedup:                 {per_row / set_based:8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--controls", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    asyncio.run(main(args.controls, args.rounds))
@@ -0,0 +1,122 @@
+"""
+Benchmark pre-rendered catalog responses.
+
+Compares the per-request CPU time of `GET /frameworks/{id}/controls` served
+from JSON bytes rendered once per catalog version against the previous
+approach of building `ControlInFramework` objects on every request and letting
+FastAPI validate and serialize them through `response_model`.
+
+Runs entirely in memory against a synthetic catalog:
+
+    python -m benchmarks.catalog_render --controls 2000 --requests 500
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from uuid import UUID
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from uuid_extensions import uuid7
+
+from app.api.controllers.frameworks import FrameworkController
+from app.database import get_db
+from app.helpers.catalog import (
+    CatalogControl,
+    CatalogFramework,
+    CatalogFrameworkControl,
+    CatalogSnapshot,
+    catalog_cache,
+)
+from app.main import app
+from app.models import ControlCategory, ControlType, FrameworkStatus
+from app.schemas import ControlInFramework
+
+
+def build_catalog(n_controls: int) -> CatalogSnapshot:
+    """A catalog with one framework mapping `n_controls` controls."""
+    framework = CatalogFramework(
+        id=uuid7(),
+        code="BENCH",
+        version="1.0",
+        name="Benchmark Framework",
+        description="Synthetic framework",
+        status=FrameworkStatus.ACTIVE,
+    )
+    controls = [
+        CatalogControl(
+            id=uuid7(),
+            code=f"BN-{i:05d}",
+            title=f"Benchmark control {i}",
+            description="Synthetic control used for benchmarking catalog rendering " * 2,
+            category=ControlCategory.ACCESS_CONTROL,
+            control_type=ControlType.TECHNICAL,
+        )
+        for i in range(n_controls)
+    ]
+    framework_controls = [
+        CatalogFrameworkControl(
+            id=uuid7(),
+            framework_id=framework.id,
+            control_id=c.id,
+            framework_control_code=f"REQ {i}",
+            is_required=True,
+        )
+        for i, c in enumerate(controls)
+    ]
+    return CatalogSnapshot.build([framework], controls, framework_controls)
+
+
+def build_baseline_app() -> FastAPI:
+    """The pre-rendering route: per-request objects plus `response_model`."""
+    baseline = FastAPI()
+
+    @baseline.get("/frameworks/{framework_id}/controls", response_model=list[ControlInFramework])
+    async def list_framework_controls(framework_id: UUID) -> list[ControlInFramework]:
+        return FrameworkController._framework_controls(catalog_cache.snapshot, framework_id)
+
+    return baseline
+
+
+async def measure(target: FastAPI, url: str, requests: int) -> float:
+    """CPU seconds per request, after one warm-up request."""
+    async with AsyncClient(transport=ASGITransport(app=target), base_url="http://bench") as client:
+        assert (await client.get(url)).status_code == 200
+        start = time.process_time()
+        for _ in range(requests):
+            await client.get(url)
+        return (time.process_time() - start) / requests
+
+
+async def main(n_controls: int, requests: int) -> None:
+    catalog = build_catalog(n_controls)
+    catalog_cache._snapshot = catalog
+    framework_id = catalog.frameworks[0].id
+    url = f"/frameworks/{framework_id}/controls"
+
+    async def no_db():
+        yield None
+
+    app.dependency_overrides[get_db] = no_db
+    try:
+        baseline = await measure(build_baseline_app(), url, requests)
+        prerendered = await measure(app, url, requests)
+    finally:
+        app.dependency_overrides.clear()
+        catalog_cache.clear()
+
+    print(f"controls per response: {n_controls}, requests: {requests}")
+    print(f"per-request objects + response_model: {baseline * 1000:8.3f} ms CPU/request")
+    print(f"pre-rendered JSON bytes:              {prerendered * 1000:8.3f} ms CPU/request")
+    print(f"speedup:                              {baseline / prerendered:8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--controls", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    asyncio.run(main(args.controls, args.requests))
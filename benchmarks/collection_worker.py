@@ -0,0 +1,85 @@
+"""
+Benchmark the evidence collection worker.
+
+Queues `--jobs` jobs for a throwaway organization and drains them with the
+fake collectors at several pool sizes, reporting jobs and evidence rows per
+second. `--latency` simulates the collectors' API round trip and
+`--failure-rate` the share of attempts that fail and are retried.
+
+Needs the database from the application settings. The organization, and with
+it every job and evidence row, is deleted at the end:
+
+    python -m benchmarks.collection_worker --jobs 2000 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from sqlalchemy import delete
+from uuid_extensions import uuid7
+
+from app.collectors import fake_collectors
+from app.database import async_session, engine
+from app.helpers.collection_jobs import CollectionJobRequest, enqueue_collection_jobs
+from app.helpers.collection_worker import EvidenceCollectorWorker
+from app.models import EvidenceSource, Organization
+
+SOURCES = (EvidenceSource.AWS, EvidenceSource.GITHUB, EvidenceSource.OKTA)
+
+
+async def measure(organization_id, args, concurrency: int) -> None:
+    async with async_session() as db:
+        await enqueue_collection_jobs(
+            db,
+            [
+                CollectionJobRequest(organization_id, SOURCES[i % len(SOURCES)], max_attempts=10)
+                for i in range(args.jobs)
+            ],
+        )
+        await db.commit()
+
+    collectors = fake_collectors(
+        evidence_per_job=args.evidence, latency=args.latency, failure_rate=args.failure_rate
+    )
+    worker = EvidenceCollectorWorker(
+        async_session, collectors, concurrency=concurrency, batch_size=args.batch_size, retry_base=0
+    )
+    start = time.perf_counter()
+    stats = await worker.drain()
+    elapsed = time.perf_counter() - start
+    print(
+        f"concurrency {concurrency:3d}: {stats.succeeded / elapsed:8.1f} jobs/s, "
+        f"{stats.evidence / elapsed:9.1f} evidence/s, {stats.retried} retries"
+    )
+
+
+async def main(args) -> None:
+    async with async_session() as db:
+        slug = f"bench-{uuid7().hex}"
+        org = Organization(name=slug, slug=slug)
+        db.add(org)
+        await db.commit()
+    try:
+        print(f"jobs: {args.jobs}, batch size: {args.batch_size}, latency: {args.latency}s")
+        for concurrency in args.concurrency:
+            await measure(org.id, args, concurrency)
+    finally:
+        async with async_session() as db:
+            await db.execute(delete(Organization).where(Organization.id == org.id))
+            await db.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--evidence", type=int, default=3, help="evidence rows per job")
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    asyncio.run(main(args))
@@ -1,9 +1,16 @@
-from rich.progress import track
+from collections import Counter
+
+from rich.progress import Progress, track
+from sqlalchemy import func, select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.database import SyncSession
-from app.models.models import Control, Framework, FrameworkControl
+from app.helpers.adoption import missing_org_controls_insert
+from app.helpers.catalog import notify_catalog_changed
+from app.helpers.readiness import readiness_counters_shift
+from app.models import ComplianceStatus
+from app.models.models import Control, Framework, FrameworkControl, OrgFramework
 from migrations.seed.control import controls
 from migrations.seed.framework import frameworks
 from migrations.seed.frameworkcontrol import framework_controls
@@ -24,6 +31,7 @@ def upsert_frameworks(session: Session):
             },
         )
         session.execute(stmt)
+    notify_catalog_changed(session, "framework")
     session.commit()
     print(f"Upserted {len(frameworks)} frameworks")
 
@@ -43,6 +51,7 @@ def upsert_controls(session: Session):
             },
         )
         session.execute(stmt)
+    notify_catalog_changed(session, "control")
     session.commit()
     print(f"Upserted {len(controls)} controls")
 
@@ -61,13 +70,63 @@ def upsert_framework_controls(session: Session):
             },
         )
         session.execute(stmt)
+    notify_catalog_changed(session, "frameworkcontrol")
     session.commit()
     print(f"Upserted {len(framework_controls)} framework controls")
 
 
+# OrgFrameworks per backfill transaction
+BACKFILL_BATCH_SIZE = 500
+
+
+def backfill_org_controls(session: Session, batch_size: int = BACKFILL_BATCH_SIZE):
+    """
+    Create OrgControls for FrameworkControls added after a framework was adopted.
+
+    Walks all adoptions in id order, `batch_size` at a time, committing after
+    each batch so no transaction grows with the number of organizations.
+    """
+    total = session.scalar(select(func.count()).select_from(OrgFramework))
+    created = Counter()
+    last_id = None
+    with Progress() as progress:
+        task = progress.add_task("Backfilling org controls...", total=total)
+        while True:
+            stmt = select(OrgFramework.id).order_by(OrgFramework.id).limit(batch_size)
+            if last_id is not None:
+                stmt = stmt.where(OrgFramework.id > last_id)
+            batch = session.scalars(stmt).all()
+            if not batch:
+                break
+
+            inserted = session.scalars(missing_org_controls_insert(batch)).all()
+            if inserted:
+                created.update(inserted)
+                # Every new control starts as not started; shifting the counters,
+                # rather than recounting, keeps concurrent status changes
+                session.execute(
+                    readiness_counters_shift(
+                        {
+                            org_framework_id: {ComplianceStatus.NOT_STARTED: count}
+                            for org_framework_id, count in Counter(inserted).items()
+                        }
+                    )
+                )
+            session.commit()
+
+            last_id = batch[-1]
+            progress.update(
+                task,
+                advance=len(batch),
+                description=f"Backfilling org controls ({created.total()} created)...",
+            )
+    print(f"Backfilled {created.total()} org controls across {len(created)} adopted frameworks")
+
+
 if __name__ == "__main__":
     with SyncSession() as session:
         upsert_frameworks(session)
         upsert_controls(session)
         upsert_framework_controls(session)
+        backfill_org_controls(session)
         print("Seed data upsert complete!")
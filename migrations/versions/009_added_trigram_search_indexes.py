@@ -0,0 +1,56 @@
+"""Added trigram search indexes
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17 16:40:05.871203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, column), all in the data schema
+TRIGRAM_INDEXES = [
+    ("ix_organization_name_trgm", "organization", "name"),
+    ("ix_organization_slug_trgm", "organization", "slug"),
+    ("ix_evidence_title_trgm", "evidence", "title"),
+    ("ix_evidence_description_trgm", "evidence", "description"),
+    ("ix_orgcontrol_notes_trgm", "orgcontrol", "notes"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Evidence and org controls are large; build without blocking writes
+    with op.get_context().autocommit_block():
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=False,
+                schema="data",
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(TRIGRAM_INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                schema="data",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
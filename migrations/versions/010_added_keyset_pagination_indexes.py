@@ -0,0 +1,51 @@
+"""Added keyset pagination indexes
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17 18:02:51.406117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns), all in the data schema
+KEYSET_INDEXES = [
+    ("ix_orgframework_organization_id_id", "orgframework", ["organization_id", "id"]),
+    ("ix_orgcontrol_org_framework_id_id", "orgcontrol", ["org_framework_id", "id"]),
+    ("ix_evidence_organization_id_id", "evidence", ["organization_id", "id"]),
+]
+
+
+def upgrade() -> None:
+    # Evidence and org controls are large; build without blocking writes
+    with op.get_context().autocommit_block():
+        for name, table, columns in KEYSET_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                schema="data",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(KEYSET_INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                schema="data",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -9,7 +9,8 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.database import Base, get_db
+from app.database import Base, get_db, get_session_factory
+from app.helpers.catalog import catalog_cache
 from app.main import app
 from app.models import (
     Control,
@@ -47,6 +48,8 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         await conn.execute(text("CREATE SCHEMA IF NOT EXISTS lookup"))
         await conn.execute(text("CREATE SCHEMA IF NOT EXISTS data"))
         await conn.execute(text("CREATE SCHEMA IF NOT EXISTS audit"))
+        # Trigram indexes for fuzzy search
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
 
@@ -65,11 +68,14 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
+    catalog_cache.clear()
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
 
     app.dependency_overrides.clear()
+    catalog_cache.clear()
 
 
 @pytest_asyncio.fixture
@@ -157,8 +163,11 @@ async def seeded_client(seeded_db: AsyncSession) -> AsyncGenerator[AsyncClient,
         yield seeded_db
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
+    catalog_cache.clear()
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
 
     app.dependency_overrides.clear()
+    catalog_cache.clear()
@@ -0,0 +1,138 @@
+"""Tests for the catalog snapshot."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers import catalog as catalog_module
+from app.helpers.catalog import (
+    CATALOG_CHANNEL,
+    CatalogListener,
+    CatalogSnapshot,
+    catalog_cache,
+    load_catalog,
+)
+from app.models import Framework, FrameworkStatus
+
+
+@pytest.mark.asyncio
+async def test_load_catalog_indexes(seeded_db: AsyncSession):
+    """Test the snapshot is indexed by id, code and (code, version)."""
+    catalog = await load_catalog(seeded_db)
+
+    assert [f.code for f in catalog.frameworks] == ["pci_dss", "soc2"]
+    soc2 = catalog.framework_by_code_version[("soc2", "2024")]
+    assert catalog.framework_by_id[soc2.id] is soc2
+    assert catalog.frameworks_by_code["soc2"] == (soc2,)
+    assert catalog.control_by_code["mfa_required"].title == "Multi-Factor Authentication"
+    assert [fc.framework_control_code for fc in catalog.controls_for_framework(soc2.id)] == [
+        "CC6.1",
+        "CC6.7",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_catalog_version_is_content_hash(seeded_db: AsyncSession):
+    """Test the version stamp only changes when the catalog content changes."""
+    first = await load_catalog(seeded_db)
+    second = await load_catalog(seeded_db)
+    assert first.version == second.version
+
+    seeded_db.add(Framework(code="iso27001", version="2022", name="ISO 27001"))
+    await seeded_db.commit()
+
+    third = await load_catalog(seeded_db)
+    assert third.version != first.version
+
+
+@pytest.mark.asyncio
+async def test_catalog_served_from_snapshot(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test catalog endpoints keep serving the snapshot until it is reloaded."""
+    response = await seeded_client.get("/catalog")
+    assert response.status_code == 200
+    version = response.json()["version"]
+    assert response.json()["frameworks"] == 2
+
+    seeded_db.add(
+        Framework(code="iso27001", version="2022", name="ISO 27001", status=FrameworkStatus.ACTIVE)
+    )
+    await seeded_db.commit()
+
+    response = await seeded_client.get("/frameworks")
+    assert len(response.json()) == 2
+
+    response = await seeded_client.post("/catalog/reload")
+    assert response.status_code == 200
+    assert response.json()["version"] != version
+    assert catalog_cache.snapshot.version == response.json()["version"]
+
+    response = await seeded_client.get("/frameworks", params={"code": "iso27001"})
+    assert [f["version"] for f in response.json()] == ["2022"]
+
+
+class _RecordingCache:
+    def __init__(self):
+        self.reloads = 0
+
+    async def reload(self, db):
+        self.reloads += 1
+
+
+class _NullSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_catalog_listener_coalesces_notifications():
+    """Test a burst of notifications triggers a single reload."""
+    cache = _RecordingCache()
+    listener = CatalogListener(cache, _NullSession, dsn="", debounce=0.01)
+
+    for table in ("framework", "control", "frameworkcontrol"):
+        listener._on_notify(None, 0, CATALOG_CHANNEL, table)
+    await listener._reload_task
+
+    assert cache.reloads == 1
+
+
+def test_snapshot_memoizes_per_version():
+    """Test values derived from a snapshot are computed once per snapshot."""
+    calls = []
+
+    def render():
+        calls.append(1)
+        return b"[]"
+
+    catalog = CatalogSnapshot.build([], [], [])
+    assert catalog.memoize(("list_frameworks", None, None), render) == b"[]"
+    assert catalog.memoize(("list_frameworks", None, None), render) == b"[]"
+    assert len(calls) == 1
+
+    reloaded = CatalogSnapshot.build([], [], [])
+    reloaded.memoize(("list_frameworks", None, None), render)
+    assert len(calls) == 2
+
+
+def test_snapshot_memo_evicts_least_recently_used(monkeypatch):
+    """Test a full memo keeps caching, evicting the value used longest ago."""
+    monkeypatch.setattr(catalog_module, "MEMO_MAX_ENTRIES", 2)
+    calls = []
+
+    def render(key):
+        return lambda: calls.append(key) or key
+
+    catalog = CatalogSnapshot.build([], [], [])
+    catalog.memoize("overlap_index", render("overlap_index"))
+    catalog.memoize(("list_frameworks", "a"), render("a"))
+    catalog.memoize("overlap_index", render("overlap_index"))
+    catalog.memoize(("list_frameworks", "b"), render("b"))
+
+    catalog.memoize("overlap_index", render("overlap_index"))
+    catalog.memoize(("list_frameworks", "b"), render("b"))
+    assert calls == ["overlap_index", "a", "b"]
+    catalog.memoize(("list_frameworks", "a"), render("a"))
+    assert calls == ["overlap_index", "a", "b", "a"]
@@ -0,0 +1,254 @@
+"""Tests for the evidence collection job queue and worker."""
+
+from datetime import timedelta
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.collectors import Collector, FakeCollector, fake_collectors
+from app.helpers.collection_jobs import (
+    ClaimedJob,
+    CollectedEvidence,
+    CollectionJobRequest,
+    claim_collection_jobs,
+    complete_collection_jobs,
+    enqueue_collection_jobs,
+    requeue_stale_collection_jobs,
+    retry_collection_jobs,
+)
+from app.helpers.collection_worker import EvidenceCollectorWorker
+from app.helpers.org_controls import evidence_count_drift_query
+from app.models import (
+    CollectionJob,
+    CollectionJobStatus,
+    Evidence,
+    EvidenceSource,
+    Framework,
+    Organization,
+)
+from tests.conftest import TestingSessionLocal
+
+
+async def _organization_id(db: AsyncSession):
+    result = await db.execute(select(Organization.id).where(Organization.slug == "test-company"))
+    return result.scalar_one()
+
+
+async def _enqueue(db: AsyncSession, *requests: CollectionJobRequest):
+    ids = await enqueue_collection_jobs(db, list(requests))
+    await db.commit()
+    return ids
+
+
+async def _job(db: AsyncSession, job_id) -> CollectionJob:
+    db.expire_all()
+    return await db.get(CollectionJob, job_id)
+
+
+class _StaticCollector(Collector):
+    """Returns the same evidence for every job, after running `before_return`."""
+
+    def __init__(self, source: EvidenceSource, items: list[CollectedEvidence], before_return=None):
+        self.source = source
+        self.items = items
+        self.before_return = before_return
+
+    async def collect(self, job: ClaimedJob) -> list[CollectedEvidence]:
+        if self.before_return is not None:
+            await self.before_return()
+        return self.items
+
+
+async def _expire_locks():
+    """Play a reaper that finds every running job's lock expired."""
+    async with TestingSessionLocal() as db:
+        await db.execute(update(CollectionJob).values(locked_at=func.now() - timedelta(hours=1)))
+        await requeue_stale_collection_jobs(db, lock_timeout=300)
+        await db.commit()
+
+
+def _worker(collectors, **options) -> EvidenceCollectorWorker:
+    return EvidenceCollectorWorker(TestingSessionLocal, collectors, **options)
+
+
+@pytest.mark.asyncio
+async def test_worker_collects_and_links(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test jobs are dispatched by source and their evidence written and linked."""
+    soc2_id = (
+        await seeded_db.execute(select(Framework.id).where(Framework.code == "soc2"))
+    ).scalar_one()
+    await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    url = f"/organizations/test-company/frameworks/{soc2_id}/controls"
+    control_id = UUID((await seeded_client.get(url)).json()[0]["id"])
+    await seeded_db.commit()
+
+    organization_id = await _organization_id(seeded_db)
+    aws_job, github_job = await _enqueue(
+        seeded_db,
+        CollectionJobRequest(
+            organization_id, EvidenceSource.AWS, control_id, {"region": "eu-west-1"}
+        ),
+        CollectionJobRequest(organization_id, EvidenceSource.GITHUB),
+    )
+
+    stats = await _worker(fake_collectors(evidence_per_job=2), concurrency=2).drain()
+    assert (stats.succeeded, stats.retried, stats.failed, stats.evidence) == (2, 0, 0, 4)
+
+    for job_id in (aws_job, github_job):
+        assert (await _job(seeded_db, job_id)).status == CollectionJobStatus.SUCCEEDED
+    sources = await seeded_db.scalars(select(Evidence.source).order_by(Evidence.source))
+    assert sources.all() == [EvidenceSource.AWS] * 2 + [EvidenceSource.GITHUB] * 2
+    controls = {c["id"]: c for c in (await seeded_client.get(url)).json()}
+    assert controls[str(control_id)]["evidence_count"] == 2
+    assert (await seeded_db.execute(evidence_count_drift_query())).all() == []
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_with_backoff(seeded_db: AsyncSession):
+    """Test failed attempts are retried until they succeed or run out."""
+    organization_id = await _organization_id(seeded_db)
+    recovers, exhausted, unsupported = await _enqueue(
+        seeded_db,
+        CollectionJobRequest(organization_id, EvidenceSource.AWS),
+        CollectionJobRequest(organization_id, EvidenceSource.GITHUB, max_attempts=2),
+        CollectionJobRequest(organization_id, EvidenceSource.OKTA, max_attempts=1),
+    )
+    collectors = {
+        EvidenceSource.AWS: FakeCollector(EvidenceSource.AWS, fail_attempts=2),
+        EvidenceSource.GITHUB: FakeCollector(EvidenceSource.GITHUB, fail_attempts=5),
+    }
+
+    stats = await _worker(collectors, retry_base=0).drain()
+    assert (stats.succeeded, stats.retried, stats.failed) == (1, 3, 2)
+
+    job = await _job(seeded_db, recovers)
+    assert (job.status, job.attempts, job.last_error) == (CollectionJobStatus.SUCCEEDED, 3, None)
+    job = await _job(seeded_db, exhausted)
+    assert (job.status, job.attempts) == (CollectionJobStatus.FAILED, 2)
+    assert "github API unavailable" in job.last_error
+    job = await _job(seeded_db, unsupported)
+    assert job.status == CollectionJobStatus.FAILED
+    assert job.last_error == "No collector for source okta"
+
+
+@pytest.mark.asyncio
+async def test_worker_backoff_delays_retry(seeded_db: AsyncSession):
+    """Test a failed job is not due again until its backoff has passed."""
+    organization_id = await _organization_id(seeded_db)
+    (job_id,) = await _enqueue(seeded_db, CollectionJobRequest(organization_id, EvidenceSource.AWS))
+    collectors = {EvidenceSource.AWS: FakeCollector(EvidenceSource.AWS, fail_attempts=1)}
+
+    stats = await _worker(collectors, retry_base=60).drain()
+    assert (stats.succeeded, stats.retried) == (0, 1)
+
+    job = await _job(seeded_db, job_id)
+    assert (job.status, job.attempts) == (CollectionJobStatus.QUEUED, 1)
+    delay = await seeded_db.scalar(select(CollectionJob.run_at - func.now()))
+    assert timedelta(seconds=50) < delay <= timedelta(seconds=60)
+
+
+@pytest.mark.asyncio
+async def test_requeue_stale_jobs(seeded_db: AsyncSession):
+    """Test jobs locked by a dead worker go back to the queue."""
+    organization_id = await _organization_id(seeded_db)
+    (job_id,) = await _enqueue(seeded_db, CollectionJobRequest(organization_id, EvidenceSource.AWS))
+
+    assert [job.id for job in await claim_collection_jobs(seeded_db, 10)] == [job_id]
+    assert await claim_collection_jobs(seeded_db, 10) == []
+    await seeded_db.execute(
+        update(CollectionJob).values(locked_at=func.now() - timedelta(minutes=10))
+    )
+
+    assert await requeue_stale_collection_jobs(seeded_db, lock_timeout=300) == 1
+    job = await _job(seeded_db, job_id)
+    assert (job.status, job.attempts, job.locked_at) == (CollectionJobStatus.QUEUED, 1, None)
+
+
+@pytest.mark.asyncio
+async def test_worker_fails_invalid_evidence_alone(seeded_db: AsyncSession):
+    """Test evidence that does not fit its columns fails its job, not the batch."""
+    organization_id = await _organization_id(seeded_db)
+    poisoned, healthy = await _enqueue(
+        seeded_db,
+        CollectionJobRequest(organization_id, EvidenceSource.AWS, max_attempts=1),
+        CollectionJobRequest(organization_id, EvidenceSource.GITHUB),
+    )
+    collectors = {
+        EvidenceSource.AWS: _StaticCollector(
+            EvidenceSource.AWS, [CollectedEvidence(title="ok"), CollectedEvidence(title="x" * 201)]
+        ),
+        EvidenceSource.GITHUB: FakeCollector(EvidenceSource.GITHUB, evidence_per_job=2),
+    }
+
+    stats = await _worker(collectors).drain()
+    assert (stats.succeeded, stats.failed, stats.evidence) == (1, 1, 2)
+
+    job = await _job(seeded_db, poisoned)
+    assert job.status == CollectionJobStatus.FAILED
+    assert job.last_error == "Evidence 2 title is longer than 200 characters"
+    assert (await _job(seeded_db, healthy)).status == CollectionJobStatus.SUCCEEDED
+    sources = await seeded_db.scalars(select(Evidence.source))
+    assert sources.all() == [EvidenceSource.GITHUB] * 2
+
+
+@pytest.mark.asyncio
+async def test_worker_times_out_slow_collectors(seeded_db: AsyncSession):
+    """Test a collector running past the collect timeout fails its attempt."""
+    organization_id = await _organization_id(seeded_db)
+    (job_id,) = await _enqueue(seeded_db, CollectionJobRequest(organization_id, EvidenceSource.AWS))
+    collectors = {EvidenceSource.AWS: FakeCollector(EvidenceSource.AWS, latency=5)}
+
+    with pytest.raises(ValueError):
+        _worker(collectors, lock_timeout=10, collect_timeout=10)
+    worker = _worker(collectors, lock_timeout=10, collect_timeout=0.05, retry_base=60)
+    assert await worker.run_once() == 1
+
+    job = await _job(seeded_db, job_id)
+    assert (job.status, job.attempts) == (CollectionJobStatus.QUEUED, 1)
+    assert job.last_error == "Collector timed out after 0.05s"
+
+
+@pytest.mark.asyncio
+async def test_worker_drops_results_of_lost_claims(seeded_db: AsyncSession):
+    """Test a batch saved after the reaper took its job back writes nothing."""
+    organization_id = await _organization_id(seeded_db)
+    (job_id,) = await _enqueue(seeded_db, CollectionJobRequest(organization_id, EvidenceSource.AWS))
+    collector = _StaticCollector(
+        EvidenceSource.AWS, [CollectedEvidence(title="Late")], before_return=_expire_locks
+    )
+
+    worker = _worker({EvidenceSource.AWS: collector})
+    assert await worker.run_once() == 1
+    assert (worker.stats.succeeded, worker.stats.evidence) == (0, 0)
+
+    job = await _job(seeded_db, job_id)
+    assert (job.status, job.attempts) == (CollectionJobStatus.QUEUED, 1)
+    assert job.last_error == "Worker lock timed out"
+    assert await seeded_db.scalar(select(func.count()).select_from(Evidence)) == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_claims_do_not_update_reclaimed_jobs(seeded_db: AsyncSession):
+    """Test outcomes for an earlier attempt leave the job's current attempt alone."""
+    organization_id = await _organization_id(seeded_db)
+    (job_id,) = await _enqueue(seeded_db, CollectionJobRequest(organization_id, EvidenceSource.AWS))
+    (stale,) = await claim_collection_jobs(seeded_db, 10)
+    await seeded_db.commit()
+    await _expire_locks()
+    (current,) = await claim_collection_jobs(seeded_db, 10)
+    assert (stale.attempts, current.attempts) == (1, 2)
+
+    assert await complete_collection_jobs(seeded_db, [stale]) == 0
+    assert await retry_collection_jobs(seeded_db, [(stale, "late")], 0, 0) == {}
+    job = await _job(seeded_db, job_id)
+    assert (job.status, job.attempts, job.last_error) == (
+        CollectionJobStatus.RUNNING,
+        2,
+        "Worker lock timed out",
+    )
+    assert await complete_collection_jobs(seeded_db, [current]) == 1
@@ -0,0 +1,100 @@
+"""Tests for control endpoints."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Framework
+
+
+@pytest.mark.asyncio
+async def test_search_controls(seeded_client: AsyncClient):
+    """Test full-text search of the control library."""
+    response = await seeded_client.get("/controls/search", params={"q": "encrypted"})
+    assert response.status_code == 200
+    assert [c["code"] for c in response.json()] == ["encrypt_at_rest"]
+    assert "x-next-cursor" not in response.headers
+
+    # Prefix matching
+    response = await seeded_client.get("/controls/search", params={"q": "auth"})
+    assert [c["code"] for c in response.json()] == ["mfa_required"]
+
+    response = await seeded_client.get("/controls/search", params={"q": "auth", "prefix": "false"})
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_search_controls_paginates(seeded_client: AsyncClient):
+    """Test search results are keyset-paginated by rank."""
+    response = await seeded_client.get("/controls/search", params={"q": "r", "limit": 2})
+    assert response.status_code == 200
+    first = response.json()
+    assert len(first) == 2
+    assert first[0]["rank"] >= first[1]["rank"]
+
+    response = await seeded_client.get(
+        "/controls/search",
+        params={"q": "r", "limit": 2, "cursor": response.headers["x-next-cursor"]},
+    )
+    second = response.json()
+    assert "x-next-cursor" not in response.headers
+    assert sorted(c["code"] for c in first + second) == [
+        "access_review",
+        "encrypt_at_rest",
+        "mfa_required",
+    ]
+
+    response = await seeded_client.get("/controls/search", params={"q": "r", "cursor": "nope"})
+    assert response.status_code == 400
+
+    response = await seeded_client.get("/controls/search", params={"q": "__"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_controls_in_framework(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test searching the controls of one framework."""
+    pci_dss = await seeded_db.scalar(select(Framework.id).where(Framework.code == "pci_dss"))
+
+    response = await seeded_client.get(
+        "/controls/search", params={"q": "encryption", "framework_id": str(pci_dss)}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [(c["code"], c["framework_control_code"]) for c in data] == [
+        ("encrypt_at_rest", "Req 3.5.1")
+    ]
+
+    response = await seeded_client.get(
+        "/controls/search", params={"q": "review", "framework_id": str(pci_dss)}
+    )
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_list_controls_paginates(seeded_client: AsyncClient):
+    """Test the control library is listed in keyset pages."""
+    response = await seeded_client.get("/controls", params={"limit": 2})
+    assert response.status_code == 200
+    assert [c["code"] for c in response.json()] == ["access_review", "encrypt_at_rest"]
+    cursor = response.headers["x-next-cursor"]
+
+    response = await seeded_client.get("/controls", params={"limit": 2, "cursor": cursor})
+    assert [c["code"] for c in response.json()] == ["mfa_required"]
+    assert "x-next-cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_list_controls_filters(seeded_client: AsyncClient):
+    """Test enum filters select controls and reject unknown values."""
+    params = {"category": "access_control", "limit": 1}
+    response = await seeded_client.get("/controls", params=params)
+    assert [c["code"] for c in response.json()] == ["access_review"]
+
+    params["cursor"] = response.headers["x-next-cursor"]
+    response = await seeded_client.get("/controls", params=params)
+    assert [c["code"] for c in response.json()] == ["mfa_required"]
+
+    response = await seeded_client.get("/controls", params={"category": "nope"})
+    assert response.status_code == 422
@@ -110,3 +110,126 @@ async def test_list_framework_controls(client: AsyncClient, db_session: AsyncSes
     assert len(data) == 1
     assert data[0]["code"] == "encrypt_at_rest"
     assert data[0]["framework_control_code"] == "CC6.7"
+
+
+@pytest.mark.asyncio
+async def test_list_frameworks_not_modified(seeded_client: AsyncClient):
+    """Test revalidating the framework list with its ETag returns 304."""
+    response = await seeded_client.get("/frameworks")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+
+    response = await seeded_client.get("/frameworks", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = await seeded_client.get("/frameworks", params={"code": "soc2"})
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_list_frameworks_filters(seeded_client: AsyncClient):
+    """Test framework filters, with unknown statuses rejected and unknown codes empty."""
+    response = await seeded_client.get("/frameworks", params={"status": "active"})
+    assert sorted(f["code"] for f in response.json()) == ["pci_dss", "soc2"]
+    response = await seeded_client.get("/frameworks", params={"status": "retired"})
+    assert response.status_code == 422
+    response = await seeded_client.get("/frameworks", params={"code": "unknown"})
+    assert (response.status_code, response.json()) == (200, [])
+
+
+@pytest.mark.asyncio
+async def test_diff_framework_versions(client: AsyncClient, db_session: AsyncSession):
+    """Test diffing two versions of a framework."""
+    old = Framework(code="pci_dss", version="v4.0", name="PCI DSS")
+    new = Framework(code="pci_dss", version="v4.1", name="PCI DSS")
+    other = Framework(code="soc2", version="2024", name="SOC 2 Type II")
+    controls = [
+        Control(
+            code=code,
+            title=code,
+            category=ControlCategory.ACCESS_CONTROL,
+            control_type=ControlType.TECHNICAL,
+        )
+        for code in ("kept", "remapped", "optional", "removed", "added")
+    ]
+    db_session.add_all([old, new, other, *controls])
+    await db_session.flush()
+    kept, remapped, optional, removed, added = controls
+    db_session.add_all(
+        [
+            FrameworkControl(framework_id=old.id, control_id=kept.id, framework_control_code="1.1"),
+            FrameworkControl(
+                framework_id=old.id, control_id=remapped.id, framework_control_code="1.2"
+            ),
+            FrameworkControl(
+                framework_id=old.id, control_id=optional.id, framework_control_code="1.3"
+            ),
+            FrameworkControl(
+                framework_id=old.id, control_id=removed.id, framework_control_code="1.4"
+            ),
+            FrameworkControl(framework_id=new.id, control_id=kept.id, framework_control_code="1.1"),
+            FrameworkControl(
+                framework_id=new.id, control_id=remapped.id, framework_control_code="2.1"
+            ),
+            FrameworkControl(
+                framework_id=new.id,
+                control_id=optional.id,
+                framework_control_code="1.3",
+                is_required=False,
+            ),
+            FrameworkControl(
+                framework_id=new.id, control_id=added.id, framework_control_code="3.1"
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    response = await client.get(f"/frameworks/{old.id}/diff/{new.id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["from_framework"]["version"] == "v4.0"
+    assert data["to_framework"]["version"] == "v4.1"
+    assert [c["control_code"] for c in data["added"]] == ["added"]
+    assert [c["control_code"] for c in data["removed"]] == ["removed"]
+    assert [
+        (c["from_framework_control_code"], c["to_framework_control_code"]) for c in data["remapped"]
+    ] == [("1.2", "2.1")]
+    assert [
+        (c["control_code"], c["from_is_required"], c["to_is_required"])
+        for c in data["requirement_changed"]
+    ] == [("optional", True, False)]
+
+    response = await client.get(
+        f"/frameworks/{old.id}/diff/{new.id}", headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
+
+    response = await client.get(f"/frameworks/{old.id}/diff/{other.id}")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_framework_overlap_and_crosswalk(seeded_client: AsyncClient):
+    """Test the framework overlap matrix and the control crosswalk."""
+    response = await seeded_client.get("/frameworks/overlap")
+    assert response.status_code == 200
+    data = response.json()
+    assert [f["code"] for f in data["frameworks"]] == ["pci_dss", "soc2"]
+    assert data["control_counts"] == [1, 2]
+    assert data["shared_controls"] == [[1, 1], [1, 2]]
+    assert data["jaccard"] == [[1.0, 0.5], [0.5, 1.0]]
+
+    response = await seeded_client.get("/frameworks/crosswalk")
+    assert response.status_code == 200
+    crosswalk = {
+        c["control_code"]: [(f["code"], f["framework_control_code"]) for f in c["frameworks"]]
+        for c in response.json()
+    }
+    assert crosswalk == {
+        "access_review": [],
+        "encrypt_at_rest": [("pci_dss", "Req 3.5.1"), ("soc2", "CC6.7")],
+        "mfa_required": [("soc2", "CC6.1")],
+    }
@@ -0,0 +1,53 @@
+"""Tests for HTTP caching helpers."""
+
+from datetime import datetime, timezone
+
+from app.helpers.http import (
+    ConditionalRequest,
+    RenderedJSON,
+    ResourceState,
+    conditional_json_response,
+)
+
+
+def test_etag_matches():
+    """Test If-None-Match uses weak comparison and accepts lists and '*'."""
+    etag = RenderedJSON.from_body(b"[]").etag
+
+    assert not ConditionalRequest().etag_matches(etag)
+    assert ConditionalRequest(if_none_match=etag).etag_matches(etag)
+    assert ConditionalRequest(if_none_match=f'"other", W/{etag}').etag_matches(etag)
+    assert ConditionalRequest(if_none_match="*").etag_matches(etag)
+    assert not ConditionalRequest(if_none_match='"other"').etag_matches(etag)
+
+
+def test_conditional_json_response():
+    """Test a matching ETag yields a bodiless 304 with the same headers."""
+    rendered = RenderedJSON.from_body(b'{"a": 1}')
+
+    response = conditional_json_response(rendered, ConditionalRequest(), {"X-Test": "1"})
+    assert response.status_code == 200
+    assert response.body == b'{"a": 1}'
+    assert response.headers["etag"] == rendered.etag
+
+    response = conditional_json_response(
+        rendered, ConditionalRequest(if_none_match=rendered.etag), {"X-Test": "1"}
+    )
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["x-test"] == "1"
+
+
+def test_is_fresh_if_modified_since():
+    """Test Last-Modified revalidation at second granularity."""
+    modified = datetime(2026, 2, 1, 12, 0, 0, 500000, tzinfo=timezone.utc)
+    state = ResourceState.fingerprint(modified, 3)
+
+    assert ConditionalRequest(if_modified_since="Sun, 01 Feb 2026 12:00:00 GMT").is_fresh(state)
+    assert not ConditionalRequest(if_modified_since="Sun, 01 Feb 2026 11:59:59 GMT").is_fresh(state)
+    assert not ConditionalRequest(if_modified_since="not a date").is_fresh(state)
+    # If-None-Match takes precedence over If-Modified-Since
+    assert not ConditionalRequest(
+        if_none_match='"stale"', if_modified_since="Sun, 01 Feb 2026 12:00:00 GMT"
+    ).is_fresh(state)
+    assert state.headers["Last-Modified"] == "Sun, 01 Feb 2026 12:00:00 GMT"
@@ -0,0 +1,775 @@
+"""Tests for organization endpoints."""
+
+import asyncio
+import gzip
+import json
+from datetime import date
+from uuid import UUID, uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers.adoption import missing_org_controls_insert
+from app.helpers.catalog import catalog_cache, get_catalog
+from app.helpers.org_controls import batch_update_org_controls, evidence_count_drift_query
+from app.helpers.readiness import readiness_counter_drift_query, readiness_counters_shift
+from app.helpers.readiness_history import snapshot_readiness
+from app.models import (
+    ComplianceStatus,
+    Control,
+    Framework,
+    FrameworkControl,
+    Organization,
+    OrgControl,
+    OrgControlEvent,
+    ReadinessCounter,
+)
+from app.schemas.organization import OrgControlBatchItem
+from tests.conftest import TestingSessionLocal
+
+
+async def _framework_id(db: AsyncSession, code: str):
+    result = await db.execute(select(Framework.id).where(Framework.code == code))
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_list_evidence_conditional_get(seeded_client: AsyncClient):
+    """Test evidence listing answers revalidation with 304 until evidence changes."""
+    response = await seeded_client.get("/organizations/test-company/evidence")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "last-modified" in response.headers
+
+    response = await seeded_client.get(
+        "/organizations/test-company/evidence", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    await seeded_client.post("/organizations/test-company/evidence", json={"title": "Policy"})
+
+    response = await seeded_client.get(
+        "/organizations/test-company/evidence", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_readiness_conditional_get(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test readiness is only recomputed after a control status changes."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    # Requests share the test session; commit so updates get a later updated_at,
+    # as they would in their own transactions.
+    await seeded_db.commit()
+    url = f"/organizations/test-company/frameworks/{soc2_id}/readiness"
+
+    response = await seeded_client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await seeded_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    controls = await seeded_client.get(f"/organizations/test-company/frameworks/{soc2_id}/controls")
+    control_id = controls.json()[0]["id"]
+    await seeded_client.patch(
+        f"/organizations/test-company/controls/{control_id}", json={"status": "complete"}
+    )
+
+    response = await seeded_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_unknown_org(seeded_client: AsyncClient):
+    """Test unknown organizations still return 404."""
+    response = await seeded_client.get(
+        "/organizations/nope/frameworks", headers={"If-None-Match": "*"}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_readiness_counts_and_gaps(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test readiness statistics and the gap list."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    controls = await seeded_client.get(f"/organizations/test-company/frameworks/{soc2_id}/controls")
+    by_code = {c["control_code"]: c["id"] for c in controls.json()}
+    await seeded_client.patch(
+        f"/organizations/test-company/controls/{by_code['mfa_required']}",
+        json={"status": "complete"},
+    )
+
+    response = await seeded_client.get(
+        f"/organizations/test-company/frameworks/{soc2_id}/readiness"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["framework_code"] == "soc2"
+    assert data["total_controls"] == 2
+    assert data["completed"] == 1
+    assert data["not_started"] == 1
+    assert data["readiness_percentage"] == 50.0
+    assert [gap["code"] for gap in data["gaps"]] == ["encrypt_at_rest"]
+    assert data["gaps"][0]["status"] == "not_started"
+
+
+@pytest.mark.asyncio
+async def test_readiness_counter_maintained(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test counters follow adoption and status changes without drift."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    response = await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    org_framework_id = UUID(response.json()["id"])
+
+    counter = await seeded_db.get(ReadinessCounter, org_framework_id)
+    assert (counter.not_started, counter.completed) == (2, 0)
+
+    controls = await seeded_client.get(f"/organizations/test-company/frameworks/{soc2_id}/controls")
+    for status in ("in_progress", "complete"):
+        await seeded_client.patch(
+            f"/organizations/test-company/controls/{controls.json()[0]['id']}",
+            json={"status": status},
+        )
+
+    await seeded_db.refresh(counter)
+    assert (counter.not_started, counter.in_progress, counter.completed) == (1, 0, 1)
+    assert (await seeded_db.execute(readiness_counter_drift_query())).all() == []
+
+
+@pytest.mark.asyncio
+async def test_readiness_history(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test snapshots are bucketed by week, keeping the last one of each week."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    controls = await seeded_client.get(f"/organizations/test-company/frameworks/{soc2_id}/controls")
+
+    # Monday and Wednesday of one week, then the following Monday
+    await snapshot_readiness(seeded_db, date(2026, 3, 2))
+    await seeded_client.patch(
+        f"/organizations/test-company/controls/{controls.json()[0]['id']}",
+        json={"status": "complete"},
+    )
+    await snapshot_readiness(seeded_db, date(2026, 3, 4))
+    await snapshot_readiness(seeded_db, date(2026, 3, 9))
+
+    url = f"/organizations/test-company/frameworks/{soc2_id}/readiness/history"
+    response = await seeded_client.get(
+        url, params={"start": "2026-03-01", "end": "2026-03-31", "interval": "week"}
+    )
+    assert response.status_code == 200
+    points = response.json()["points"]
+    assert [(p["period_start"], p["snapshot_date"]) for p in points] == [
+        ("2026-03-02", "2026-03-04"),
+        ("2026-03-09", "2026-03-09"),
+    ]
+    assert points[0]["completed"] == 1
+    assert points[0]["readiness_percentage"] == 50.0
+
+    daily = await seeded_client.get(url, params={"start": "2026-03-01", "end": "2026-03-31"})
+    assert len(daily.json()["points"]) == 3
+
+    invalid = await seeded_client.get(url, params={"start": "2026-03-31", "end": "2026-03-01"})
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_readiness_as_of(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test readiness is rebuilt from the event log for a past moment."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    before_adoption = await seeded_db.scalar(select(func.now()))
+    await seeded_db.commit()
+    await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    await seeded_db.commit()
+    before_update = await seeded_db.scalar(select(func.now()))
+    await seeded_db.commit()
+
+    controls = await seeded_client.get(f"/organizations/test-company/frameworks/{soc2_id}/controls")
+    for status in ("in_progress", "complete"):
+        await seeded_client.patch(
+            f"/organizations/test-company/controls/{controls.json()[0]['id']}",
+            json={"status": status},
+        )
+
+    url = f"/organizations/test-company/frameworks/{soc2_id}/readiness"
+    current = (await seeded_client.get(url)).json()
+    assert (current["completed"], current["not_started"]) == (1, 1)
+
+    past = (await seeded_client.get(url, params={"as_of": before_update.isoformat()})).json()
+    assert (past["completed"], past["not_started"], past["total_controls"]) == (0, 2, 2)
+    assert len(past["gaps"]) == 2
+
+    now = (await seeded_client.get(url, params={"as_of": "2999-01-01T00:00:00Z"})).json()
+    assert now == current
+
+    empty = (await seeded_client.get(url, params={"as_of": before_adoption.isoformat()})).json()
+    assert empty["total_controls"] == 0
+
+
+@pytest.mark.asyncio
+async def test_adopt_framework(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test adoption creates one OrgControl, counter and event per framework control."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    url = "/organizations/test-company/frameworks"
+
+    response = await seeded_client.post(url, json={"framework_id": str(soc2_id)})
+    assert response.status_code == 201
+    data = response.json()
+    assert data["framework_id"] == str(soc2_id)
+    assert data["status"] == "not_started"
+    org_framework_id = UUID(data["id"])
+
+    statuses = await seeded_db.scalars(
+        select(OrgControl.status).where(OrgControl.org_framework_id == org_framework_id)
+    )
+    assert [status.value for status in statuses] == ["not_started", "not_started"]
+    events = await seeded_db.scalar(
+        select(func.count())
+        .select_from(OrgControlEvent)
+        .where(OrgControlEvent.org_framework_id == org_framework_id)
+    )
+    assert events == 2
+    counter = await seeded_db.get(ReadinessCounter, org_framework_id)
+    assert counter.not_started == 2
+
+    response = await seeded_client.post(url, json={"framework_id": str(soc2_id)})
+    assert response.status_code == 400
+
+    response = await seeded_client.post(url, json={"framework_id": str(uuid4())})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Framework not found"
+
+    response = await seeded_client.post(
+        "/organizations/unknown/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Organization not found"
+
+
+@pytest.mark.asyncio
+async def test_adopt_frameworks_bulk(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test bulk adoption reports per-framework counts and shared controls."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    pci_id = await _framework_id(seeded_db, "pci_dss")
+    url = "/organizations/test-company/frameworks/bulk"
+
+    response = await seeded_client.post(url, json={"framework_ids": [str(soc2_id), str(pci_id)]})
+    assert response.status_code == 201
+    data = response.json()
+    assert [(a["framework_id"], a["control_count"]) for a in data["adopted"]] == [
+        (str(soc2_id), 2),
+        (str(pci_id), 1),
+    ]
+    assert data["shared_controls"] == [
+        {
+            "control_id": data["shared_controls"][0]["control_id"],
+            "control_code": "encrypt_at_rest",
+            "framework_ids": [str(soc2_id), str(pci_id)],
+        }
+    ]
+
+    frameworks = await seeded_client.get("/organizations/test-company/frameworks")
+    assert len(frameworks.json()) == 2
+
+    response = await seeded_client.post(url, json={"framework_ids": [str(pci_id), str(uuid4())]})
+    assert response.status_code == 404
+    response = await seeded_client.post(url, json={"framework_ids": [str(soc2_id), str(pci_id)]})
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Frameworks already adopted")
+    response = await seeded_client.post(url, json={"framework_ids": []})
+    assert response.status_code == 422
+    response = await seeded_client.post(
+        url, json={"framework_ids": [str(uuid4()) for _ in range(101)]}
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_batch_update_org_controls(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test many controls are updated together, keeping counters and events in step."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    response = await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    org_framework_id = UUID(response.json()["id"])
+    controls = await seeded_client.get(f"/organizations/test-company/frameworks/{soc2_id}/controls")
+    first, second = (c["id"] for c in controls.json())
+
+    response = await seeded_client.patch(
+        "/organizations/test-company/controls",
+        json={
+            "updates": [
+                {"control_id": first, "status": "complete"},
+                {"control_id": second, "due_date": "2026-12-31", "notes": "Owned by IT"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [c["id"] for c in data] == [first, second]
+    assert data[0]["status"] == "complete"
+    assert (data[1]["status"], data[1]["due_date"], data[1]["notes"]) == (
+        "not_started",
+        "2026-12-31",
+        "Owned by IT",
+    )
+    assert data[0]["control_code"] in ("encrypt_at_rest", "mfa_required")
+
+    counter = await seeded_db.get(ReadinessCounter, org_framework_id)
+    await seeded_db.refresh(counter)
+    assert (counter.completed, counter.not_started) == (1, 1)
+    # Two adoption events plus one status change
+    events = await seeded_db.scalar(select(func.count()).select_from(OrgControlEvent))
+    assert events == 3
+
+    # One unknown control fails the whole batch
+    response = await seeded_client.patch(
+        "/organizations/test-company/controls",
+        json={
+            "updates": [{"control_id": second, "status": "complete"}, {"control_id": str(uuid4())}]
+        },
+    )
+    assert response.status_code == 404
+    controls = await seeded_client.get(f"/organizations/test-company/frameworks/{soc2_id}/controls")
+    assert {c["id"]: c["status"] for c in controls.json()}[second] == "not_started"
+
+    response = await seeded_client.patch(
+        "/organizations/test-company/controls",
+        json={"updates": [{"control_id": first}, {"control_id": first}]},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_update_org_control_propagates(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test propagation updates every adopted framework mapping the same control."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    pci_id = await _framework_id(seeded_db, "pci_dss")
+    await seeded_client.post(
+        "/organizations/test-company/frameworks/bulk",
+        json={"framework_ids": [str(soc2_id), str(pci_id)]},
+    )
+
+    async def statuses(framework_id):
+        response = await seeded_client.get(
+            f"/organizations/test-company/frameworks/{framework_id}/controls"
+        )
+        return {c["control_code"]: (c["id"], c["status"]) for c in response.json()}
+
+    soc2 = await statuses(soc2_id)
+    encrypt_id = soc2["encrypt_at_rest"][0]
+
+    response = await seeded_client.patch(
+        f"/organizations/test-company/controls/{encrypt_id}",
+        params={"propagate": "true"},
+        json={"status": "complete"},
+    )
+    assert response.status_code == 200
+    assert response.json()["id"] == encrypt_id
+
+    assert (await statuses(pci_id))["encrypt_at_rest"][1] == "complete"
+    soc2 = await statuses(soc2_id)
+    assert soc2["encrypt_at_rest"][1] == "complete"
+    assert soc2["mfa_required"][1] == "not_started"
+    assert (await seeded_db.execute(readiness_counter_drift_query())).all() == []
+
+    # Batch propagation returns the propagated rows after the requested ones
+    response = await seeded_client.patch(
+        "/organizations/test-company/controls",
+        params={"propagate": "true"},
+        json={"updates": [{"control_id": encrypt_id, "status": "in_progress"}]},
+    )
+    assert response.status_code == 200
+    assert [c["status"] for c in response.json()] == ["in_progress", "in_progress"]
+    assert response.json()[0]["id"] == encrypt_id
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batch_updates_keep_readiness_counter(
+    seeded_client: AsyncClient, seeded_db: AsyncSession
+):
+    """Test interleaved batch updates of one framework both reach its readiness counter."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    response = await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    org_framework_id = UUID(response.json()["id"])
+    url = f"/organizations/test-company/frameworks/{soc2_id}/controls"
+    first_id, second_id = [UUID(c["id"]) for c in (await seeded_client.get(url)).json()[:2]]
+    organization_id = await seeded_db.scalar(
+        select(Organization.id).where(Organization.slug == "test-company")
+    )
+    await seeded_db.commit()
+
+    async def complete(db: AsyncSession, control_id: UUID):
+        catalog = await get_catalog(db)
+        item = OrgControlBatchItem(control_id=control_id, status=ComplianceStatus.COMPLETE)
+        await batch_update_org_controls(db, catalog, organization_id, [item])
+
+    async with TestingSessionLocal() as first, TestingSessionLocal() as second:
+        await complete(first, first_id)
+        # The second update waits on the first's counter row lock until it commits
+        pending = asyncio.create_task(complete(second, second_id))
+        await asyncio.sleep(0.2)
+        assert not pending.done()
+        await first.commit()
+        await pending
+        await second.commit()
+
+    seeded_db.expire_all()
+    counter = await seeded_db.get(ReadinessCounter, org_framework_id)
+    assert counter.completed == 2
+    assert (await seeded_db.execute(readiness_counter_drift_query())).all() == []
+
+
+@pytest.mark.asyncio
+async def test_backfill_missing_org_controls(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test controls added to an adopted framework are backfilled exactly once."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    response = await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    org_framework_id = UUID(response.json()["id"])
+
+    access_review_id = await seeded_db.scalar(
+        select(Control.id).where(Control.code == "access_review")
+    )
+    seeded_db.add(
+        FrameworkControl(
+            framework_id=soc2_id, control_id=access_review_id, framework_control_code="CC6.2"
+        )
+    )
+    await seeded_db.flush()
+
+    inserted = (await seeded_db.scalars(missing_org_controls_insert([org_framework_id]))).all()
+    assert inserted == [org_framework_id]
+    await seeded_db.execute(
+        readiness_counters_shift({org_framework_id: {ComplianceStatus.NOT_STARTED: 1}})
+    )
+
+    assert (await seeded_db.scalars(missing_org_controls_insert([org_framework_id]))).all() == []
+    assert (await seeded_db.execute(readiness_counter_drift_query())).all() == []
+    counter = await seeded_db.get(ReadinessCounter, org_framework_id)
+    await seeded_db.refresh(counter)
+    assert counter.not_started == 3
+
+
+@pytest.mark.asyncio
+async def test_migrate_framework_version(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test a version upgrade carries over state for controls in both versions."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    controls = {c.code: c.id for c in await seeded_db.scalars(select(Control))}
+    soc2_next = Framework(code="soc2", version="2025", name="SOC 2 Type II")
+    seeded_db.add(soc2_next)
+    await seeded_db.flush()
+    seeded_db.add_all(
+        [
+            FrameworkControl(
+                framework_id=soc2_next.id,
+                control_id=controls["encrypt_at_rest"],
+                framework_control_code="CC6.7",
+            ),
+            FrameworkControl(
+                framework_id=soc2_next.id,
+                control_id=controls["access_review"],
+                framework_control_code="CC6.2",
+            ),
+        ]
+    )
+    await seeded_db.flush()
+
+    await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    response = await seeded_client.get(f"/organizations/test-company/frameworks/{soc2_id}/controls")
+    encrypt_id = next(c["id"] for c in response.json() if c["control_code"] == "encrypt_at_rest")
+    await seeded_client.patch(
+        f"/organizations/test-company/controls/{encrypt_id}",
+        json={"status": "complete", "notes": "KMS everywhere"},
+    )
+    evidence = await seeded_client.post(
+        "/organizations/test-company/evidence", json={"title": "KMS config"}
+    )
+    await seeded_client.post(
+        f"/organizations/test-company/controls/{encrypt_id}/evidence",
+        json={"evidence_id": evidence.json()["id"]},
+    )
+
+    url = f"/organizations/test-company/frameworks/{soc2_id}/migrate"
+    response = await seeded_client.post(url, json={"target_framework_id": str(soc2_next.id)})
+    assert response.status_code == 201
+    data = response.json()
+    assert data["org_framework"]["framework_id"] == str(soc2_next.id)
+    assert (data["carried_over"], data["evidence_links"]) == (1, 1)
+    assert [c["control_code"] for c in data["added"]] == ["access_review"]
+    assert [c["control_code"] for c in data["removed"]] == ["mfa_required"]
+
+    response = await seeded_client.get(
+        f"/organizations/test-company/frameworks/{soc2_next.id}/controls"
+    )
+    migrated = {c["control_code"]: c for c in response.json()}
+    assert migrated["encrypt_at_rest"]["status"] == "complete"
+    assert migrated["encrypt_at_rest"]["notes"] == "KMS everywhere"
+    assert migrated["encrypt_at_rest"]["evidence_count"] == 1
+    assert migrated["access_review"]["status"] == "not_started"
+    assert (await seeded_db.execute(readiness_counter_drift_query())).all() == []
+    assert (await seeded_db.execute(evidence_count_drift_query())).all() == []
+
+    response = await seeded_client.post(url, json={"target_framework_id": str(soc2_next.id)})
+    assert response.status_code == 400
+    pci_id = await _framework_id(seeded_db, "pci_dss")
+    response = await seeded_client.post(url, json={"target_framework_id": str(pci_id)})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_migrate_framework_version_counts_copied_controls(
+    seeded_client: AsyncClient, seeded_db: AsyncSession
+):
+    """Test only controls copied from a source OrgControl count as carried over."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    controls = {c.code: c.id for c in await seeded_db.scalars(select(Control))}
+    soc2_next = Framework(code="soc2", version="2025", name="SOC 2 Type II")
+    seeded_db.add(soc2_next)
+    await seeded_db.flush()
+    seeded_db.add_all(
+        [
+            FrameworkControl(
+                framework_id=soc2_next.id,
+                control_id=controls[code],
+                framework_control_code=code,
+            )
+            for code in ("encrypt_at_rest", "access_review")
+        ]
+    )
+    await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+
+    # Added to the source after adoption and not backfilled yet
+    seeded_db.add(
+        FrameworkControl(
+            framework_id=soc2_id,
+            control_id=controls["access_review"],
+            framework_control_code="CC6.2",
+        )
+    )
+    await seeded_db.flush()
+    catalog_cache.clear()
+
+    url = f"/organizations/test-company/frameworks/{soc2_id}/migrate"
+    response = await seeded_client.post(url, json={"target_framework_id": str(soc2_next.id)})
+    assert response.status_code == 201
+    data = response.json()
+    assert (data["carried_over"], data["added"]) == (1, [])
+
+
+@pytest.mark.asyncio
+async def test_evidence_count_maintained(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test linking evidence bumps the stored evidence count of the control."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    url = f"/organizations/test-company/frameworks/{soc2_id}/controls"
+    control_id = (await seeded_client.get(url)).json()[0]["id"]
+    for title in ("KMS config", "Key rotation log"):
+        evidence = await seeded_client.post(
+            "/organizations/test-company/evidence", json={"title": title}
+        )
+        response = await seeded_client.post(
+            f"/organizations/test-company/controls/{control_id}/evidence",
+            json={"evidence_id": evidence.json()["id"]},
+        )
+        assert response.status_code == 201
+
+    controls = {c["id"]: c for c in (await seeded_client.get(url)).json()}
+    assert controls[control_id]["evidence_count"] == 2
+    assert (await seeded_db.execute(evidence_count_drift_query())).all() == []
+
+
+@pytest.mark.asyncio
+async def test_link_evidence_bulk(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test bulk linking reports new and existing links and checks ownership."""
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    url = f"/organizations/test-company/frameworks/{soc2_id}/controls"
+    first, second = [c["id"] for c in (await seeded_client.get(url)).json()]
+    evidence = await seeded_client.post(
+        "/organizations/test-company/evidence", json={"title": "Access review export"}
+    )
+    evidence_id = evidence.json()["id"]
+    await seeded_client.post(
+        f"/organizations/test-company/controls/{first}/evidence",
+        json={"evidence_id": evidence_id},
+    )
+
+    links = [
+        {"evidence_id": evidence_id, "control_id": first},
+        {"evidence_id": evidence_id, "control_id": second},
+    ]
+    response = await seeded_client.post(
+        "/organizations/test-company/evidence/links", json={"links": links}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"linked": [links[1]], "already_linked": [links[0]]}
+
+    unknown = {"evidence_id": evidence_id, "control_id": str(uuid4())}
+    response = await seeded_client.post(
+        "/organizations/test-company/evidence/links", json={"links": [*links, unknown]}
+    )
+    assert response.status_code == 404
+
+    response = await seeded_client.post(
+        f"/organizations/test-company/controls/{second}/evidence",
+        json={"evidence_id": evidence_id},
+    )
+    assert response.status_code == 400
+    controls = (await seeded_client.get(url)).json()
+    assert [c["evidence_count"] for c in controls] == [1, 1]
+    assert (await seeded_db.execute(evidence_count_drift_query())).all() == []
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_search(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test typo-tolerant search of organizations, evidence and control notes."""
+    await seeded_client.post(
+        "/organizations", json={"name": "Acme Payments", "slug": "acme-payments"}
+    )
+    response = await seeded_client.get("/organizations/search", params={"q": "paymnts"})
+    assert response.status_code == 200
+    data = response.json()
+    assert [org["slug"] for org in data] == ["acme-payments"]
+    assert 0 < data[0]["similarity"] <= 1
+
+    await seeded_client.post(
+        "/organizations/test-company/evidence", json={"title": "Penetration test report"}
+    )
+    await seeded_client.post("/organizations/test-company/evidence", json={"title": "KMS config"})
+    response = await seeded_client.get(
+        "/organizations/test-company/evidence/search", params={"q": "penetraton"}
+    )
+    assert response.status_code == 200
+    assert [e["title"] for e in response.json()] == ["Penetration test report"]
+    response = await seeded_client.get(
+        "/organizations/acme-payments/evidence/search", params={"q": "penetraton"}
+    )
+    assert response.json() == []
+
+    soc2_id = await _framework_id(seeded_db, "soc2")
+    await seeded_client.post(
+        "/organizations/test-company/frameworks", json={"framework_id": str(soc2_id)}
+    )
+    controls = (
+        await seeded_client.get(f"/organizations/test-company/frameworks/{soc2_id}/controls")
+    ).json()
+    await seeded_client.patch(
+        f"/organizations/test-company/controls/{controls[0]['id']}",
+        json={"notes": "Quarterly firewall review"},
+    )
+    response = await seeded_client.get(
+        "/organizations/test-company/controls/search", params={"q": "firewal"}
+    )
+    assert response.status_code == 200
+    assert [c["id"] for c in response.json()] == [controls[0]["id"]]
+
+
+@pytest.mark.asyncio
+async def test_list_evidence_paginates(seeded_client: AsyncClient):
+    """Test evidence is listed newest first in keyset pages."""
+    url = "/organizations/test-company/evidence"
+    for title in ("First", "Second", "Third"):
+        await seeded_client.post(url, json={"title": title})
+
+    response = await seeded_client.get(url, params={"limit": 2})
+    assert response.status_code == 200
+    assert [e["title"] for e in response.json()] == ["Third", "Second"]
+    cursor = response.headers["x-next-cursor"]
+    first_etag = response.headers["etag"]
+
+    response = await seeded_client.get(
+        url, params={"limit": 2, "cursor": cursor}, headers={"If-None-Match": first_etag}
+    )
+    assert response.status_code == 200
+    assert [e["title"] for e in response.json()] == ["First"]
+    assert "x-next-cursor" not in response.headers
+
+    response = await seeded_client.get(url, params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_evidence_streams(seeded_client: AsyncClient, seeded_db: AsyncSession):
+    """Test evidence can be streamed as a JSON array or as NDJSON."""
+    url = "/organizations/test-company/evidence"
+    for title in ("First", "Second", "Third"):
+        await seeded_client.post(url, json={"title": title})
+    # Streams read through their own session, which sees committed rows only
+    await seeded_db.commit()
+
+    response = await seeded_client.get(url, params={"stream": "true", "limit": 1})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert [e["title"] for e in response.json()] == ["Third", "Second", "First"]
+    assert "etag" in response.headers
+
+    response = await seeded_client.get(url, headers={"Accept": "application/x-ndjson"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert [json.loads(line)["title"] for line in lines] == ["Third", "Second", "First"]
+
+    response = await seeded_client.get("/organizations/unknown/evidence", params={"stream": "true"})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_ingest_evidence(seeded_client: AsyncClient):
+    """Test NDJSON ingest loads valid lines and reports the others."""
+    lines = [
+        json.dumps({"title": "S3 encryption", "source": "aws", "evidence_type": "configuration"}),
+        "",
+        json.dumps({"title": "Branch protection", "collected_at": "2026-01-05T10:00:00+02:00"}),
+        "not json",
+        json.dumps({"title": "Okta export", "source": "fax"}),
+    ]
+    body = "\n".join(lines).encode()
+    url = "/organizations/test-company/evidence/ingest"
+
+    response = await seeded_client.post(url, content=body)
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["received"], report["inserted"], report["failed"]) == (4, 2, 2)
+    assert [error["line"] for error in report["errors"]] == [4, 5]
+    assert report["errors"][1]["error"].startswith("source:")
+
+    response = await seeded_client.post(
+        url, content=gzip.compress(body), headers={"Content-Encoding": "gzip"}
+    )
+    assert response.json()["inserted"] == 2
+
+    response = await seeded_client.get("/organizations/test-company/evidence")
+    evidence = {e["title"]: e for e in response.json()}
+    assert len(response.json()) == 4
+    assert evidence["S3 encryption"]["source"] == "aws"
+    assert evidence["Branch protection"]["collected_at"] == "2026-01-05T08:00:00"
+
+    response = await seeded_client.post(url, content=body, headers={"Content-Encoding": "br"})
+    assert response.status_code == 415